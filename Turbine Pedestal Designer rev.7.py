@@ -8,6 +8,7 @@ import numpy as np # pyright: ignore[reportMissingImports]
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg # pyright: ignore[reportMissingModuleSource]
 import matplotlib.pyplot as plt # type: ignore
 from matplotlib.figure import Figure # pyright: ignore[reportMissingModuleSource]
+from mpl_toolkits.mplot3d.art3d import Line3DCollection # pyright: ignore[reportMissingModuleSource]
 from reportlab.lib.pagesizes import letter, A4 # pyright: ignore[reportMissingModuleSource]
 from reportlab.pdfgen import canvas as pdf_canvas # pyright: ignore[reportMissingModuleSource]
 from reportlab.lib import colors # pyright: ignore[reportMissingModuleSource]
@@ -15,14 +16,25 @@ import json
 import os
 import copy
 from scipy.sparse import csr_matrix # pyright: ignore[reportMissingImports]
-from scipy.sparse.linalg import spsolve # pyright: ignore[reportMissingImports]
+from scipy.sparse.linalg import splu, spilu, cg, eigsh, LinearOperator # pyright: ignore[reportMissingImports]
+from scipy.sparse.csgraph import reverse_cuthill_mckee, connected_components # pyright: ignore[reportMissingImports]
 import scipy.sparse # pyright: ignore[reportMissingImports]
 import math
-from itertools import combinations
-from scipy.spatial import Delaunay, ConvexHull # pyright: ignore[reportMissingImports]
+from itertools import combinations, product
+from scipy.spatial import Delaunay, ConvexHull, cKDTree # pyright: ignore[reportMissingImports]
 import traceback
 import re
-from collections import defaultdict
+import argparse
+import contextlib
+import multiprocessing
+import threading
+import time
+import tracemalloc
+import platform
+import queue
+from collections import OrderedDict, defaultdict
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
 
 # Try to import optional packages
 try:
@@ -38,6 +50,12 @@ try:
 except ImportError:
     DXF_AVAILABLE = False
 
+try:
+    import pyamg # pyright: ignore[reportMissingImports]
+    PYAMG_AVAILABLE = True
+except ImportError:
+    PYAMG_AVAILABLE = False
+
 try:
     from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph # pyright: ignore[reportMissingModuleSource]
     from reportlab.lib.styles import getSampleStyleSheet # pyright: ignore[reportMissingModuleSource]
@@ -56,6 +74,12 @@ REBAR_SIZES = {
     '3': 0.11, '4': 0.20, '5': 0.31, '6': 0.44, '7': 0.60, '8': 0.79,
     '9': 1.00, '10': 1.27, '11': 1.56, '14': 2.25, '18': 4.00
 }
+NODE_MERGE_TOLERANCE = 0.01  # ft; mesh nodes closer than this are one node
+# Above this, solver='auto' switches from sparse LU to PCG. With COLAMD the LU factor of
+# pedestal meshes holds about 250 nonzeros (3 kB) per DOF: ~150 MB and ~1 s at the limit.
+DIRECT_SOLVER_DOF_LIMIT = 60000
+# Least recently used element matrices beyond this many are dropped (a 24x24 shell matrix is 4.6 kB)
+ELEMENT_STIFFNESS_CACHE_SIZE = 10000
 
 # Seismic parameters for Zone C (IBC 2021)
 SEISMIC_PARAMS = {
@@ -117,6 +141,85 @@ ACI_LOAD_COMBINATIONS = {
     'DS2': {'formula': '0.9*DL + 1.0*E - 0.2*TURBINE_THRUST', 'description': 'Seismic with minimum dead and reverse thrust'},
 }
 
+# Load factors of the hard-coded combinations (COMBO/SEISMIC series)
+LOAD_COMBINATION_FACTORS = {
+    "COMBO1": {"DL": 1.4},
+    "COMBO2": {"DL": 1.2, "LL": 1.6},
+    "COMBO3": {"DL": 1.2, "LL": 1.6, "Lr": 0.5},
+    "COMBO4": {"DL": 1.2, "LL": 1.0, "W": 1.0},
+    "COMBO5": {"DL": 1.2, "LL": 1.0, "SEISMIC_X": 1.0, "SEISMIC_Y": 1.0},
+    "COMBO6": {"DL": 0.9, "W": 1.0},
+    "COMBO7": {"DL": 0.9, "SEISMIC_X": 1.0, "SEISMIC_Y": 1.0},
+    "COMBO8": {"DL": 1.2, "LL": 1.0, "W": 1.6},
+    "COMBO9": {"DL": 1.2, "LL": 1.0, "SEISMIC_X": 1.0, "SEISMIC_Y": 1.0, "S": 1.0},
+    "COMBO10": {"DL": 1.2, "SEISMIC_X": 1.0, "SEISMIC_Y": 1.0, "LL": 0.5},
+    "SEISMIC1": {"DL": 1.2, "LL": 1.0, "SEISMIC_X": 1.0, "SEISMIC_Y": 0.3},
+    "SEISMIC2": {"DL": 1.2, "LL": 1.0, "SEISMIC_X": 0.3, "SEISMIC_Y": 1.0},
+    "SEISMIC3": {"DL": 0.9, "SEISMIC_X": 1.0, "SEISMIC_Y": 0.3},
+    "SEISMIC4": {"DL": 0.9, "SEISMIC_X": 0.3, "SEISMIC_Y": 1.0},
+    "SEISMIC5": {"DL": 1.2, "LL": 1.0, "SEISMIC_X": -1.0, "SEISMIC_Y": -0.3},
+    "SEISMIC6": {"DL": 1.2, "LL": 1.0, "SEISMIC_X": -0.3, "SEISMIC_Y": -1.0},
+}
+
+# Formula symbols that stand for one of several orthogonal load cases; a combination
+# using one is analyzed once per direction and sign (see expand_directional_combinations)
+LOAD_CASE_ALIASES = {
+    'E': ('SEISMIC_X', 'SEISMIC_Y'),
+    'W': ('WINDX', 'WINDY'),
+}
+
+# Frame element end forces: local force vector at node 1 (0-5) and node 2 (6-11)
+FRAME_END_FORCE_KEYS = [
+    'axial_force', 'shear_y', 'shear_z', 'torsion', 'moment_y', 'moment_z',
+    'axial_force_end', 'shear_y_end', 'shear_z_end', 'torsion_end', 'moment_y_end', 'moment_z_end'
+]
+
+FRAME_FORCE_DTYPE = np.dtype([
+    ('element', np.int64),
+    ('type', 'U6'),
+    ('node1', np.int64),
+    ('node2', np.int64),
+    ('length', np.float64),               # ft, like the mesh coordinates
+    ('width', np.float64),
+    ('depth', np.float64),
+    ('end_forces', np.float64, (12,)),    # lb and lb-in in global axes
+])
+
+# Shell quad centroid results in local element axes, per inch of section.
+# Like the frame end forces and displacements they are in lb and in.
+SHELL_FORCE_DTYPE = np.dtype([
+    ('element', np.int64),
+    ('nodes', np.int64, (4,)),
+    ('displacement', np.float64, (3,)),   # average nodal translation (in)
+    ('rotation', np.float64, (3,)),       # average nodal rotation (rad)
+    ('membrane', np.float64, (3,)),       # Nx, Ny, Nxy (lb/in)
+    ('bending', np.float64, (3,)),        # Mx, My, Mxy (lb-in/in)
+])
+
+# Compact mesh tables: every row keeps its position ('index') in the element sequence
+FRAME_ELEMENT_TYPES = ('PILE', 'COLUMN', 'BEAM', 'LINK')
+
+FRAME_ELEMENT_DTYPE = np.dtype([
+    ('index', np.int32),
+    ('type', np.int8),       # position in FRAME_ELEMENT_TYPES
+    ('name', np.int32),      # position in PedestalMesh.names
+    ('n1', np.int32),
+    ('n2', np.int32),
+    ('A', np.float64),       # in²
+    ('Ix', np.float64),      # in⁴
+    ('Iy', np.float64),
+    ('Iz', np.float64),
+    ('width', np.float64),   # in; pile diameter for PILE rows
+    ('depth', np.float64),
+])
+
+SHELL_ELEMENT_DTYPE = np.dtype([
+    ('index', np.int32),
+    ('level', np.int16),     # position in PedestalMesh.levels
+    ('nodes', np.int32, (4,)),
+    ('thickness', np.float64),
+])
+
 # Special load cases with coordinates
 SPECIAL_LOAD_CASES = {
     'SEISMIC_X': {
@@ -170,6 +273,90 @@ SPECIAL_LOAD_CASES = {
     }
 }
 
+# --- LOAD COMBINATION FORMULAS ---
+def parse_combination_formula(formula, available_cases):
+    """Convert a formula such as '1.2*DL + 1.6*(Lr or S or R)' into load factors
+    
+    Directional symbols of LOAD_CASE_ALIASES (W, E) stay unexpanded unless a
+    load case has that name. Terms whose load cases are not defined are dropped
+    with a warning; a term that is not a load symbol raises ValueError.
+    """
+    factors = {}
+    undefined = []
+    
+    # Split into signed top-level terms, keeping parenthesised groups intact
+    terms = []
+    depth = 0
+    current = ''
+    for char in formula:
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        if char in '+-' and depth == 0 and current.strip():
+            terms.append(current)
+            current = ''
+        current += char
+    if current.strip():
+        terms.append(current)
+    
+    for term in terms:
+        term = term.strip()
+        sign = -1.0 if term.startswith('-') else 1.0
+        term = term.lstrip('+-').strip()
+        
+        # Optional leading factor: 1.6*(Lr or S or R) or 1.2*DL
+        match = re.match(r'^(\d+(?:\.\d*)?|\.\d+)\s*\*\s*(.+)$', term)
+        factor = sign * float(match.group(1)) if match else sign
+        body = match.group(2).strip() if match else term
+        
+        # Envelope alternatives use the first one that has been defined
+        if body.startswith('(') and body.endswith(')'):
+            options = re.split(r'\s+or\s+', body[1:-1].strip())
+        else:
+            # Drop trailing remarks such as '(with element removal)'
+            options = [re.sub(r'\s*\(.*\)$', '', body)]
+        
+        for option in options:
+            inner = re.match(r'^(?:(\d+(?:\.\d*)?|\.\d+)\s*\*\s*)?([A-Za-z_][A-Za-z0-9_]*)$', option.strip())
+            if not inner:
+                raise ValueError(f"Cannot parse load combination term '{option.strip()}' in '{formula}'")
+            inner_factor = float(inner.group(1)) if inner.group(1) else 1.0
+            symbol = inner.group(2)
+            # A load case defined under the symbol itself takes precedence over its alias
+            if symbol in available_cases or any(case in available_cases
+                                                for case in LOAD_CASE_ALIASES.get(symbol, ())):
+                factors[symbol] = factors.get(symbol, 0.0) + factor * inner_factor
+                break
+        else:
+            undefined.append(body)
+    
+    if undefined:
+        print(f"  Warning: no load case defined for {', '.join(undefined)} in '{formula}', term(s) dropped")
+    return factors
+
+def expand_directional_combinations(combinations, available_cases):
+    """Split combinations that use a directional symbol into one combination per direction and sign
+    
+    A factor on W becomes separate +WINDX, -WINDX, +WINDY and -WINDY
+    combinations (named e.g. 'U4_-WINDY') rather than both winds at once.
+    """
+    expanded = {}
+    for combo_id, factors in combinations.items():
+        variants = [(combo_id, {})]
+        for name, factor in factors.items():
+            directions = [] if name in available_cases else [
+                case for case in LOAD_CASE_ALIASES.get(name, ()) if case in available_cases]
+            if directions:
+                variants = [(f"{variant_id}_{'+' if sign > 0 else '-'}{case}",
+                             dict(variant, **{case: variant.get(case, 0.0) + sign * factor}))
+                            for variant_id, variant in variants for case in directions for sign in (1, -1)]
+            else:
+                variants = [(variant_id, dict(variant, **{name: variant.get(name, 0.0) + factor}))
+                            for variant_id, variant in variants]
+        expanded.update(variants)
+    return expanded
+
 # --- 1. ENHANCED LICENSING & SECURITY ---
 def verify_license():
     try:
@@ -853,6 +1040,411 @@ class SeismicAnalysisEngine:
             'seismic_parameters': seismic_results
         }
 
+# --- SPARSE STIFFNESS FACTORIZATION (ASSEMBLE ONCE, SOLVE MANY) ---
+class FactorizedStiffness:
+    def __init__(self, K, free_dofs=None, stabilization=None, solver='auto', preconditioner='auto',
+                 tolerance=1e-8, max_iterations=5000, ordering='natural'):
+        self.K = K
+        self.n_dof = K.shape[0]
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.preconditioner = None
+        self.preconditioner_type = None
+        self.stabilization = stabilization
+        self.options = {'solver': solver, 'preconditioner': preconditioner, 'tolerance': tolerance,
+                        'max_iterations': max_iterations, 'ordering': ordering}
+        
+        # Only the free block K_ff is solved; fixed DOFs have zero displacement
+        self.free_dofs = np.arange(self.n_dof) if free_dofs is None else np.asarray(free_dofs, dtype=int)
+        K_free = K[self.free_dofs][:, self.free_dofs].tocsr()
+        if stabilization is not None and np.any(stabilization):
+            K_free = (K_free + scipy.sparse.diags(stabilization, format='csr')).tocsr()
+        n_free = K_free.shape[0]
+        if ordering not in ('rcm', 'natural'):
+            raise ValueError(f"Unknown DOF ordering '{ordering}' (use 'natural' or 'rcm')")
+        self.permutation = np.arange(n_free)
+        self.K_free = K_free
+        
+        # Direct factorization for moderate models, preconditioned CG beyond that
+        if solver == 'auto':
+            solver = 'direct' if n_free <= DIRECT_SOLVER_DOF_LIMIT else 'cg'
+        
+        self.method = 'sparse_lu' if solver == 'direct' else 'pcg'
+        if self.method == 'sparse_lu':
+            try:
+                self._factorize()
+            except Exception as e:
+                print(f"  Sparse factorization failed: {e}, switching to preconditioned CG...")
+                self.method = 'pcg'
+        
+        if self.method == 'pcg':
+            if ordering == 'rcm' and n_free:
+                self._renumber()
+            self.preconditioner = self._build_preconditioner(preconditioner)
+        self.inverse_permutation = np.argsort(self.permutation)
+    
+    def _renumber(self):
+        """Reverse Cuthill-McKee renumbering of the free system for CG; solve() maps solutions back
+        
+        A narrow band keeps ILU fill local and matrix-vector products cache
+        friendly. Direct solves skip it: SuperLU's own COLAMD column ordering
+        gives far less fill than a banded ordering.
+        """
+        self.permutation = reverse_cuthill_mckee(self.K_free, symmetric_mode=True).astype(int)
+        bandwidth = self._bandwidth(self.K_free)
+        self.K_free = self.K_free[self.permutation][:, self.permutation].tocsr()
+        print(f"  Reverse Cuthill-McKee renumbering: bandwidth {bandwidth} -> {self._bandwidth(self.K_free)}")
+    
+    def _factorize(self):
+        """Sparse LU of the free system with SuperLU's COLAMD fill-reducing column ordering"""
+        self.lu = splu(self.K_free.tocsc(), permc_spec='COLAMD')
+        self.method = 'sparse_lu'
+    
+    @staticmethod
+    def _bandwidth(K):
+        """Largest |row - col| over the stored entries"""
+        coo = K.tocoo()
+        return int(np.max(np.abs(coo.row - coo.col))) if coo.nnz else 0
+    
+    def _build_preconditioner(self, preconditioner, drop_tol=1e-5, fill_factor=20):
+        """Jacobi, incomplete LU or algebraic multigrid preconditioner for CG
+        
+        ILU needs room for fill: capped at 10x the matrix nonzeros it drops so
+        much on pedestal meshes that CG stagnates.
+        """
+        if preconditioner == 'auto':
+            preconditioner = 'amg' if PYAMG_AVAILABLE else 'ilu'
+        
+        if preconditioner == 'amg':
+            if PYAMG_AVAILABLE:
+                print("  Building smoothed-aggregation AMG preconditioner...")
+                self.preconditioner_type = 'amg'
+                return pyamg.smoothed_aggregation_solver(self.K_free).aspreconditioner(cycle='V')
+            print("  pyamg not installed, using ILU preconditioner")
+            preconditioner = 'ilu'
+        
+        if preconditioner == 'ilu':
+            try:
+                print(f"  Building incomplete LU preconditioner (drop tolerance {drop_tol:g})...")
+                ilu = spilu(self.K_free.tocsc(), drop_tol=drop_tol, fill_factor=fill_factor)
+                self.preconditioner_type = 'ilu'
+                return LinearOperator(self.K_free.shape, matvec=ilu.solve)
+            except Exception as e:
+                print(f"  Incomplete LU failed: {e}, using Jacobi preconditioner")
+        
+        self.preconditioner_type = 'jacobi'
+        inverse_diagonal = 1.0 / self.K_free.diagonal()
+        return LinearOperator(self.K_free.shape, matvec=lambda x: inverse_diagonal * x)
+    
+    def solve(self, F):
+        """Back-substitute a load vector or an (n_dof, n_cases) load matrix"""
+        F = np.asarray(F, dtype=float)
+        U = np.zeros_like(F)
+        if len(self.free_dofs) == 0:
+            return U
+        
+        F_free = F[self.free_dofs][self.permutation]
+        if self.method == 'sparse_lu':
+            U_free = self.lu.solve(F_free)
+        elif F.ndim == 1:
+            U_free = self._iterative_solve(F_free)
+        else:
+            U_free = np.column_stack([self._iterative_solve(F_free[:, col]) for col in range(F.shape[1])])
+        
+        U[self.free_dofs] = U_free[self.inverse_permutation]
+        return U
+    
+    def _iterative_solve(self, f):
+        """Preconditioned conjugate gradient solve of one load vector
+        
+        If CG stalls, the ILU preconditioner is rebuilt once with less dropping;
+        if it still does not converge, the free system is factorized with sparse
+        LU so that no unconverged displacements are returned.
+        """
+        if self.method == 'sparse_lu':
+            return self.lu.solve(f)
+        if not np.any(f):
+            return np.zeros_like(f)
+        
+        for attempt in range(2):
+            iterations = [0]
+            
+            def count_iteration(xk):
+                iterations[0] += 1
+            
+            u, info = cg(self.K_free, f, rtol=self.tolerance, atol=0.0, maxiter=self.max_iterations,
+                         M=self.preconditioner, callback=count_iteration)
+            if info == 0:
+                print(f"  CG converged in {iterations[0]} iterations")
+                return u
+            if info < 0:
+                raise ValueError("CG breakdown: stiffness matrix is not positive definite")
+            
+            residual = np.linalg.norm(f - self.K_free @ u) / np.linalg.norm(f)
+            print(f"  Warning: CG did not converge in {info} iterations (relative residual {residual:.2e})")
+            if attempt > 0 or self.preconditioner_type != 'ilu':
+                break
+            self.preconditioner = self._build_preconditioner('ilu', drop_tol=1e-7, fill_factor=40)
+        
+        print("  Falling back to sparse LU factorization")
+        self._factorize()
+        return self.lu.solve(f)
+    
+    def solve_parallel(self, F, workers):
+        """Solve CG load columns in worker processes, each holding its own preconditioner
+        
+        A direct factorization back-substitutes all columns at once faster than
+        workers could be started, so only the iterative path is distributed.
+        """
+        F = np.asarray(F, dtype=float)
+        if self.method != 'pcg' or workers <= 1 or F.ndim == 1 or F.shape[1] < 2:
+            return self.solve(F)
+        
+        blocks = np.array_split(np.arange(F.shape[1]), min(workers, F.shape[1]))
+        options = dict(self.options, solver='cg', preconditioner=self.preconditioner_type)
+        try:
+            print(f"  Solving {F.shape[1]} load case(s) in {len(blocks)} worker processes...")
+            with _process_pool(len(blocks), initializer=_init_solver_worker,
+                               initargs=(self.K, self.free_dofs, self.stabilization, options)) as pool:
+                return np.column_stack(list(pool.map(_solve_in_worker, [F[:, block] for block in blocks])))
+        except Exception as e:
+            print(f"  Parallel solve failed: {e}, solving in this process")
+            return self.solve(F)
+    
+    def reactions(self, displacements):
+        """Nodal reactions K @ u for a displacement vector or matrix"""
+        return self.K @ np.asarray(displacements, dtype=float)
+    
+    def natural_frequencies(self, masses, n_modes=10):
+        """Lowest natural frequencies (Hz) for lumped DOF masses by shift-invert Lanczos on this factorization
+        
+        With sigma = 0 the massed DOFs m carry the symmetric problem
+        M^1/2 K^-1 M^1/2 psi = psi / omega^2, so massless DOFs need no special
+        handling. Zero-energy (mechanism) modes are reported as 0 Hz with a
+        warning; a clearly negative eigenvalue raises ValueError.
+        """
+        masses = np.asarray(masses, dtype=float)[self.free_dofs]
+        if self.stabilization is not None:
+            # Parts held only by stabilization springs have no physical modes
+            masses = np.where(self.stabilization > 0, 0.0, masses)
+        masses = masses[self.permutation]
+        
+        massed = np.flatnonzero(masses > 0)
+        n_modes = min(n_modes, len(massed))
+        if n_modes < 1:
+            return np.array([])
+        
+        solve = self.lu.solve if self.method == 'sparse_lu' else self._iterative_solve
+        root_mass = np.sqrt(masses[massed])
+        
+        def flexibility(x):
+            f = np.zeros(len(masses))
+            f[massed] = root_mass * x
+            return root_mass * solve(f)[massed]
+        
+        if len(massed) <= 2 * n_modes + 20:
+            # Too few massed DOFs for Lanczos: form the small flexibility matrix
+            A = np.column_stack([flexibility(column) for column in np.eye(len(massed))])
+            flexibilities = np.linalg.eigvalsh((A + A.T) / 2)
+        else:
+            # Largest magnitude, so the huge values of near-singular modes are found whatever their sign
+            flexibilities = eigsh(LinearOperator((len(massed), len(massed)), matvec=flexibility, dtype=float),
+                                  k=n_modes, which='LM', return_eigenvectors=False)
+        flexibilities = flexibilities[np.argsort(-np.abs(flexibilities))][:n_modes]
+        
+        with np.errstate(divide='ignore'):
+            eigenvalues = 1.0 / flexibilities
+        
+        # Round-off of a zero eigenvalue is relative to the stiffest DOF per unit mass
+        zero_tolerance = 1e-12 * np.max(self.K_free.diagonal()[massed] / masses[massed])
+        if np.any(eigenvalues < -zero_tolerance):
+            raise ValueError(f"Stiffness matrix is not positive semidefinite "
+                             f"(eigenvalue {eigenvalues.min():.3e})")
+        zero_modes = eigenvalues <= zero_tolerance
+        if np.any(zero_modes):
+            print(f"  Warning: {np.count_nonzero(zero_modes)} zero-energy mode(s) - "
+                  f"part of the structure is a mechanism")
+        
+        return np.sort(np.sqrt(np.where(zero_modes, 0.0, eigenvalues)) / (2 * np.pi))
+
+# --- WORKER PROCESSES ---
+def _process_pool(max_workers, **kwargs):
+    """Pool of freshly started worker processes; a fork of the GUI process would copy its Tk state and threads"""
+    method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context(method), **kwargs)
+
+@contextlib.contextmanager
+def _quiet_worker():
+    """Discard the progress output of a worker process task"""
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        yield
+
+# Stiffness system of a solver worker process, set up once by _init_solver_worker
+_worker_system = None
+
+def _init_solver_worker(K, free_dofs, stabilization, options):
+    """Build the CG system and its preconditioner once per worker process"""
+    global _worker_system
+    with _quiet_worker():
+        _worker_system = FactorizedStiffness(K, free_dofs=free_dofs, stabilization=stabilization, **options)
+
+def _solve_in_worker(F_block):
+    with _quiet_worker():
+        return _worker_system.solve(F_block)
+
+# --- JOINT FORCE RESULTS (ONE ARRAY PER COMPONENT) ---
+class JointForces(Mapping):
+    COMPONENTS = ['fx', 'fy', 'fz', 'mx', 'my', 'mz']
+    
+    def __init__(self, forces):
+        self.forces = np.asarray(forces, dtype=float).reshape(-1, 6)
+        self.resultant_force = np.linalg.norm(self.forces[:, 0:3], axis=1)
+        self.resultant_moment = np.linalg.norm(self.forces[:, 3:6], axis=1)
+        self.max_shear = np.linalg.norm(self.forces[:, 1:3], axis=1)
+        self.max_moment = np.linalg.norm(self.forces[:, 4:6], axis=1)
+    
+    def __getitem__(self, node):
+        """Dict view of one joint, e.g. joint_forces[i]['fz']"""
+        if not self._valid_node(node):
+            raise KeyError(node)
+        record = dict(zip(self.COMPONENTS, self.forces[node].tolist()))
+        record['resultant_force'] = float(self.resultant_force[node])
+        record['resultant_moment'] = float(self.resultant_moment[node])
+        record['max_shear'] = float(self.max_shear[node])
+        record['max_moment'] = float(self.max_moment[node])
+        return record
+    
+    def __contains__(self, node):
+        return self._valid_node(node)
+    
+    def __iter__(self):
+        return iter(range(len(self.forces)))
+    
+    def __len__(self):
+        return len(self.forces)
+    
+    def _valid_node(self, node):
+        return isinstance(node, (int, np.integer)) and 0 <= node < len(self.forces)
+    
+    def component(self, name):
+        """Column of one force component over all joints"""
+        return self.forces[:, self.COMPONENTS.index(name)]
+
+# --- COMPACT MESH (NODE ARRAY + TYPED ELEMENT TABLES) ---
+class PedestalMesh(Sequence):
+    SHELL = len(FRAME_ELEMENT_TYPES)  # type code of shell elements in element_codes()
+    
+    def __init__(self, nodes, frames, shells, names, levels):
+        self.nodes = np.asarray(nodes, dtype=np.float64).reshape(-1, 3)
+        self.frames = frames
+        self.shells = shells
+        self.names = list(names)
+        self.levels = list(levels)
+        
+        # Element position -> table (0 frame, 1 shell) and row in that table
+        self.kind = np.zeros(len(frames) + len(shells), dtype=np.int8)
+        self.kind[shells['index']] = 1
+        self.row = np.zeros(len(self.kind), dtype=np.int32)
+        self.row[frames['index']] = np.arange(len(frames))
+        self.row[shells['index']] = np.arange(len(shells))
+    
+    @classmethod
+    def from_elements(cls, nodes, elements):
+        """Pack element tuples such as ('BEAM', name, n1, n2, A, Ix, Iy, Iz, width, depth) into tables"""
+        frame_rows, shell_rows = [], []
+        names, levels = {}, {}
+        for position, elem in enumerate(elements):
+            if elem[0] == 'SHELL':
+                shell_rows.append((position, levels.setdefault(elem[1], len(levels)),
+                                   tuple(elem[2:6]), elem[10]))
+            else:
+                values = tuple(elem[4:10]) + (0.0,) * (10 - len(elem))
+                frame_rows.append((position, FRAME_ELEMENT_TYPES.index(elem[0]),
+                                   names.setdefault(elem[1], len(names)), elem[2], elem[3]) + values)
+        
+        return cls(nodes, np.array(frame_rows, dtype=FRAME_ELEMENT_DTYPE),
+                   np.array(shell_rows, dtype=SHELL_ELEMENT_DTYPE), names, levels)
+    
+    @classmethod
+    def of(cls, nodes, elements):
+        """The elements as a PedestalMesh, packing element tuples if needed"""
+        if isinstance(elements, cls):
+            return elements
+        return cls.from_elements(nodes, elements)
+    
+    def __getitem__(self, position):
+        """Element tuple at one position, e.g. mesh[i][0] == 'SHELL'"""
+        if isinstance(position, slice):
+            return [self[i] for i in range(len(self))[position]]
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError(position)
+        row = self.row[position]
+        if self.kind[position]:
+            return self._shell_tuple(self.shells[row:row + 1].tolist()[0])
+        return self._frame_tuple(self.frames[row:row + 1].tolist()[0])
+    
+    def __iter__(self):
+        frames, shells = self.frames.tolist(), self.shells.tolist()
+        for kind, row in zip(self.kind.tolist(), self.row.tolist()):
+            yield self._shell_tuple(shells[row]) if kind else self._frame_tuple(frames[row])
+    
+    def __len__(self):
+        return len(self.kind)
+    
+    def _frame_tuple(self, record):
+        _, type_code, name, n1, n2, A, Ix, Iy, Iz, width, depth = record
+        elem_type = FRAME_ELEMENT_TYPES[type_code]
+        if elem_type == 'PILE':
+            return (elem_type, self.names[name], n1, n2, A, Ix, Iy, Iz, width)
+        return (elem_type, self.names[name], n1, n2, A, Ix, Iy, Iz, width, depth)
+    
+    def _shell_tuple(self, record):
+        _, level, nodes, thickness = record
+        return ('SHELL', self.levels[level], *nodes.tolist(), 0, 0, 0, 0, thickness, 0)
+    
+    def frame_mask(self, *elem_types):
+        """Boolean mask over frame rows of the given element types"""
+        return np.isin(self.frames['type'], [FRAME_ELEMENT_TYPES.index(t) for t in elem_types])
+    
+    def element_codes(self):
+        """Type code of every element in sequence order (shells are PedestalMesh.SHELL)"""
+        codes = np.full(len(self), self.SHELL, dtype=np.int8)
+        codes[self.frames['index']] = self.frames['type']
+        return codes
+    
+    def element_counts(self):
+        """Number of elements per type, in order of first appearance"""
+        codes, first, counts = np.unique(self.element_codes(), return_index=True, return_counts=True)
+        labels = FRAME_ELEMENT_TYPES + ('SHELL',)
+        return {labels[codes[i]]: int(counts[i]) for i in np.argsort(first)}
+    
+    def fingerprint(self):
+        """Hashable key of connectivity and properties (nodes excluded)"""
+        return hash((self.frames.tobytes(), self.shells.tobytes(), tuple(self.names), tuple(self.levels)))
+    
+    def renumbered(self, nodes, node_map, drop_frames=None, drop_shells=None):
+        """Copy on new nodes with connectivity mapped through node_map, optionally dropping frame and shell rows"""
+        frames, shells = self.frames.copy(), self.shells.copy()
+        frames['n1'] = node_map[frames['n1']]
+        frames['n2'] = node_map[frames['n2']]
+        shells['nodes'] = node_map[shells['nodes']]
+        
+        drop_frames = np.zeros(len(frames), dtype=bool) if drop_frames is None else drop_frames
+        drop_shells = np.zeros(len(shells), dtype=bool) if drop_shells is None else drop_shells
+        if np.any(drop_frames) or np.any(drop_shells):
+            keep = np.ones(len(self), dtype=bool)
+            keep[frames['index'][drop_frames]] = False
+            keep[shells['index'][drop_shells]] = False
+            position = np.cumsum(keep) - 1
+            frames = frames[~drop_frames]
+            shells = shells[~drop_shells]
+            frames['index'] = position[frames['index']]
+            shells['index'] = position[shells['index']]
+        
+        return PedestalMesh(nodes, frames, shells, self.names, self.levels)
+
 # --- 2. ENHANCED STRUCTURAL ANALYSIS ENGINE WITH SQUARE/RECTANGULAR MESHES ---
 class StructuralAnalysisEngine:
     def __init__(self):
@@ -867,6 +1459,25 @@ class StructuralAnalysisEngine:
         self.modulus_subgrade_xy = 10.0   # lb/in³
         self.pile_soil_spring_factor = 1.0
         
+        # Element stiffness cache: (E, nu, soil, pile, A, Ix, Iy, Iz, L) -> 12x12 frame matrix,
+        # ('SHELL', E, nu, local shape, orientation, t) -> 24x24 quad matrix, in least recently used order
+        self.element_stiffness_cache = OrderedDict()
+        
+        # Linear solver: 'auto', 'direct' or 'cg' with 'auto', 'jacobi', 'ilu' or 'amg' preconditioning
+        self.solver = 'auto'
+        self.solver_preconditioner = 'auto'
+        self.solver_tolerance = 1e-8
+        self.solver_max_iterations = 5000
+        self.dof_ordering = 'natural'  # CG DOF renumbering, 'natural' or 'rcm'; direct solves use SuperLU's COLAMD
+        self.parallel_workers = 1  # Worker processes for multi-case solves, 0 = all cores
+        
+        # Optional progress(message, fraction) hook, set while a background job runs
+        self.progress_callback = None
+        
+        # Last factorized global stiffness, shared by all results of the same mesh
+        self.stiffness_system = None
+        self.stiffness_system_key = None
+        
         # Default mesh size: 2ft x 2ft
         self.default_mesh_size = 2.0
         
@@ -880,6 +1491,7 @@ class StructuralAnalysisEngine:
             mesh_size = self.default_mesh_size
         
         print(f"Generating complete mesh with {mesh_size}ft x {mesh_size}ft square/rectangular elements...")
+        self.report_progress("Generating mesh")
         
         all_points = []
         element_connectivity = []
@@ -937,9 +1549,9 @@ class StructuralAnalysisEngine:
                     all_points.append((x, y, z_top))
                     col_top_node = len(all_points) - 1
                     
-                    A = (width/12) * (depth/12) * 144
-                    Ix = (width/12) * (depth/12)**3 / 12 * 144
-                    Iy = (depth/12) * (width/12)**3 / 12 * 144
+                    A = width * depth  # in²
+                    Ix = width * depth**3 / 12  # in⁴
+                    Iy = depth * width**3 / 12
                     Iz = min(Ix, Iy)
                     
                     element_connectivity.append(('COLUMN', f'COL{col_idx+1}',
@@ -974,9 +1586,9 @@ class StructuralAnalysisEngine:
                     all_points.append((x2, y2, z2))
                     beam_node2 = len(all_points) - 1
                     
-                    A = (width/12) * (depth/12) * 144
-                    Ix = (width/12) * (depth/12)**3 / 12 * 144
-                    Iy = (depth/12) * (width/12)**3 / 12 * 144
+                    A = width * depth  # in²
+                    Ix = width * depth**3 / 12  # in⁴
+                    Iy = depth * width**3 / 12
                     Iz = min(Ix, Iy)
                     
                     element_connectivity.append(('BEAM', f'B{beam_idx+1}',
@@ -998,6 +1610,11 @@ class StructuralAnalysisEngine:
                             beam_nodes_by_level[beam_level] = []
                         beam_nodes_by_level[beam_level].extend([beam_node1, beam_node2])
         
+        # Frame elements by (type, node pair) for constant-time lookup; removed elements become None
+        element_index = {}
+        for position, elem in enumerate(element_connectivity):
+            element_index.setdefault(self._element_key(elem), position)
+        
         # --- PROCESS SLABS WITH SQUARE/RECTANGULAR MESHES (2ft x 2ft) ---
         for level_name, (points, description) in slab_data.items():
             if points and len(points) > 0:
@@ -1046,14 +1663,14 @@ class StructuralAnalysisEngine:
                     
                     # ADD INTERSECTION NODES at column/slab intersections
                     if level_name in column_nodes_by_level:
-                        self._add_intersection_nodes(all_points, element_connectivity,
+                        self._add_intersection_nodes(all_points, element_connectivity, element_index,
                                                     slab_levels[level_name], 
                                                     column_nodes_by_level[level_name],
                                                     level_name, 'COLUMN')
                     
                     # ADD INTERSECTION NODES at beam/slab intersections
                     if level_name in beam_nodes_by_level:
-                        self._add_beam_slab_intersections(all_points, element_connectivity,
+                        self._add_beam_slab_intersections(all_points, element_connectivity, element_index,
                                                          slab_levels[level_name],
                                                          beam_nodes_by_level[level_name],
                                                          level_name)
@@ -1062,33 +1679,92 @@ class StructuralAnalysisEngine:
         for level_name in slab_levels:
             slab_info = slab_levels[level_name]
             
+            # One plan-view spatial index per level for all column and beam queries
+            slab_info['spatial_index'] = self._node_index(
+                np.asarray(all_points, dtype=float)[slab_info['node_indices']],
+                slab_info['node_indices'], plan=True
+            )
+            
             # Connect columns to slab
             if level_name in column_nodes_by_level:
-                self._connect_columns_to_slab(all_points, element_connectivity,
+                self._connect_columns_to_slab(all_points, element_connectivity, element_index,
                                              slab_info, column_nodes_by_level[level_name],
                                              level_name)
             
             # Connect beams to slab
             if level_name in beam_nodes_by_level:
-                self._connect_beams_to_slab(all_points, element_connectivity,
+                self._connect_beams_to_slab(all_points, element_connectivity, element_index,
                                            slab_info, beam_nodes_by_level[level_name],
                                            level_name)
         
+        # Compact out the elements removed while connecting
+        element_connectivity = [elem for elem in element_connectivity if elem is not None]
+        
+        # --- MERGE COINCIDENT NODES ---
+        mesh = self._merge_coincident_nodes(PedestalMesh.from_elements(all_points, element_connectivity))
+        
         print(f"\nMesh generation complete:")
-        print(f"  Total nodes: {len(all_points)}")
-        print(f"  Total elements: {len(element_connectivity)}")
+        print(f"  Total nodes: {len(mesh.nodes)}")
+        print(f"  Total elements: {len(mesh)}")
         print(f"  Mesh size: {mesh_size}ft x {mesh_size}ft square/rectangular elements")
         
-        elem_types = {}
-        for elem in element_connectivity:
-            elem_type = elem[0]
-            elem_types[elem_type] = elem_types.get(elem_type, 0) + 1
-        
         print("Element type summary:")
-        for elem_type, count in elem_types.items():
+        for elem_type, count in mesh.element_counts().items():
             print(f"  {elem_type}: {count} elements")
         
-        return all_points, element_connectivity
+        # The mesh doubles as the element sequence: mesh[i] is the element tuple
+        return mesh.nodes, mesh
+    
+    def _merge_coincident_nodes(self, mesh, tolerance=NODE_MERGE_TOLERANCE):
+        """Unify nodes closer than the tolerance, rewire elements and drop the elements that collapse
+        
+        Nodes are visited in order and each joins the nearest earlier kept node
+        within the tolerance, so merging never chains: merged nodes are always
+        within the tolerance of the node that represents them.
+        """
+        if len(mesh.nodes) == 0:
+            return mesh
+        
+        coords = mesh.nodes
+        pairs = cKDTree(coords).query_pairs(tolerance, output_type='ndarray')
+        if len(pairs) == 0:
+            return mesh
+        
+        # Candidate representatives of each node: the earlier nodes within the tolerance
+        earlier = {}
+        for i, j in pairs.tolist():
+            earlier.setdefault(max(i, j), []).append(min(i, j))
+        
+        representative = np.arange(len(coords))
+        for node in sorted(earlier):
+            kept = [other for other in earlier[node] if representative[other] == other]
+            if kept:
+                representative[node] = kept[int(np.argmin(np.linalg.norm(coords[kept] - coords[node], axis=1)))]
+        
+        # Merged nodes keep the order (and coordinates) of their representative
+        is_kept = representative == np.arange(len(coords))
+        node_map = (np.cumsum(is_kept) - 1)[representative]
+        n_merged = len(coords) - np.count_nonzero(is_kept)
+        
+        # Frames whose ends merge have zero length; quads left with fewer than 3 corners have no area
+        frames = mesh.frames
+        collapsed_frames = node_map[frames['n1']] == node_map[frames['n2']]
+        shell_nodes = np.sort(node_map[mesh.shells['nodes']], axis=1)
+        shell_corners = 1 + np.count_nonzero(np.diff(shell_nodes, axis=1), axis=1)
+        collapsed_shells = shell_corners < 3
+        
+        print(f"  Merged {n_merged} coincident nodes, removed {np.count_nonzero(collapsed_frames & mesh.frame_mask('LINK'))} "
+              f"zero-length links")
+        for element_type in FRAME_ELEMENT_TYPES:
+            count = np.count_nonzero(collapsed_frames & mesh.frame_mask(element_type))
+            if count and element_type != 'LINK':
+                print(f"  Warning: removed {count} zero-length {element_type} element(s)")
+        if np.any(collapsed_shells):
+            print(f"  Warning: removed {np.count_nonzero(collapsed_shells)} collapsed SHELL element(s)")
+        if np.any(shell_corners == 3):
+            print(f"  Warning: {np.count_nonzero(shell_corners == 3)} SHELL element(s) degenerate to triangles")
+        
+        return mesh.renumbered(coords[is_kept], node_map, drop_frames=collapsed_frames, drop_shells=collapsed_shells)
     
     def _generate_square_mesh(self, slab_points, mesh_size, level_name):
         """Generate square or rectangular mesh (2ft x 2ft default)"""
@@ -1121,35 +1797,23 @@ class StructuralAnalysisEngine:
         x_lines = np.arange(min_x, max_x + mesh_size, mesh_size)
         y_lines = np.arange(min_y, max_y + mesh_size, mesh_size)
         
-        # Create grid points
-        slab_nodes = []
-        node_grid = {}  # Store node indices by grid position
+        # Grid points inside the polygon, numbered x-line by x-line
+        grid_x, grid_y = np.meshgrid(x_lines, y_lines, indexing='ij')
+        inside = self._points_in_polygon(grid_x, grid_y, points_2d)
+        node_grid = np.full(inside.shape, -1, dtype=int)  # Node index by grid position, -1 outside
+        node_grid[inside] = np.arange(np.count_nonzero(inside))
         
-        for i, x in enumerate(x_lines):
-            for j, y in enumerate(y_lines):
-                # Check if point is inside polygon
-                if self._point_in_polygon_simple(x, y, points_2d):
-                    slab_nodes.append([x, y, z_level, thickness])
-                    node_grid[(i, j)] = len(slab_nodes) - 1
+        slab_nodes = np.column_stack([grid_x[inside], grid_y[inside],
+                                      np.full(np.count_nonzero(inside), z_level),
+                                      np.full(np.count_nonzero(inside), thickness)]).tolist()
         
-        # Create QUAD elements (rectangular or square)
-        slab_elements = []
+        # Create QUAD elements (rectangular or square) where all 4 corners exist
+        corners = np.stack([node_grid[:-1, :-1], node_grid[1:, :-1],
+                            node_grid[1:, 1:], node_grid[:-1, 1:]], axis=-1).reshape(-1, 4)
+        quads = corners[np.all(corners >= 0, axis=1)]
         
-        for i in range(len(x_lines) - 1):
-            for j in range(len(y_lines) - 1):
-                # Check if all 4 corners exist
-                corners = [(i, j), (i+1, j), (i+1, j+1), (i, j+1)]
-                
-                if all(corner in node_grid for corner in corners):
-                    n1 = node_grid[corners[0]]
-                    n2 = node_grid[corners[1]]
-                    n3 = node_grid[corners[2]]
-                    n4 = node_grid[corners[3]]
-                    
-                    # Check if quad is convex and valid
-                    if self._is_valid_quad(slab_nodes[n1], slab_nodes[n2], 
-                                          slab_nodes[n3], slab_nodes[n4]):
-                        slab_elements.append([n1, n2, n3, n4])
+        # Check if quads are convex and valid
+        slab_elements = quads[self._valid_quads(grid_x[inside], grid_y[inside], quads)].tolist()
         
         # If no quad elements created, fall back to triangles
         if not slab_elements and slab_nodes:
@@ -1168,42 +1832,41 @@ class StructuralAnalysisEngine:
         
         return slab_nodes, slab_elements
     
-    def _point_in_polygon_simple(self, x, y, polygon):
-        """Simple point-in-polygon test"""
-        n = len(polygon)
-        inside = False
-        
-        p1x, p1y = polygon[0]
-        for i in range(n + 1):
-            p2x, p2y = polygon[i % n]
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
+    def _points_in_polygon(self, x, y, polygon):
+        """Ray-casting point-in-polygon test of a whole array of points at once"""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        polygon = np.asarray(polygon, dtype=float)[:, :2]
+        inside = np.zeros(np.broadcast(x, y).shape, dtype=bool)
+        
+        for (p1x, p1y), (p2x, p2y) in zip(polygon, np.roll(polygon, -1, axis=0)):
+            # Horizontal edges never toggle
+            if p1y == p2y:
+                continue
+            crossing = (y > min(p1y, p2y)) & (y <= max(p1y, p2y)) & (x <= max(p1x, p2x))
+            if p1x != p2x:
+                crossing &= x <= (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+            inside ^= crossing
         
         return inside
     
-    def _is_valid_quad(self, p1, p2, p3, p4):
-        """Check if quadrilateral is convex and valid"""
-        # Convert to 2D points
-        points = np.array([[p1[0], p1[1]], [p2[0], p2[1]], 
-                          [p3[0], p3[1]], [p4[0], p4[1]]])
-        
-        # Check area
-        area = 0.5 * abs(
-            (points[1,0]*points[2,1] + points[2,0]*points[3,1] + 
-             points[3,0]*points[0,1] + points[0,0]*points[1,1]) -
-            (points[1,1]*points[2,0] + points[2,1]*points[3,0] + 
-             points[3,1]*points[0,0] + points[0,1]*points[1,0])
-        )
-        
+    def _valid_quads(self, x, y, quads):
+        """Mask of quads (rows of 4 node indices) with a shoelace area above the minimum"""
+        qx, qy = x[quads], y[quads]
+        area = 0.5 * np.abs(np.sum(qx * np.roll(qy, -1, axis=1) - qy * np.roll(qx, -1, axis=1), axis=1))
         return area > 0.01  # Minimum area
     
-    def _add_intersection_nodes(self, all_points, element_connectivity, slab_info, 
+    @staticmethod
+    def _element_key(elem):
+        """(type, smaller node, larger node) key of a two-node element"""
+        return (elem[0], min(elem[2], elem[3]), max(elem[2], elem[3]))
+    
+    def _append_element(self, element_connectivity, element_index, elem):
+        """Append a two-node element and index it by type and node pair"""
+        element_connectivity.append(elem)
+        element_index.setdefault(self._element_key(elem), len(element_connectivity) - 1)
+    
+    def _add_intersection_nodes(self, all_points, element_connectivity, element_index, slab_info,
                                vertical_nodes, level_name, element_type):
         """Add nodes at intersections of vertical elements with slab"""
         slab_nodes = slab_info['node_indices']
@@ -1224,18 +1887,19 @@ class StructuralAnalysisEngine:
                 
                 # Create rigid link from vertical element to intersection node
                 A = 1000  # Rigid link area
-                Ix = Iy = Iz = 1000
+                Ix = Iy = Iz = 144000
                 
-                element_connectivity.append(('LINK', f'{level_name}_{element_type}_Link',
-                                           v_node, intersection_node,
-                                           A, Ix, Iy, Iz, 0, 0))
+                self._append_element(element_connectivity, element_index,
+                                     ('LINK', f'{level_name}_{element_type}_Link',
+                                      v_node, intersection_node,
+                                      A, Ix, Iy, Iz, 0, 0))
                 
                 # Store intersection node
                 slab_nodes.append(intersection_node)
                 
                 print(f"    Added intersection node at ({vx:.1f}, {vy:.1f}, {slab_z:.1f})")
     
-    def _add_beam_slab_intersections(self, all_points, element_connectivity, slab_info,
+    def _add_beam_slab_intersections(self, all_points, element_connectivity, element_index, slab_info,
                                     beam_nodes, level_name):
         """Add nodes at beam/slab intersections and split beams if needed"""
         slab_nodes = slab_info['node_indices']
@@ -1277,12 +1941,8 @@ class StructuralAnalysisEngine:
             # Split beam into two segments if needed
             if len(intersection_points) > 0:
                 # Find existing beam element
-                beam_elem = None
-                for elem in element_connectivity:
-                    if elem[0] == 'BEAM' and ((elem[2] == n1 and elem[3] == n2) or 
-                                             (elem[2] == n2 and elem[3] == n1)):
-                        beam_elem = elem
-                        break
+                beam_position = element_index.get(('BEAM', min(n1, n2), max(n1, n2)))
+                beam_elem = element_connectivity[beam_position] if beam_position is not None else None
                 
                 if beam_elem:
                     # Get beam properties
@@ -1291,197 +1951,135 @@ class StructuralAnalysisEngine:
                     
                     # Split beam into segments
                     # Segment 1: n1 to intersection
-                    element_connectivity.append(('BEAM', f'B{beam_idx+1}_A',
-                                                n1, intersection_node,
-                                                A, Ix, Iy, Iz, width, depth))
+                    self._append_element(element_connectivity, element_index,
+                                         ('BEAM', f'B{beam_idx+1}_A',
+                                          n1, intersection_node,
+                                          A, Ix, Iy, Iz, width, depth))
                     
                     # Segment 2: intersection to n2
-                    element_connectivity.append(('BEAM', f'B{beam_idx+1}_B',
-                                                intersection_node, n2,
-                                                A, Ix, Iy, Iz, width, depth))
+                    self._append_element(element_connectivity, element_index,
+                                         ('BEAM', f'B{beam_idx+1}_B',
+                                          intersection_node, n2,
+                                          A, Ix, Iy, Iz, width, depth))
                     
-                    # Mark original beam for removal
-                    element_connectivity.remove(beam_elem)
+                    # Mark original beam for removal; the list is compacted after meshing
+                    element_connectivity[beam_position] = None
+                    del element_index[self._element_key(beam_elem)]
                     
                     print(f"    Split beam B{beam_idx+1} at intersection point")
     
-    def _connect_columns_to_slab(self, all_points, element_connectivity, slab_info,
+    def _connect_columns_to_slab(self, all_points, element_connectivity, element_index, slab_info,
                                 column_nodes, level_name):
         """Connect columns to slab with rigid links"""
-        slab_nodes = slab_info['node_indices']
-        
         for col_node in column_nodes:
             if col_node < len(all_points):
-                col_x, col_y, col_z = all_points[col_node]
-                
-                # Find nearest slab node
-                min_dist = float('inf')
-                nearest_slab = -1
-                
-                for slab_node in slab_nodes:
-                    if slab_node < len(all_points):
-                        slab_x, slab_y, slab_z = all_points[slab_node]
-                        dist = math.sqrt((col_x-slab_x)**2 + (col_y-slab_y)**2 + (col_z-slab_z)**2)
-                        
-                        if dist < min_dist and dist < 2.0:  # Within 2 ft
-                            min_dist = dist
-                            nearest_slab = slab_node
+                # Find nearest slab node within 2 ft
+                nearest_slab, min_dist = self._nearest_node(slab_info['spatial_index'],
+                                                            all_points[col_node], 2.0)
                 
                 if nearest_slab != -1 and min_dist > 0.01:
                     A = 1000  # Rigid link
-                    Ix, Iy, Iz = 1000, 1000, 1000
-                    element_connectivity.append(('LINK', f'{level_name}_ColLink',
-                                                col_node, nearest_slab,
-                                                A, Ix, Iy, Iz, 0, 0))
+                    Ix, Iy, Iz = 144000, 144000, 144000
+                    self._append_element(element_connectivity, element_index,
+                                         ('LINK', f'{level_name}_ColLink',
+                                          col_node, nearest_slab,
+                                          A, Ix, Iy, Iz, 0, 0))
     
-    def _connect_beams_to_slab(self, all_points, element_connectivity, slab_info,
+    def _connect_beams_to_slab(self, all_points, element_connectivity, element_index, slab_info,
                               beam_nodes, level_name):
         """Connect beams to slab"""
-        slab_nodes = slab_info['node_indices']
-        
         for beam_node in beam_nodes:
             if beam_node < len(all_points):
-                beam_x, beam_y, beam_z = all_points[beam_node]
-                
-                # Find nearest slab node at same Z level
-                min_dist = float('inf')
-                nearest_slab = -1
-                
-                for slab_node in slab_nodes:
-                    if slab_node < len(all_points):
-                        slab_x, slab_y, slab_z = all_points[slab_node]
-                        
-                        # Check if at same level
-                        if abs(beam_z - slab_z) < 0.1:
-                            dist = math.sqrt((beam_x-slab_x)**2 + (beam_y-slab_y)**2)
-                            
-                            if dist < min_dist and dist < 1.0:  # Within 1 ft
-                                min_dist = dist
-                                nearest_slab = slab_node
+                # Find nearest slab node at same Z level within 1 ft in plan
+                nearest_slab, min_dist = self._nearest_node(slab_info['spatial_index'],
+                                                            all_points[beam_node], 1.0, level_tolerance=0.1)
                 
                 if nearest_slab != -1 and min_dist > 0.01:
                     # Create connection if not already connected
-                    already_connected = False
-                    for elem in element_connectivity:
-                        if elem[0] == 'LINK' and ((elem[2] == beam_node and elem[3] == nearest_slab) or
-                                                 (elem[2] == nearest_slab and elem[3] == beam_node)):
-                            already_connected = True
-                            break
+                    already_connected = ('LINK', min(beam_node, nearest_slab),
+                                         max(beam_node, nearest_slab)) in element_index
                     
                     if not already_connected:
                         A = 1000
-                        Ix, Iy, Iz = 1000, 1000, 1000
-                        element_connectivity.append(('LINK', f'{level_name}_BeamLink',
-                                                    beam_node, nearest_slab,
-                                                    A, Ix, Iy, Iz, 0, 0))
+                        Ix, Iy, Iz = 144000, 144000, 144000
+                        self._append_element(element_connectivity, element_index,
+                                             ('LINK', f'{level_name}_BeamLink',
+                                              beam_node, nearest_slab,
+                                              A, Ix, Iy, Iz, 0, 0))
 
-    def calculate_static_forces(self, nodes, elements, load_cases):
+    def _node_index(self, coords, node_ids=None, plan=False):
+        """KD-tree over node coordinates (x, y only if plan), built once and reused for nearest-node queries"""
+        coords = np.asarray(coords, dtype=float).reshape(-1, 3)
+        return {
+            'ids': np.arange(len(coords)) if node_ids is None else np.asarray(node_ids, dtype=int),
+            'coords': coords,
+            'tree': cKDTree(coords[:, :2] if plan else coords),
+        }
+    
+    def _nearest_node(self, index, point, radius, level_tolerance=None):
+        """(node, distance) of the nearest indexed node strictly within radius, first in index order on ties;
+        distances are in plan among nodes within level_tolerance in z when that is given, else 3D"""
+        point = np.asarray(point, dtype=float)
+        if not len(index['ids']):
+            return -1, float('inf')
+        
+        # Ball query on the tree (plan or 3D), then exact distances on the few candidates
+        query = point[:index['tree'].m]
+        candidates = np.asarray(index['tree'].query_ball_point(query, radius * (1 + 1e-9), return_sorted=True),
+                                dtype=int)
+        if not len(candidates):
+            return -1, float('inf')
+        
+        delta = index['coords'][candidates] - point
+        if level_tolerance is None:
+            distances = np.sqrt(delta[:, 0]**2 + delta[:, 1]**2 + delta[:, 2]**2)
+        else:
+            distances = np.sqrt(delta[:, 0]**2 + delta[:, 1]**2)
+            distances[np.abs(delta[:, 2]) >= level_tolerance] = np.inf
+        distances[distances >= radius] = np.inf
+        
+        best = int(np.argmin(distances))
+        if not np.isfinite(distances[best]):
+            return -1, float('inf')
+        return int(index['ids'][candidates[best]]), float(distances[best])
+    
+    def calculate_static_forces(self, nodes, elements, load_cases, system=None):
         """Perform static analysis with pile soil springs and special loads"""
         print("Starting static analysis with pile soil springs and special loads...")
         
         results = {}
+        if not load_cases:
+            return results
         
-        for case_name, loads in load_cases.items():
+        n_nodes = len(nodes)
+        n_dof = n_nodes * 6
+        case_names = list(load_cases.keys())
+        
+        # Force matrix with one column per load case
+        F = np.zeros((n_dof, len(case_names)))
+        for col, case_name in enumerate(case_names):
+            F[:, col] = self.load_case_array(load_cases[case_name], n_nodes).ravel()
+        
+        # Stiffness depends only on the mesh - assemble and factorize once
+        if system is None:
+            system = self.get_stiffness_system(nodes, elements)
+        
+        # Back-substitute every load case in one multi-column solve; a solver failure
+        # propagates to the caller rather than passing zero displacements on to design
+        self.report_progress(f"Solving {len(case_names)} load case(s)")
+        print(f"  Solving {len(case_names)} load case(s)...")
+        displacement_matrix = system.solve_parallel(F, self.parallel_worker_count())
+        print("  Solution successful")
+        
+        for col, case_name in enumerate(case_names):
             print(f"  Load case: {case_name}")
-            
-            n_nodes = len(nodes)
-            n_dof = n_nodes * 6
-            
-            # Stiffness matrix and force vector
-            K = np.zeros((n_dof, n_dof))
-            F = np.zeros(n_dof)
-            
-            # Apply loads
-            for load in loads:
-                if len(load) >= 7:
-                    node_id, fx, fy, fz, mx, my, mz = load
-                    if node_id < n_nodes:
-                        idx = node_id * 6
-                        F[idx:idx+6] = [fx, fy, fz, mx, my, mz]
-            
-            # Assemble stiffness matrix with soil springs
-            for elem in elements:
-                elem_type = elem[0]
-                
-                if elem_type == 'SHELL':
-                    if len(elem) >= 6:  # Quad with 4 nodes
-                        n1, n2, n3, n4 = elem[2], elem[3], elem[4], elem[5]
-                        thickness = elem[10] if len(elem) > 10 else self.slab_thickness/12
-                        ke = self._shell_stiffness_matrix_quad(nodes[n1], nodes[n2], nodes[n3], nodes[n4], thickness)
-                        dofs = []
-                        for n in [n1, n2, n3, n4]:
-                            dofs.extend([n*6 + i for i in range(6)])
-                        
-                        for i in range(len(dofs)):
-                            for j in range(len(dofs)):
-                                K[dofs[i], dofs[j]] += ke[i, j]
-                    
-                elif elem_type in ['COLUMN', 'BEAM', 'PILE', 'LINK']:
-                    n1, n2 = elem[2], elem[3]
-                    if len(elem) >= 10:
-                        A, Ix, Iy, Iz = elem[4], elem[5], elem[6], elem[7]
-                    else:
-                        A, Ix, Iy, Iz = 100, 100, 100, 100
-                    
-                    L = self._element_length(nodes[n1], nodes[n2])
-                    ke = self._beam_stiffness_matrix(A, Ix, Iy, Iz, L, elem_type)
-                    
-                    dofs = [n1*6 + i for i in range(6)] + [n2*6 + i for i in range(6)]
-                    for i in range(12):
-                        for j in range(12):
-                            K[dofs[i], dofs[j]] += ke[i, j]
-            
-            # Add soil springs at pile bottoms
-            for elem in elements:
-                if elem[0] == 'PILE':
-                    pile_bottom_node = elem[3]
-                    if pile_bottom_node < n_nodes:
-                        if len(elem) >= 9:
-                            diameter = elem[8]
-                        else:
-                            diameter = 24.0
-                        
-                        k_z = self.modulus_subgrade_z * diameter * 10
-                        k_xy = self.modulus_subgrade_xy * diameter * 10
-                        
-                        idx = pile_bottom_node * 6
-                        K[idx, idx] += k_xy
-                        K[idx+1, idx+1] += k_xy
-                        K[idx+2, idx+2] += k_z
-                        
-                        K[idx+3, idx+3] += k_xy * 100
-                        K[idx+4, idx+4] += k_xy * 100
-                        K[idx+5, idx+5] += k_xy * 100
-            
-            # Ensure symmetric stiffness matrix
-            K = (K + K.T) / 2
-            
-            # Check for zero rows/columns
-            for i in range(n_dof):
-                if np.all(K[i, :] == 0) and np.all(K[:, i] == 0):
-                    K[i, i] = 1.0
-            
-            # Solve
-            try:
-                print("  Solving linear system...")
-                K_sparse = csr_matrix(K)
-                reg_strength = 1e-6 * np.max(np.abs(np.diag(K)))
-                K_reg = K_sparse + reg_strength * scipy.sparse.eye(K_sparse.shape[0])
-                displacements = spsolve(K_reg, F)
-                print("  Solution successful")
-            except Exception as e:
-                print(f"  Sparse solver failed: {e}, trying dense solver...")
-                try:
-                    K_reg = K + 1e-6 * np.max(np.abs(np.diag(K))) * np.eye(K.shape[0])
-                    displacements = np.linalg.solve(K_reg, F)
-                    print("  Dense solution successful")
-                except:
-                    print("  Both solvers failed, returning zeros")
-                    displacements = np.zeros(n_dof)
+            self.report_progress(f"Load case {case_name}", (col + 1) / len(case_names))
+            displacements = displacement_matrix[:, col].copy()
             
             # Calculate reactions and internal forces
-            reactions = np.dot(K, displacements)
+            reactions = system.reactions(displacements)
             internal_forces = self._calculate_internal_forces(nodes, elements, displacements)
+            shell_forces = self._calculate_shell_forces(nodes, elements, displacements)
             joint_forces = self._calculate_joint_forces(nodes, elements, internal_forces, reactions)
             
             # Calculate story drifts for seismic check
@@ -1491,14 +2089,287 @@ class StructuralAnalysisEngine:
                 'displacements': displacements,
                 'reactions': reactions,
                 'internal_forces': internal_forces,
+                'shell_forces': shell_forces,
                 'joint_forces': joint_forces,
                 'story_drifts': story_drifts,
-                'stiffness_matrix': K
+                'stiffness_system': system
             }
         
         print("Static analysis complete!")
         return results
     
+    def report_progress(self, message, fraction=None):
+        """Report analysis progress; the callback may raise AnalysisCancelled"""
+        if self.progress_callback is not None:
+            self.progress_callback(message, fraction)
+    
+    def parallel_worker_count(self):
+        """Number of solver processes from the parallel_workers setting"""
+        if not self.parallel_workers:
+            return os.cpu_count() or 1
+        return max(1, int(self.parallel_workers))
+    
+    def load_case_array(self, loads, n_nodes):
+        """Convert (node, fx, fy, fz, mx, my, mz) load tuples to an (n_nodes, 6) array"""
+        if isinstance(loads, np.ndarray):
+            return loads
+        
+        array = np.zeros((n_nodes, 6))
+        rows = [load[:7] for load in loads if len(load) >= 7 and 0 <= load[0] < n_nodes]
+        if rows:
+            rows = np.asarray(rows, dtype=float)
+            # Several loads on the same node accumulate
+            np.add.at(array, rows[:, 0].astype(int), rows[:, 1:])
+        
+        return array
+    
+    def seismic_load_cases(self, nodes, elements, node_weight=1000):
+        """Equivalent lateral force cases SEISMIC_X and SEISMIC_Y as (n_nodes, 6) arrays"""
+        # Simplified weight distribution: the same weight at every node
+        weight_distribution = {i: node_weight for i in range(len(nodes))}
+        seismic_results = self.seismic_engine.calculate_seismic_loads_for_structure(
+            nodes, elements, weight_distribution
+        )
+        
+        n_nodes = len(nodes)
+        seismic_x = np.zeros((n_nodes, 6))
+        seismic_y = np.zeros((n_nodes, 6))
+        seismic_x[list(seismic_results['seismic_x'].keys()), 0] = list(seismic_results['seismic_x'].values())
+        seismic_y[list(seismic_results['seismic_y'].keys()), 1] = list(seismic_results['seismic_y'].values())
+        
+        return seismic_results, {'SEISMIC_X': seismic_x, 'SEISMIC_Y': seismic_y}
+    
+    def analyze_load_combinations(self, nodes, elements, load_cases, combinations, system=None):
+        """Analyze load combinations by linear superposition of primitive load cases"""
+        print("Starting load combination analysis by superposition...")
+        combinations = expand_directional_combinations(combinations, load_cases)
+        
+        # Primitive load cases referenced by at least one combination
+        primitive_cases = []
+        for factors in combinations.values():
+            for case_name in factors:
+                if case_name in load_cases and case_name not in primitive_cases:
+                    primitive_cases.append(case_name)
+        
+        if not primitive_cases:
+            print("  No combination references a defined load case")
+            return {}
+        
+        # One solve per primitive case, all sharing a single factorization
+        if system is None:
+            system = self.get_stiffness_system(nodes, elements)
+        case_results = self.calculate_static_forces(
+            nodes, elements, {name: load_cases[name] for name in primitive_cases}, system=system
+        )
+        
+        # Factor matrix: one row per primitive case, one column per combination
+        combo_ids = [combo_id for combo_id, factors in combinations.items()
+                     if any(name in case_results for name in factors)]
+        C = np.zeros((len(primitive_cases), len(combo_ids)))
+        for col, combo_id in enumerate(combo_ids):
+            for case_name, factor in combinations[combo_id].items():
+                if case_name in case_results:
+                    C[primitive_cases.index(case_name), col] += factor
+        
+        # All combined displacement and reaction fields in one matrix product each
+        U = np.column_stack([case_results[name]['displacements'] for name in primitive_cases]) @ C
+        R = system.reactions(U)
+        
+        # Element end forces are linear in the displacements - superpose them too
+        end_forces = np.stack([case_results[name]['internal_forces']['end_forces'] for name in primitive_cases])
+        combo_end_forces = np.einsum('cej,ck->kej', end_forces, C)
+        frame_template = case_results[primitive_cases[0]]['internal_forces']
+        
+        results = {}
+        for col, combo_id in enumerate(combo_ids):
+            print(f"  Combination: {combo_id}")
+            self.report_progress(f"Combination {combo_id}", (col + 1) / len(combo_ids))
+            displacements = U[:, col].copy()
+            reactions = R[:, col].copy()
+            
+            internal_forces = frame_template.copy()
+            internal_forces['end_forces'] = combo_end_forces[col]
+            shell_forces = self._calculate_shell_forces(nodes, elements, displacements)
+            joint_forces = self._calculate_joint_forces(nodes, elements, internal_forces, reactions)
+            story_drifts = self._calculate_story_drifts(nodes, displacements)
+            
+            results[combo_id] = {
+                'displacements': displacements,
+                'reactions': reactions,
+                'internal_forces': internal_forces,
+                'shell_forces': shell_forces,
+                'joint_forces': joint_forces,
+                'story_drifts': story_drifts,
+                'stiffness_system': system,
+                'load_factors': {name: float(C[row, col]) for row, name in enumerate(primitive_cases)
+                                 if C[row, col] != 0}
+            }
+        
+        print(f"Combination analysis complete: {len(combo_ids)} combinations from "
+              f"{len(primitive_cases)} primitive load cases")
+        return results
+    
+    def get_stiffness_system(self, nodes, elements):
+        """Factorized stiffness for the mesh, reused while mesh and properties are unchanged"""
+        key = (
+            self.E, self.nu, self.slab_thickness,
+            self.modulus_subgrade_z, self.modulus_subgrade_xy, self.pile_soil_spring_factor,
+            self.solver, self.solver_preconditioner, self.solver_tolerance, self.solver_max_iterations,
+            self.dof_ordering,
+            hash(np.asarray(nodes, dtype=float).tobytes()),
+            PedestalMesh.of(nodes, elements).fingerprint(),
+        )
+        if self.stiffness_system is None or key != self.stiffness_system_key:
+            self.stiffness_system = self.build_stiffness_system(nodes, elements)
+            self.stiffness_system_key = key
+        else:
+            print("  Reusing factorized stiffness matrix")
+        return self.stiffness_system
+    
+    def build_stiffness_system(self, nodes, elements):
+        """Assemble, condition and factorize the global stiffness matrix once"""
+        print("  Assembling global stiffness matrix...")
+        self.report_progress("Assembling stiffness matrix", 0.0)
+        K = self._assemble_stiffness_matrix(nodes, elements)
+        self.report_progress("Conditioning stiffness matrix", 0.4)
+        K, free_dofs, stabilization = self._condition_stiffness(K, nodes, elements)
+        
+        self.report_progress(f"Factorizing stiffness matrix ({len(free_dofs)} DOF)", 0.5)
+        return self.factorize_stiffness(K, free_dofs, stabilization)
+    
+    def factorize_stiffness(self, K, free_dofs, stabilization):
+        """Factorize (or precondition) a conditioned stiffness matrix with the current solver settings"""
+        print(f"  Preparing {self.solver} solver for stiffness matrix ({len(free_dofs)} free of "
+              f"{K.shape[0]} DOF, {K.nnz} nonzeros)...")
+        return FactorizedStiffness(K, free_dofs=free_dofs, stabilization=stabilization, solver=self.solver, preconditioner=self.solver_preconditioner,
+                                   tolerance=self.solver_tolerance, max_iterations=self.solver_max_iterations,
+                                   ordering=self.dof_ordering)
+    
+    def _condition_stiffness(self, K, nodes, elements):
+        """Add pile-bottom soil springs, split free/fixed DOFs and stabilize unsupported parts in O(nnz)
+        
+        Element matrices are positive semidefinite and springs positive, so the
+        conditioned free block is symmetric positive semidefinite. It is positive
+        definite (and safe for CG) only if no supported part has a mechanism:
+        a part held by one pile node can still rotate about it, which shows up
+        as a zero natural frequency.
+        """
+        n_nodes = len(nodes)
+        
+        # Soil springs at pile bottoms as one diagonal update
+        frames = PedestalMesh.of(nodes, elements).frames
+        piles = frames[(frames['type'] == FRAME_ELEMENT_TYPES.index('PILE')) & (frames['n2'] < n_nodes)]
+        diagonal = np.zeros(K.shape[0])
+        if len(piles):
+            bottoms = piles['n2'].astype(int)
+            diameter = piles['width']
+            k_z = self.modulus_subgrade_z * diameter * 10
+            k_xy = self.modulus_subgrade_xy * diameter * 10
+            
+            springs = np.column_stack([k_xy, k_xy, k_z, k_xy * 100, k_xy * 100, k_xy * 100])
+            np.add.at(diagonal, (bottoms[:, None] * 6 + np.arange(6)).ravel(), springs.ravel())
+        
+        K = K.tocsr()
+        K.eliminate_zeros()
+        if np.any(diagonal):
+            K = (K + scipy.sparse.diags(diagonal, format='csr')).tocsr()
+        
+        # DOFs without stiffness (e.g. unused rotations) are fixed and condensed out.
+        # Element matrices are symmetric, so an empty row is also an empty column.
+        free_dofs = np.flatnonzero(np.diff(K.indptr) > 0)
+        
+        # Connected parts of the free system that reach no soil spring are singular -
+        # only those get weak springs, supported parts are solved exactly
+        K_free = K[free_dofs][:, free_dofs]
+        n_parts, labels = connected_components(K_free, directed=False)
+        supported = np.bincount(labels, minlength=n_parts) == 1
+        supported[labels[diagonal[free_dofs] > 0]] = True
+        floating = ~supported[labels]
+        
+        stabilization = np.zeros(len(free_dofs))
+        if np.any(floating):
+            stabilization[floating] = 1e-6 * np.max(np.abs(K.diagonal()))
+            print(f"  {np.count_nonzero(~supported)} unsupported part(s): weak springs on "
+                  f"{np.count_nonzero(floating)} DOF")
+        return K, free_dofs, stabilization
+    
+    def _assemble_stiffness_matrix(self, nodes, elements):
+        """Assemble global stiffness matrix as sparse CSR from COO triplets"""
+        n_nodes = len(nodes)
+        n_dof = n_nodes * 6
+        
+        # Frame elements: one batched kernel call for all COLUMN/BEAM/PILE/LINK
+        frames = self._frame_element_arrays(nodes, elements)
+        frame_ke = self._frame_stiffness(frames)
+        frame_nodes = np.column_stack([frames['n1'], frames['n2']])
+        
+        # Quad shell elements: one batched kernel call for all slab levels
+        shells = self._shell_element_arrays(nodes, elements)
+        shell_ke = self._shell_stiffness(shells)
+        shell_nodes = shells['nodes']
+        
+        rows, cols, vals = [], [], []
+        
+        # Scatter each element group in one vectorized batch
+        for ke_list, elem_nodes in ((frame_ke, frame_nodes), (shell_ke, shell_nodes)):
+            if len(ke_list) == 0:
+                continue
+            ke = np.asarray(ke_list)
+            size = ke.shape[1]
+            dofs = (np.asarray(elem_nodes)[:, :, None] * 6 + np.arange(6)).reshape(len(ke_list), size)
+            
+            rows.append(np.repeat(dofs, size, axis=1).ravel())
+            cols.append(np.tile(dofs, (1, size)).ravel())
+            vals.append(ke.ravel())
+        
+        if not rows:
+            return csr_matrix((n_dof, n_dof))
+        
+        # Duplicate (row, col) entries are summed during conversion
+        K = scipy.sparse.coo_matrix(
+            (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(n_dof, n_dof)
+        ).tocsr()
+        
+        return K
+    
+    def _concrete_elements(self, nodes, elements):
+        """(element nodes, volume in ft³) of the frame and slab groups; rigid links carry no concrete"""
+        frames = self._frame_element_arrays(nodes, elements)
+        concrete = frames['type'] != 'LINK'
+        # Stored sections, not the assembly placeholder of piles, so the pile volume follows πd²/4
+        area = PedestalMesh.of(nodes, elements).frames['A']
+        groups = [(np.column_stack([frames['n1'], frames['n2']])[concrete],
+                   area[concrete] / 144 * frames['L'][concrete])]
+        
+        shells = self._shell_element_arrays(nodes, elements)
+        corners = shells['coords']
+        area = 0.5 * np.linalg.norm(np.cross(corners[:, 2] - corners[:, 0], corners[:, 3] - corners[:, 1]), axis=1)
+        groups.append((shells['nodes'], area * shells['thickness']))
+        return groups
+    
+    def concrete_volume(self, nodes, elements):
+        """Concrete volume of piles, columns, beams and slabs in ft³"""
+        return float(sum(volume.sum() for _, volume in self._concrete_elements(nodes, elements)))
+    
+    def lumped_masses(self, nodes, elements):
+        """Self-weight masses (lb·s²/in) lumped equally to element nodes on the translational DOFs"""
+        node_mass = np.zeros(len(nodes))
+        for element_nodes, volume in self._concrete_elements(nodes, elements):
+            if len(volume):
+                mass = volume * 1728 * self.density / self.gravity
+                np.add.at(node_mass, element_nodes, (mass / element_nodes.shape[1])[:, None])
+        
+        masses = np.zeros((len(nodes), 6))
+        masses[:, :3] = node_mass[:, None]
+        return masses.ravel()
+    
+    def calculate_natural_frequencies(self, nodes, elements, n_modes=10, system=None):
+        """Lowest natural frequencies (Hz) from the factorized stiffness and self-weight masses"""
+        if system is None:
+            system = self.get_stiffness_system(nodes, elements)
+        return system.natural_frequencies(self.lumped_masses(nodes, elements), n_modes)
+    
     def _calculate_story_drifts(self, nodes, displacements):
         """Calculate story drifts for seismic compliance"""
         story_drifts = {}
@@ -1553,236 +2424,511 @@ class StructuralAnalysisEngine:
     def _calculate_joint_forces(self, nodes, elements, internal_forces, reactions):
         """Calculate resultant forces at each joint"""
         n_nodes = len(nodes)
-        joint_forces = {}
-        
-        for i in range(n_nodes):
-            joint_forces[i] = {
-                'fx': 0, 'fy': 0, 'fz': 0,
-                'mx': 0, 'my': 0, 'mz': 0,
-                'resultant_force': 0,
-                'resultant_moment': 0,
-                'max_shear': 0,
-                'max_moment': 0
-            }
+        forces = np.zeros((n_nodes, 6))
         
         # Add element end forces
-        for forces in internal_forces:
-            elem_type = forces.get('type', '')
-            if elem_type in ['COLUMN', 'BEAM', 'PILE']:
-                n1, n2 = forces['node1'], forces['node2']
-                
-                joint_forces[n1]['fx'] += forces.get('axial_force', 0)
-                joint_forces[n1]['fy'] += forces.get('shear_y', 0)
-                joint_forces[n1]['fz'] += forces.get('shear_z', 0)
-                joint_forces[n1]['mx'] += forces.get('torsion', 0)
-                joint_forces[n1]['my'] += forces.get('moment_y', 0)
-                joint_forces[n1]['mz'] += forces.get('moment_z', 0)
-                
-                joint_forces[n2]['fx'] += forces.get('axial_force_end', 0)
-                joint_forces[n2]['fy'] += forces.get('shear_y_end', 0)
-                joint_forces[n2]['fz'] += forces.get('shear_z_end', 0)
-                joint_forces[n2]['mx'] += forces.get('torsion_end', 0)
-                joint_forces[n2]['my'] += forces.get('moment_y_end', 0)
-                joint_forces[n2]['mz'] += forces.get('moment_z_end', 0)
+        frames = internal_forces[np.isin(internal_forces['type'], ['COLUMN', 'BEAM', 'PILE'])]
+        np.add.at(forces, frames['node1'], frames['end_forces'][:, :6])
+        np.add.at(forces, frames['node2'], frames['end_forces'][:, 6:])
         
         # Add reactions
-        for i in range(n_nodes):
-            idx = i * 6
-            if idx + 5 < len(reactions):
-                joint_forces[i]['fx'] += reactions[idx]
-                joint_forces[i]['fy'] += reactions[idx+1]
-                joint_forces[i]['fz'] += reactions[idx+2]
-                joint_forces[i]['mx'] += reactions[idx+3]
-                joint_forces[i]['my'] += reactions[idx+4]
-                joint_forces[i]['mz'] += reactions[idx+5]
-        
-        # Calculate resultants
-        for i in range(n_nodes):
-            fx, fy, fz = joint_forces[i]['fx'], joint_forces[i]['fy'], joint_forces[i]['fz']
-            mx, my, mz = joint_forces[i]['mx'], joint_forces[i]['my'], joint_forces[i]['mz']
-            
-            joint_forces[i]['resultant_force'] = math.sqrt(fx**2 + fy**2 + fz**2)
-            joint_forces[i]['resultant_moment'] = math.sqrt(mx**2 + my**2 + mz**2)
-            
-            shear = math.sqrt(fy**2 + fz**2)
-            moment = math.sqrt(my**2 + mz**2)
-            
-            joint_forces[i]['max_shear'] = shear
-            joint_forces[i]['max_moment'] = moment
+        reactions = np.asarray(reactions, dtype=float)
+        n_complete = min(n_nodes, len(reactions) // 6)
+        forces[:n_complete] += reactions[:n_complete * 6].reshape(-1, 6)
         
-        return joint_forces
+        return JointForces(forces)
     
     def _element_length(self, node1, node2):
         return math.sqrt((node2[0]-node1[0])**2 + (node2[1]-node1[1])**2 + (node2[2]-node1[2])**2)
     
     def _beam_stiffness_matrix(self, A, Ix, Iy, Iz, L, element_type='COLUMN'):
         """Beam element stiffness matrix"""
+        return self._beam_stiffness_batch([A], [Ix], [Iy], [Iz], [L], [element_type == 'PILE'])[0]
+    
+    def _beam_stiffness_batch(self, A, Ix, Iy, Iz, L, is_pile):
+        """Beam element stiffness matrices for arrays of sections, shape (n_elem, 12, 12)
+        
+        Sections are in in² and in⁴ and lengths in ft; like the shell kernel the
+        element is formed in inches and psi, so K is in lb/in and lb-in/rad.
+        """
+        A, Ix, Iy, Iz, L = (np.asarray(v, dtype=float).ravel() for v in (A, Ix, Iy, Iz, L))
+        is_pile = np.asarray(is_pile, dtype=bool).ravel()
+        
         E = self.E
         G = E / (2 * (1 + self.nu))
         
-        if L == 0:
-            return np.zeros((12, 12))
+        ke = np.zeros((len(L), 12, 12))
+        if len(L) == 0:
+            return ke
         
-        ke = np.zeros((12, 12))
+        # Zero-length elements get a zero matrix
+        valid = L != 0
+        L = np.where(valid, L, 1.0) * 12
         
-        # Axial
         EA_L = E * A / L
-        ke[0, 0] = ke[6, 6] = EA_L
-        ke[0, 6] = ke[6, 0] = -EA_L
-        
-        # Torsion
         GJ_L = G * Iz / L
-        ke[3, 3] = ke[9, 9] = GJ_L
-        ke[3, 9] = ke[9, 3] = -GJ_L
-        
-        # Bending Y
-        EIy_L3 = E * Iy / L**3
-        ke[1, 1] = ke[7, 7] = 12 * EIy_L3
-        ke[1, 7] = ke[7, 1] = -12 * EIy_L3
-        ke[1, 5] = ke[5, 1] = ke[7, 11] = ke[11, 7] = -6 * E * Iy / L**2
-        ke[5, 7] = ke[7, 5] = ke[1, 11] = ke[11, 1] = 6 * E * Iy / L**2
-        ke[5, 5] = ke[11, 11] = 4 * E * Iy / L
-        ke[5, 11] = ke[11, 5] = 2 * E * Iy / L
-        
-        # Bending Z
-        EIz_L3 = E * Ix / L**3
-        ke[2, 2] = ke[8, 8] = 12 * EIz_L3
-        ke[2, 8] = ke[8, 2] = -12 * EIz_L3
-        ke[2, 4] = ke[4, 2] = ke[8, 10] = ke[10, 8] = 6 * E * Ix / L**2
-        ke[4, 8] = ke[8, 4] = ke[2, 10] = ke[10, 2] = -6 * E * Ix / L**2
-        ke[4, 4] = ke[10, 10] = 4 * E * Ix / L
-        ke[4, 10] = ke[10, 4] = 2 * E * Ix / L
+        
+        # Bending Y uses Iy, bending Z uses Ix (same convention as before)
+        ky = [12 * E * Iy / L**3, 6 * E * Iy / L**2, 4 * E * Iy / L, 2 * E * Iy / L]
+        kz = [12 * E * Ix / L**3, 6 * E * Ix / L**2, 4 * E * Ix / L, 2 * E * Ix / L]
+        
+        # Upper-triangle (row, col, value) terms of the 12x12 matrix
+        terms = [
+            # Axial
+            (0, 0, EA_L), (6, 6, EA_L), (0, 6, -EA_L),
+            # Torsion
+            (3, 3, GJ_L), (9, 9, GJ_L), (3, 9, -GJ_L),
+            # Bending Y: translation 1 with rotation 5 (right-handed, theta_z = dv/dx)
+            (1, 1, ky[0]), (7, 7, ky[0]), (1, 7, -ky[0]),
+            (1, 5, ky[1]), (7, 11, -ky[1]), (5, 7, -ky[1]), (1, 11, ky[1]),
+            (5, 5, ky[2]), (11, 11, ky[2]), (5, 11, ky[3]),
+            # Bending Z: translation 2 with rotation 4 (right-handed, theta_y = -dw/dx)
+            (2, 2, kz[0]), (8, 8, kz[0]), (2, 8, -kz[0]),
+            (2, 4, -kz[1]), (8, 10, kz[1]), (4, 8, kz[1]), (2, 10, -kz[1]),
+            (4, 4, kz[2]), (10, 10, kz[2]), (4, 10, kz[3]),
+        ]
+        rows = [term[0] for term in terms]
+        cols = [term[1] for term in terms]
+        values = np.column_stack([term[2] for term in terms]) * valid[:, None]
+        
+        ke[:, rows, cols] = values
+        ke[:, cols, rows] = values
         
         # Soil springs for PILE elements
-        if element_type == 'PILE':
-            if A > 0:
-                diameter = math.sqrt(4 * A / math.pi)
-                k_z = self.modulus_subgrade_z * diameter * self.pile_soil_spring_factor
-                k_xy = self.modulus_subgrade_xy * diameter * self.pile_soil_spring_factor
-                
-                ke[8, 8] += k_z * L / 2
-                ke[6, 6] += k_xy * L / 2
-                ke[7, 7] += k_xy * L / 2
-                
-                ke[9, 9] += k_xy * L**3 / 12
-                ke[10, 10] += k_xy * L**3 / 12
-                ke[11, 11] += k_xy * L**3 / 12
+        pile = is_pile & valid & (A > 0)
+        if np.any(pile):
+            diameter = np.sqrt(4 * A[pile] / math.pi)
+            k_z = self.modulus_subgrade_z * diameter * self.pile_soil_spring_factor
+            k_xy = self.modulus_subgrade_xy * diameter * self.pile_soil_spring_factor
+            L_pile = L[pile]
+            
+            spring_rows = [8, 6, 7, 9, 10, 11]
+            springs = np.column_stack([k_z * L_pile / 2, k_xy * L_pile / 2, k_xy * L_pile / 2,
+                                       k_xy * L_pile**3 / 12, k_xy * L_pile**3 / 12, k_xy * L_pile**3 / 12])
+            ke[np.ix_(np.nonzero(pile)[0], spring_rows, spring_rows)] += springs[:, :, None] * np.eye(6)
         
         return ke
     
-    def _shell_stiffness_matrix_quad(self, n1, n2, n3, n4, thickness):
-        """Quadrilateral shell stiffness"""
-        E = self.E
-        nu = self.nu
-        t = thickness
-        
-        # Average area
-        x1, y1, z1 = n1
-        x2, y2, z2 = n2
-        x3, y3, z3 = n3
-        x4, y4, z4 = n4
-        
-        A1 = 0.5 * abs((x2-x1)*(y3-y1) - (x3-x1)*(y2-y1))
-        A2 = 0.5 * abs((x3-x1)*(y4-y1) - (x4-x1)*(y3-y1))
-        A = (A1 + A2) / 2
-        
-        if A == 0:
-            return np.zeros((24, 24))
+    def _frame_stiffness(self, frames):
+        """Element stiffness stack for frame arrays, reusing cached matrices of identical elements"""
+        is_pile = frames['type'] == 'PILE'
+        keys = np.column_stack([is_pile, frames['A'], frames['Ix'], frames['Iy'], frames['Iz'], frames['L']])
+        if len(keys) == 0:
+            return np.zeros((0, 12, 12))
+        
+        unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        material = (self.E, self.nu, self.modulus_subgrade_z, self.modulus_subgrade_xy,
+                    self.pile_soil_spring_factor)
+        cache_keys = [material + tuple(row) for row in unique_keys.tolist()]
+        
+        def compute(missing):
+            rows = unique_keys[missing]
+            new_ke = self._beam_stiffness_batch(rows[:, 1], rows[:, 2], rows[:, 3], rows[:, 4],
+                                                rows[:, 5], rows[:, 0] > 0)
+            self._check_positive_semidefinite(new_ke, 'frame')
+            return new_ke
+        
+        return self._cached_element_stiffness(cache_keys, compute)[np.ravel(inverse)]
+    
+    def _cached_element_stiffness(self, cache_keys, compute):
+        """Matrices for cache_keys, calling compute(missing positions) for the ones not cached yet"""
+        cache = self.element_stiffness_cache
+        missing = [i for i, key in enumerate(cache_keys) if key not in cache]
+        if missing:
+            for i, ke in zip(missing, compute(missing)):
+                cache[cache_keys[i]] = ke
+        
+        for key in cache_keys:
+            cache.move_to_end(key)
+        unique_ke = np.array([cache[key] for key in cache_keys])
+        
+        # Bounded so long sessions and sweeps over many meshes do not grow it without limit
+        while len(cache) > ELEMENT_STIFFNESS_CACHE_SIZE:
+            cache.popitem(last=False)
+        return unique_ke
+    
+    @staticmethod
+    def _check_positive_semidefinite(ke, kind):
+        """Reject element matrices that are not symmetric positive semidefinite
+        
+        The global matrix is a sum of such matrices plus positive springs, so
+        the conditioned free system is SPD and CG applies to it.
+        """
+        if len(ke) == 0:
+            return
+        if not np.allclose(ke, ke.transpose(0, 2, 1), rtol=1e-10, atol=0.0):
+            raise ValueError(f"Asymmetric {kind} element stiffness matrix")
+        eigenvalues = np.linalg.eigvalsh(ke)
+        scale = np.abs(eigenvalues).max(axis=1)
+        if np.any(eigenvalues[:, 0] < -1e-9 * scale):
+            raise ValueError(f"Indefinite {kind} element stiffness matrix "
+                             f"(minimum eigenvalue {eigenvalues[:, 0].min():.3e})")
+    
+    def set_soil_properties(self, modulus_subgrade_z, modulus_subgrade_xy, spring_factor):
+        """Update pile soil springs and invalidate cached element stiffness if they changed"""
+        soil = (float(modulus_subgrade_z), float(modulus_subgrade_xy), float(spring_factor))
+        if soil != (self.modulus_subgrade_z, self.modulus_subgrade_xy, self.pile_soil_spring_factor):
+            self.element_stiffness_cache.clear()
+        self.modulus_subgrade_z, self.modulus_subgrade_xy, self.pile_soil_spring_factor = soil
+    
+    def _frame_element_arrays(self, nodes, elements):
+        """Connectivity and section properties of all frame elements as NumPy arrays"""
+        frames = PedestalMesh.of(nodes, elements).frames
+        coords = np.asarray(nodes, dtype=float).reshape(-1, 3)
+        n1, n2 = frames['n1'].astype(int), frames['n2'].astype(int)
         
-        D = E * t**3 / (12 * (1 - nu**2))
-        ke = np.eye(24) * D * A * 100
+        # Piles carry a diameter instead of width and depth and are assembled with the default section
+        sections = np.column_stack([frames['A'], frames['Ix'], frames['Iy'], frames['Iz']])
+        sections[frames['type'] == FRAME_ELEMENT_TYPES.index('PILE')] = 100
         
+        return {
+            'index': frames['index'].astype(int),
+            'type': np.array(FRAME_ELEMENT_TYPES, dtype='U6')[frames['type']],
+            'n1': n1,
+            'n2': n2,
+            'A': sections[:, 0],
+            'Ix': sections[:, 1],
+            'Iy': sections[:, 2],
+            'Iz': sections[:, 3],
+            'L': np.linalg.norm(coords[n2] - coords[n1], axis=1),
+            'width': frames['width'].copy(),
+            'depth': frames['depth'].copy(),
+        }
+    
+    def _shell_stiffness_matrix_quad(self, n1, n2, n3, n4, thickness):
+        """Quadrilateral shell stiffness"""
+        return self._shell_stiffness_batch(np.array([[n1, n2, n3, n4]], dtype=float), [thickness])[0]
+    
+    def _shell_frames(self, coords):
+        """Local element axes (rows e1, e2, normal) and in-plane node coordinates of quads"""
+        e1 = coords[:, 1] - coords[:, 0]
+        normal = np.cross(coords[:, 2] - coords[:, 0], coords[:, 3] - coords[:, 1])
+        e1_norm = np.linalg.norm(e1, axis=1)
+        normal_norm = np.linalg.norm(normal, axis=1)
+        
+        valid = (e1_norm > 0) & (normal_norm > 0)
+        e1 = e1 / np.where(valid, e1_norm, 1.0)[:, None]
+        normal = normal / np.where(valid, normal_norm, 1.0)[:, None]
+        e2 = np.cross(normal, e1)
+        
+        R = np.stack([e1, e2, normal], axis=1)
+        local_xy = np.einsum('nij,nkj->nki', R[:, :2], coords - coords[:, :1])
+        return R, local_xy, valid
+    
+    @staticmethod
+    def _shell_jacobian(local_xy, xi, eta):
+        """Natural shape function derivatives (2, 4) and Jacobians (n, 2, 2) of quads at one point"""
+        dN_dnat = 0.25 * np.array([[-(1 - eta), (1 - eta), (1 + eta), -(1 + eta)],
+                                   [-(1 - xi), -(1 + xi), (1 + xi), (1 - xi)]])
+        return dN_dnat, np.einsum('ak,nkb->nab', dN_dnat, local_xy)
+    
+    def _shell_shape_derivatives(self, local_xy, xi, eta):
+        """Shape functions, Cartesian derivatives (n, 2, 4) and |det J| of quads at one point"""
+        N = 0.25 * np.array([(1 - xi) * (1 - eta), (1 + xi) * (1 - eta),
+                             (1 + xi) * (1 + eta), (1 - xi) * (1 + eta)])
+        dN_dnat, J = self._shell_jacobian(local_xy, xi, eta)
+        det_J = np.linalg.det(J)
+        singular = np.abs(det_J) < 1e-12
+        J[singular] = np.eye(2)
+        dN_dxy = np.linalg.solve(J, np.broadcast_to(dN_dnat, J.shape[:1] + dN_dnat.shape))
+        return N, dN_dxy, np.where(singular, 0.0, np.abs(det_J))
+    
+    def _shell_b_matrices(self, N, dN_dxy):
+        """Membrane, bending and transverse shear strain-displacement matrices in local axes"""
+        n = len(dN_dxy)
+        dN_dx, dN_dy = dN_dxy[:, 0], dN_dxy[:, 1]
+        
+        # Local DOFs per node: u, v, w, theta_x, theta_y, theta_z (columns 6*a + dof)
+        B_m = np.zeros((n, 3, 4, 6))
+        B_m[:, 0, :, 0] = dN_dx
+        B_m[:, 1, :, 1] = dN_dy
+        B_m[:, 2, :, 0] = dN_dy
+        B_m[:, 2, :, 1] = dN_dx
+        
+        # Curvatures: kx = d(theta_y)/dx, ky = -d(theta_x)/dy, kxy = d(theta_y)/dy - d(theta_x)/dx
+        B_b = np.zeros((n, 3, 4, 6))
+        B_b[:, 0, :, 4] = dN_dx
+        B_b[:, 1, :, 3] = -dN_dy
+        B_b[:, 2, :, 4] = dN_dy
+        B_b[:, 2, :, 3] = -dN_dx
+        
+        # Shear strains: gxz = dw/dx + theta_y, gyz = dw/dy - theta_x
+        B_s = np.zeros((n, 2, 4, 6))
+        B_s[:, 0, :, 2] = dN_dx
+        B_s[:, 0, :, 4] = N
+        B_s[:, 1, :, 2] = dN_dy
+        B_s[:, 1, :, 3] = -N
+        
+        return B_m.reshape(n, 3, 24), B_b.reshape(n, 3, 24), B_s.reshape(n, 2, 24)
+    
+    def _shell_assumed_shear(self, local_xy, points):
+        """MITC4 transverse shear strain-displacement matrices (n, 2, 24) at natural points
+        
+        Covariant shear strains are tied at the edge midpoints and interpolated
+        across the element, which avoids shear locking without the zero-energy
+        hourglass modes of one-point shear integration.
+        """
+        def covariant(xi, eta, direction):
+            N, dN_dxy, _ = self._shell_shape_derivatives(local_xy, xi, eta)
+            _, _, B_s = self._shell_b_matrices(N, dN_dxy)
+            _, J = self._shell_jacobian(local_xy, xi, eta)
+            return np.einsum('nb,nbj->nj', J[:, direction], B_s)
+        
+        # gamma_xi tied on the edges eta = -1, +1 and gamma_eta on the edges xi = -1, +1
+        xi_bottom, xi_top = covariant(0.0, -1.0, 0), covariant(0.0, 1.0, 0)
+        eta_left, eta_right = covariant(-1.0, 0.0, 1), covariant(1.0, 0.0, 1)
+        
+        B_s = []
+        for xi, eta in points:
+            gamma = np.stack([0.5 * (1 - eta) * xi_bottom + 0.5 * (1 + eta) * xi_top,
+                              0.5 * (1 - xi) * eta_left + 0.5 * (1 + xi) * eta_right], axis=1)
+            _, J = self._shell_jacobian(local_xy, xi, eta)
+            J[np.abs(np.linalg.det(J)) < 1e-12] = np.eye(2)
+            B_s.append(np.linalg.solve(J, gamma))
+        return B_s
+    
+    def _shell_constitutive(self, t):
+        """Membrane, bending and shear rigidity matrices for thicknesses t (in)"""
+        E, nu = self.E, self.nu
+        G = E / (2 * (1 + nu))
+        plane_stress = np.array([[1, nu, 0], [nu, 1, 0], [0, 0, (1 - nu) / 2]]) / (1 - nu**2)
+        
+        D_m = E * t[:, None, None] * plane_stress
+        D_b = E * t[:, None, None]**3 / 12 * plane_stress
+        D_s = 5 / 6 * G * t[:, None, None] * np.eye(2)
+        return D_m, D_b, D_s
+    
+    def _shell_stiffness_batch(self, coords, thickness):
+        """Mindlin quad shell stiffness matrices, shape (n_elem, 24, 24) in global axes
+        
+        Membrane, bending and MITC4 assumed transverse shear use 2x2 Gauss
+        points. Coordinates and thickness are in ft; like the frame kernel the
+        element is formed in inches and psi.
+        """
+        coords = np.asarray(coords, dtype=float).reshape(-1, 4, 3) * 12
+        t = np.asarray(thickness, dtype=float).ravel() * 12
+        n = len(coords)
+        if n == 0:
+            return np.zeros((0, 24, 24))
+        
+        R, local_xy, valid = self._shell_frames(coords)
+        D_m, D_b, D_s = self._shell_constitutive(t)
+        
+        ke = np.zeros((n, 24, 24))
+        gauss = 1 / math.sqrt(3)
+        points = ((-gauss, -gauss), (gauss, -gauss), (gauss, gauss), (-gauss, gauss))
+        for (xi, eta), B_s in zip(points, self._shell_assumed_shear(local_xy, points)):
+            N, dN_dxy, det_J = self._shell_shape_derivatives(local_xy, xi, eta)
+            B_m, B_b, _ = self._shell_b_matrices(N, dN_dxy)
+            ke += (B_m.transpose(0, 2, 1) @ (D_m @ B_m)) * det_J[:, None, None]
+            ke += (B_b.transpose(0, 2, 1) @ (D_b @ B_b)) * det_J[:, None, None]
+            ke += (B_s.transpose(0, 2, 1) @ (D_s @ B_s)) * det_J[:, None, None]
+        
+        # Rotate from local to global axes: T^T ke T with T = blockdiag(R, ..., R)
+        T = np.zeros((n, 8, 3, 8, 3))
+        T[:, np.arange(8), :, np.arange(8), :] = R
+        T = T.reshape(n, 24, 24)
+        ke = T.transpose(0, 2, 1) @ ke @ T
+        ke[~valid | (t <= 0)] = 0.0
         return ke
     
+    def _shell_stiffness(self, shells):
+        """Shell stiffness stack, computing one matrix per group of congruent quads"""
+        coords, thickness = shells['coords'], shells['thickness']
+        if len(coords) == 0:
+            return np.zeros((0, 24, 24))
+        
+        # Quads with the same in-plane shape, orientation and thickness share one matrix
+        R, local_xy, _ = self._shell_frames(coords)
+        keys = np.column_stack([np.round(local_xy.reshape(-1, 8), 6), np.round(R.reshape(-1, 9), 9),
+                                np.round(thickness, 6)])
+        unique_keys, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+        material = ('SHELL', self.E, self.nu)
+        cache_keys = [material + tuple(row) for row in unique_keys.tolist()]
+        
+        def compute(missing):
+            new_ke = self._shell_stiffness_batch(coords[first[missing]], thickness[first[missing]])
+            self._check_positive_semidefinite(new_ke, 'shell')
+            return new_ke
+        
+        return self._cached_element_stiffness(cache_keys, compute)[np.ravel(inverse)]
+    
+    def _shell_element_arrays(self, nodes, elements):
+        """Connectivity, corner coordinates and thickness of all quad SHELL elements"""
+        shells = PedestalMesh.of(nodes, elements).shells
+        coords = np.asarray(nodes, dtype=float).reshape(-1, 3)
+        connectivity = shells['nodes'].astype(int).reshape(-1, 4)
+        
+        return {
+            'index': shells['index'].astype(int),
+            'nodes': connectivity,
+            'coords': coords[connectivity],
+            'thickness': shells['thickness'].copy(),
+        }
+    
     def _calculate_internal_forces(self, nodes, elements, displacements):
-        """Calculate internal forces for elements"""
-        internal_forces = []
-        
-        for elem in elements:
-            elem_type = elem[0]
-            
-            if elem_type in ['COLUMN', 'BEAM', 'PILE', 'LINK']:
-                n1, n2 = elem[2], elem[3]
-                if len(elem) >= 10:
-                    A, Ix, Iy, Iz = elem[4], elem[5], elem[6], elem[7]
-                else:
-                    A, Ix, Iy, Iz = 100, 100, 100, 100
-                    
-                L = self._element_length(nodes[n1], nodes[n2])
-                ke = self._beam_stiffness_matrix(A, Ix, Iy, Iz, L, elem_type)
-                
-                elem_disp = np.concatenate([
-                    displacements[n1*6:n1*6+6],
-                    displacements[n2*6:n2*6+6]
-                ])
-                
-                forces = ke @ elem_disp
-                
-                internal_forces.append({
-                    'element': elem,
-                    'node1': n1,
-                    'node2': n2,
-                    'type': elem_type,
-                    'axial_force': forces[0],
-                    'shear_y': forces[1],
-                    'shear_z': forces[2],
-                    'shear_resultant': math.sqrt(forces[1]**2 + forces[2]**2),
-                    'torsion': forces[3],
-                    'moment_y': forces[4],
-                    'moment_z': forces[5],
-                    'moment_resultant': math.sqrt(forces[4]**2 + forces[5]**2),
-                    'axial_force_end': forces[6],
-                    'shear_y_end': forces[7],
-                    'shear_z_end': forces[8],
-                    'torsion_end': forces[9],
-                    'moment_y_end': forces[10],
-                    'moment_z_end': forces[11],
-                    'length': L,
-                    'width': elem[8] if len(elem) > 8 else 0,
-                    'depth': elem[9] if len(elem) > 9 else 0
-                })
-            
-            elif elem_type == 'SHELL':
-                # For quad elements
-                if len(elem) >= 6:
-                    n1, n2, n3, n4 = elem[2], elem[3], elem[4], elem[5]
-                    disp1 = displacements[n1*6:n1*6+6]
-                    disp2 = displacements[n2*6:n2*6+6]
-                    disp3 = displacements[n3*6:n3*6+6]
-                    disp4 = displacements[n4*6:n4*6+6]
-                    
-                    avg_disp = (disp1 + disp2 + disp3 + disp4) / 4
-                    
-                    internal_forces.append({
-                        'element': elem,
-                        'nodes': [n1, n2, n3, n4],
-                        'type': 'SHELL_QUAD',
-                        'avg_displacement': avg_disp[:3],
-                        'avg_rotation': avg_disp[3:],
-                        'membrane_force': 0,
-                        'bending_moment': 0
-                    })
+        """Calculate frame element end forces as a FRAME_FORCE_DTYPE structured array"""
+        frames = self._frame_element_arrays(nodes, elements)
+        frame_ke = self._frame_stiffness(frames)
+        
+        # Gather element end displacements with one fancy index into (n_elem, 12)
+        frame_dofs = np.concatenate([frames['n1'][:, None] * 6 + np.arange(6),
+                                     frames['n2'][:, None] * 6 + np.arange(6)], axis=1)
+        elem_disp = np.asarray(displacements)[frame_dofs]
+        
+        internal_forces = np.zeros(len(frames['index']), dtype=FRAME_FORCE_DTYPE)
+        internal_forces['element'] = frames['index']
+        internal_forces['type'] = frames['type']
+        internal_forces['node1'] = frames['n1']
+        internal_forces['node2'] = frames['n2']
+        internal_forces['length'] = frames['L']
+        internal_forces['width'] = frames['width']
+        internal_forces['depth'] = frames['depth']
+        internal_forces['end_forces'] = np.einsum('eij,ej->ei', frame_ke, elem_disp)
         
         return internal_forces
+    
+    def _calculate_shell_forces(self, nodes, elements, displacements):
+        """Calculate centroid membrane forces and bending moments of shell quads as a SHELL_FORCE_DTYPE array"""
+        shells = self._shell_element_arrays(nodes, elements)
+        if len(shells['index']) == 0:
+            return np.zeros(0, dtype=SHELL_FORCE_DTYPE)
+        
+        coords = shells['coords'] * 12
+        t = shells['thickness'] * 12
+        R, local_xy, _ = self._shell_frames(coords)
+        D_m, D_b, _ = self._shell_constitutive(t)
+        
+        # Element nodal displacements rotated into local axes, (n_elem, 24)
+        elem_disp = np.asarray(displacements)[shells['nodes'][:, :, None] * 6 + np.arange(6)]
+        local_disp = np.einsum('nij,nakj->naki', R, elem_disp.reshape(-1, 4, 2, 3)).reshape(-1, 24)
+        
+        N, dN_dxy, _ = self._shell_shape_derivatives(local_xy, 0.0, 0.0)
+        B_m, B_b, _ = self._shell_b_matrices(N, dN_dxy)
+        membrane = np.einsum('nij,njk,nk->ni', D_m, B_m, local_disp)
+        bending = np.einsum('nij,njk,nk->ni', D_b, B_b, local_disp)
+        
+        avg_disp = elem_disp.mean(axis=1)
+        
+        shell_forces = np.zeros(len(shells['index']), dtype=SHELL_FORCE_DTYPE)
+        shell_forces['element'] = shells['index']
+        shell_forces['nodes'] = shells['nodes']
+        shell_forces['displacement'] = avg_disp[:, :3]
+        shell_forces['rotation'] = avg_disp[:, 3:]
+        shell_forces['membrane'] = membrane
+        shell_forces['bending'] = bending
+        
+        return shell_forces
 
-# --- 3. MAIN APPLICATION WITH ENHANCED FEATURES ---
-class TurbinePedestalDesigner:
-    def __init__(self, root):
+# --- BACKGROUND ANALYSIS JOBS ---
+class AnalysisCancelled(Exception):
+    pass
+
+class AnalysisJobRunner:
+    def __init__(self, root, on_progress, on_idle=None, poll_interval=100):
         self.root = root
-        self.root.title("Advanced Turbine Pedestals Designer - WS-SOFTWARE LLC")
-        self.root.geometry("1400x950")
+        self.on_progress = on_progress
+        self.on_idle = on_idle
+        self.poll_interval = poll_interval
+        self.messages = queue.Queue()
+        self.cancel_requested = threading.Event()
+        self.thread = None
+        self.active = False
+        self.polling = False
+        self.label = ''
+    
+    def busy(self):
+        """True from start() until the job's final message has been dispatched on the Tk thread"""
+        return self.active
+    
+    def start(self, label, work, on_done, on_error=None):
+        """Run work(progress) on a worker thread and on_done(result) back on the Tk thread"""
+        if self.busy():
+            raise RuntimeError(f"'{self.label}' is still running")
+        
+        self.label = label
+        self.on_done = on_done
+        self.on_error = on_error
+        self.cancel_requested.clear()
+        self.active = True
+        self.thread = threading.Thread(target=self._run, args=(work,), daemon=True)
+        self.thread.start()
+        
+        if not self.polling:
+            self.polling = True
+            self.root.after(self.poll_interval, self._poll)
+    
+    def progress(self, message, fraction=None):
+        """Progress callback for the worker thread; raises AnalysisCancelled after cancel()"""
+        if self.cancel_requested.is_set():
+            raise AnalysisCancelled(self.label)
+        self.messages.put(('progress', message, fraction))
+    
+    def cancel(self):
+        """Ask the running job to stop at its next progress report"""
+        self.cancel_requested.set()
+    
+    def _run(self, work):
+        try:
+            self.messages.put(('done', work(self.progress), None))
+        except AnalysisCancelled:
+            self.messages.put(('cancelled', None, None))
+        except Exception as e:
+            traceback.print_exc()
+            self.messages.put(('error', e, None))
+    
+    def _poll(self):
+        """Forward queued worker messages to the Tk thread
         
+        Polling is rescheduled even if a callback raises, so jobs queued after a
+        failing callback still run; Tk reports the exception itself.
+        """
+        try:
+            while True:
+                try:
+                    kind, payload, fraction = self.messages.get_nowait()
+                except queue.Empty:
+                    break
+                
+                if kind == 'progress':
+                    self.on_progress(f"{self.label}: {payload}", fraction)
+                    continue
+                
+                # The final message is the worker's last action, so the join returns at once.
+                # The job stays busy until here, so its callbacks may start the next job.
+                self.thread.join()
+                label, on_done, on_error = self.label, self.on_done, self.on_error
+                self.active = False
+                if kind == 'cancelled':
+                    self.on_progress(f"{label} cancelled", None)
+                elif kind == 'error':
+                    if on_error:
+                        on_error(payload)
+                    else:
+                        messagebox.showerror("Error", f"{label} failed: {payload}")
+                elif kind == 'done':
+                    on_done(payload)
+        finally:
+            if self.busy() or not self.messages.empty():
+                self.root.after(self.poll_interval, self._poll)
+            else:
+                self.polling = False
+                if self.on_idle:
+                    self.on_idle()
+
+# --- 3. MAIN APPLICATION WITH ENHANCED FEATURES ---
+class PedestalDesignModel:
+    def __init__(self):
+        # Model state shared by the GUI and the batch designer
         self.engine = StructuralAnalysisEngine()
         self.design_calc = ACIDesignCalculator()
         self.nodes = []
         self.elements = []
         self.load_cases = {}
         self.load_cases_applied = {}
-        self.load_combos = {}
         self.results = {}
         self.design_results = {}
         self.mesh_size = 2.0  # Default 2ft x 2ft mesh
-        self.clipboard = None
         
         # Geometry data
         self.mat_points = []
@@ -1792,11 +2938,408 @@ class TurbinePedestalDesigner:
         self.pile_lines = []
         self.beam_lines = []
         
-        # Special load cases
+        # Special load cases and combinations
         self.special_load_cases = SPECIAL_LOAD_CASES.copy()
+        self.custom_combinations = {}
         
         # Seismic parameters
         self.seismic_zone = 'C'
+    
+    # --- ENGINE SETTINGS ---
+    def apply_engine_settings(self):
+        """Push soil, solver and seismic settings from the inputs to the analysis engine"""
+        # Update engine with soil properties from UI
+        self.engine.set_soil_properties(self.soil_kz_val.get(),
+                                        self.soil_kxy_val.get(),
+                                        self.spring_factor_val.get())
+        
+        # Update linear solver settings
+        self.engine.solver = self.solver_val.get()
+        self.engine.solver_preconditioner = self.preconditioner_val.get()
+        self.engine.solver_tolerance = float(self.solver_tol_val.get())
+        self.engine.solver_max_iterations = int(self.solver_maxiter_val.get())
+        self.engine.parallel_workers = int(self.parallel_workers_val.get())
+        self.engine.dof_ordering = self.dof_ordering_val.get()
+        
+        # Update seismic parameters
+        self.engine.seismic_engine.zone = self.seismic_zone
+        self.engine.seismic_engine.site_class = self.site_class.get()
+    
+    # --- LOAD CASES ---
+    def create_auto_loads(self):
+        """Create automatic dead and live loads including special loads"""
+        self.load_cases_applied = {}
+        n_nodes = len(self.nodes)
+        
+        # Add automatic loads
+        auto_loads = self.calculate_auto_loads()
+        self.load_cases_applied['AUTO_DL+LL'] = self.engine.load_case_array(auto_loads, n_nodes)
+        
+        # Top nodes receive the user-defined loads
+        top_nodes = np.array([], dtype=int)
+        if len(self.nodes):
+            z_coords = np.array([node[2] for node in self.nodes])
+            top_nodes = np.nonzero(np.abs(z_coords - z_coords.max()) < 0.1)[0]
+        
+        # Add user-defined loads as (n_nodes, 6) arrays
+        for case_name, load_data in self.load_cases.items():
+            loads = np.zeros((n_nodes, 6))
+            loads[top_nodes, :3] = [load_data['fx'], load_data['fy'], load_data['fz']]
+            self.load_cases_applied[case_name] = loads
+        
+        # Add special load cases
+        special_loads = self.apply_special_load_cases()
+        self.load_cases_applied.update(special_loads)
+        
+        print(f"Created {len(self.load_cases_applied)} load cases including special loads")
+    
+    def calculate_auto_loads(self):
+        """Calculate automatic dead and live loads"""
+        loads = []
+        
+        if len(self.nodes) == 0:
+            return loads
+        
+        # Material properties
+        concrete_density = 150  # lb/ft³
+        
+        # Calculate self-weight of slabs for all quads at once
+        shells = PedestalMesh.of(self.nodes, self.elements).shells
+        shells = shells[np.all(shells['nodes'] < len(self.nodes), axis=1)]
+        coords = np.asarray(self.nodes, dtype=float).reshape(-1, 3)
+        (x1, y1), (x2, y2), (x3, y3), (x4, y4) = coords[shells['nodes'], :2].transpose(1, 2, 0)
+        
+        # Quad area as the sum of triangles (n1, n2, n3) and (n1, n3, n4)
+        area1 = 0.5 * np.abs((x2-x1)*(y3-y1) - (x3-x1)*(y2-y1))
+        area2 = 0.5 * np.abs((x3-x1)*(y4-y1) - (x4-x1)*(y3-y1))
+        area = area1 + area2
+        
+        # Self-weight (in lb) distributed to the 4 nodes, negative for downward
+        self_weight = area * shells['thickness'] * concrete_density
+        load_per_node = np.repeat(-self_weight / 4, 4)
+        loads.extend((node, 0, 0, load, 0, 0, 0)
+                     for node, load in zip(shells['nodes'].ravel().tolist(), load_per_node.tolist()))
+        
+        # Add additional dead and live loads to top nodes
+        top_z = max([node[2] for node in self.nodes])
+        top_nodes = [i for i, node in enumerate(self.nodes) if abs(node[2] - top_z) < 0.1]
+        
+        if top_nodes:
+            # Estimate tributary area per node
+            avg_area = 100  # ft² (simplified)
+            
+            dead_load = 20 * avg_area * 1.2  # 20 psf DL
+            live_load = 50 * avg_area * 1.6  # 50 psf LL
+            
+            total_load = -(dead_load + live_load)  # Downward
+            
+            for node in top_nodes:
+                loads.append((node, 0, 0, total_load/len(top_nodes), 0, 0, 0))
+        
+        print(f"  Generated {len(loads)} load entries")
+        return loads
+    
+    def apply_special_load_cases(self):
+        """Apply special load cases to the structure"""
+        special_loads = {}
+        n_nodes = len(self.nodes)
+        coords = np.array(self.nodes, dtype=float).reshape(-1, 3)
+        node_index = None  # KD-tree built on the first coordinate-placed load
+        
+        for case_name, case_data in self.special_load_cases.items():
+            target_nodes = []
+            
+            # Parse coordinates
+            try:
+                coords_text = case_data['coordinates']
+                force = [case_data['fx'], case_data['fy'], case_data['fz']]
+                
+                if coords_text == "Applied at all structural mass locations":
+                    # Apply to all nodes (for seismic)
+                    target_nodes = np.arange(n_nodes)
+                elif coords_text == "All structural elements":
+                    # Apply to all elements (for thermal)
+                    target_nodes = np.arange(n_nodes)
+                elif coords_text == "Mat foundation (distributed)":
+                    # Apply to mat nodes
+                    mat_z = float(self.mat_z.get())
+                    target_nodes = np.nonzero(np.abs(coords[:, 2] - mat_z) < 1.0)[0]
+                elif coords_text == "Roof and exposed surfaces":
+                    # Apply to top nodes
+                    top_z = coords[:, 2].max()
+                    target_nodes = np.nonzero(np.abs(coords[:, 2] - top_z) < 1.0)[0]
+                else:
+                    # Specific coordinates
+                    coord_parts = coords_text.split(',')
+                    if len(coord_parts) >= 3:
+                        point = np.array([float(part.strip()) for part in coord_parts[:3]])
+                        
+                        # Find nearest node within 5 ft
+                        if node_index is None:
+                            node_index = self.engine._node_index(coords)
+                        nearest_node, _ = self.engine._nearest_node(node_index, point, 5.0)
+                        
+                        if nearest_node != -1:
+                            target_nodes = [nearest_node]
+            except:
+                continue
+            
+            if len(target_nodes):
+                loads = np.zeros((n_nodes, 6))
+                loads[target_nodes, :3] = force
+                special_loads[case_name] = loads
+        
+        return special_loads
+    
+    def get_combination_factors(self, combo_id):
+        """Return load factors of a hard-coded, custom or ACI table combination"""
+        if combo_id in LOAD_COMBINATION_FACTORS:
+            return LOAD_COMBINATION_FACTORS[combo_id]
+        
+        custom_combinations = getattr(self, 'custom_combinations', {})
+        if combo_id in custom_combinations:
+            return parse_combination_formula(custom_combinations[combo_id]['formula'],
+                                             self.load_cases_applied)
+        
+        if combo_id in ACI_LOAD_COMBINATIONS:
+            return parse_combination_formula(ACI_LOAD_COMBINATIONS[combo_id]['formula'],
+                                             self.load_cases_applied)
+        
+        return {}
+    
+    # --- PILE LAYOUT ---
+    def pile_layout_inside_mat(self, mat_points, diameter, pile_len, mat_z, edge_factor, spacing_factor):
+        """Grid of [x, y, z_top, z_bottom, diameter_in] pile rows inside the mat (diameter in ft)"""
+        # Generate grid of potential pile locations
+        x_coords = [pt[0] for pt in mat_points]
+        y_coords = [pt[1] for pt in mat_points]
+        
+        min_x, max_x = min(x_coords), max(x_coords)
+        min_y, max_y = min(y_coords), max(y_coords)
+        
+        edge_dist = edge_factor * diameter
+        spacing = spacing_factor * diameter
+        
+        # Generate pile locations
+        pile_locations = []
+        x = min_x + edge_dist
+        while x <= max_x - edge_dist:
+            y = min_y + edge_dist
+            while y <= max_y - edge_dist:
+                # Check if point is inside mat polygon
+                if self._point_in_polygon(x, y, mat_points):
+                    z_top = mat_z
+                    z_bottom = z_top - pile_len
+                    pile_locations.append([x, y, z_top, z_bottom, diameter*12])
+                y += spacing
+            x += spacing
+        
+        # If no piles found with grid, try edge locations
+        if not pile_locations:
+            # Place piles at mat corners (inside)
+            for pt in mat_points:
+                x, y = pt[0], pt[1]
+                # Move slightly inward from corner
+                x_in = min_x + edge_dist if x == min_x else max_x - edge_dist
+                y_in = min_y + edge_dist if y == min_y else max_y - edge_dist
+                
+                if self._point_in_polygon(x_in, y_in, mat_points):
+                    z_top = mat_z
+                    z_bottom = z_top - pile_len
+                    pile_locations.append([x_in, y_in, z_top, z_bottom, diameter*12])
+        
+        return pile_locations
+    
+    def _point_in_polygon(self, x, y, polygon):
+        """Check if point is inside polygon"""
+        n = len(polygon)
+        inside = False
+        
+        p1x, p1y = polygon[0][0], polygon[0][1]
+        for i in range(n + 1):
+            p2x, p2y = polygon[i % n][0], polygon[i % n][1]
+            if y > min(p1y, p2y):
+                if y <= max(p1y, p2y):
+                    if x <= max(p1x, p2x):
+                        if p1y != p2y:
+                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+                        if p1x == p2x or x <= xinters:
+                            inside = not inside
+            p1x, p1y = p2x, p2y
+        
+        return inside
+    
+    # --- STRUCTURAL DESIGN ---
+    def design_static_cases(self, static_results, fc, pile_length, mat_thickness):
+        """Design columns, beams, piles, slabs and mat for every static load case"""
+        design_calc = ACIDesignCalculator()
+        design_results = {}
+        fy = STEEL_FY
+        
+        # Determine if seismic design is required
+        is_seismic = self.seismic_zone in ['C', 'D', 'E', 'F']
+        
+        # Columns, beams, piles and the first quad of each slab level, unpacked once for all load cases
+        mesh = PedestalMesh.of(self.nodes, self.elements)
+        first_shells = np.unique(mesh.shells['level'], return_index=True)[1]
+        design_positions = np.concatenate([mesh.frames['index'][mesh.frame_mask('COLUMN', 'BEAM', 'PILE')],
+                                           mesh.shells['index'][first_shells]])
+        design_elements = [mesh[position] for position in np.sort(design_positions)]
+        
+        # Process each load case
+        for case_index, (case_name, results) in enumerate(static_results.items()):
+            self.engine.report_progress(f"Designing for {case_name}", case_index / len(static_results))
+            design_results[case_name] = {}
+            
+            # Get joint forces
+            joint_forces = results['joint_forces']
+            
+            # Design columns
+            design_results[case_name]['columns'] = {}
+            col_counter = 1
+            for elem in design_elements:
+                if elem[0] == 'COLUMN':
+                    elem_name = f"COL{col_counter}"
+                    n1, n2 = elem[2], elem[3]
+                    
+                    # Get forces at column ends
+                    if n1 in joint_forces and n2 in joint_forces:
+                        # Use maximum forces from either end
+                        Pu = max(abs(joint_forces[n1]['fz']), abs(joint_forces[n2]['fz']))
+                        Mu_x = max(abs(joint_forces[n1]['my']), abs(joint_forces[n2]['my']))
+                        Mu_y = max(abs(joint_forces[n1]['mz']), abs(joint_forces[n2]['mz']))
+                        
+                        # Get column dimensions
+                        if len(elem) >= 10:
+                            width = elem[8]
+                            depth = elem[9]
+                        else:
+                            width = depth = 30  # default
+                        
+                        # Check if this is a seismic load case
+                        elem_is_seismic = is_seismic and ('SEISMIC' in case_name or 'seismic' in case_name.lower())
+                        
+                        # Design column
+                        design = design_calc.design_column(Pu/1000, Mu_x/12000, Mu_y/12000, 
+                                                         width, depth, is_seismic=elem_is_seismic)
+                        design_results[case_name]['columns'][elem_name] = design
+                        col_counter += 1
+            
+            # Design beams
+            design_results[case_name]['beams'] = {}
+            beam_counter = 1
+            for elem in design_elements:
+                if elem[0] == 'BEAM':
+                    elem_name = f"B{beam_counter}"
+                    n1, n2 = elem[2], elem[3]
+                    
+                    if n1 in joint_forces and n2 in joint_forces:
+                        # Use maximum moment and shear
+                        Mu = max(abs(joint_forces[n1]['my']), abs(joint_forces[n2]['my']),
+                                abs(joint_forces[n1]['mz']), abs(joint_forces[n2]['mz']))
+                        Vu = max(math.sqrt(joint_forces[n1]['fy']**2 + joint_forces[n1]['fz']**2),
+                                math.sqrt(joint_forces[n2]['fy']**2 + joint_forces[n2]['fz']**2))
+                        
+                        # Get beam dimensions
+                        if len(elem) >= 10:
+                            width = elem[8]
+                            depth = elem[9]
+                        else:
+                            width = depth = 30
+                        
+                        # Design for flexure
+                        d = depth - 2.5  # assuming 2.5" cover
+                        flexure_design = design_calc.design_flexural_member(Mu/12000, width, d, depth)
+                        
+                        # Design for shear
+                        shear_design = design_calc.design_shear_reinforcement(Vu/1000, width, d, fc, fy, 
+                                                                           flexure_design.get('As_required', 0))
+                        
+                        design_results[case_name]['beams'][elem_name] = {
+                            'flexure': flexure_design,
+                            'shear': shear_design
+                        }
+                        beam_counter += 1
+            
+            # Design piles
+            design_results[case_name]['piles'] = {}
+            pile_counter = 1
+            for elem in design_elements:
+                if elem[0] == 'PILE':
+                    elem_name = f"PI{pile_counter}"
+                    n1, n2 = elem[2], elem[3]
+                    
+                    if n1 in joint_forces:
+                        axial_load = abs(joint_forces[n1]['fz'])
+                        moment = max(abs(joint_forces[n1]['my']), abs(joint_forces[n1]['mz']))
+                        
+                        # Get pile diameter
+                        if len(elem) >= 9:
+                            diameter = elem[8]
+                        else:
+                            diameter = 24
+                        
+                        # Check if seismic design
+                        pile_is_seismic = is_seismic and ('SEISMIC' in case_name or 'seismic' in case_name.lower())
+                        
+                        # Design pile
+                        design = design_calc.design_pile(axial_load/1000, moment/12000, 
+                                                        diameter, pile_length, is_seismic=pile_is_seismic)
+                        design_results[case_name]['piles'][elem_name] = design
+                        pile_counter += 1
+            
+            # Design slabs (simplified)
+            design_results[case_name]['slabs'] = {}
+            for level_name in ['mat', 'mezzanine', 'top']:
+                # Find slab elements for this level
+                slab_moment = 0
+                slab_thickness = 8  # default
+                
+                for elem in design_elements:
+                    if elem[0] == 'SHELL' and elem[1] == level_name:
+                        # Estimate moment from surrounding elements
+                        if len(elem) >= 11:
+                            slab_thickness = elem[10] * 12  # convert to inches
+                        break
+                
+                # Check if roof
+                is_roof = (level_name == 'top')
+                
+                # Check if seismic
+                slab_is_seismic = is_seismic and ('SEISMIC' in case_name or 'seismic' in case_name.lower())
+                
+                # Simplified slab moment calculation
+                slab_moment = 0.1 * 20**2 / 10  # 0.1 ksf load, 20ft span
+                
+                design = design_calc.design_slab(slab_moment, slab_thickness, fc, fy, 
+                                                is_roof=is_roof, is_seismic=slab_is_seismic)
+                design_results[case_name]['slabs'][level_name.upper()] = design
+            
+            # Design mat foundation
+            design_results[case_name]['mat'] = {}
+            if self.mat_points:
+                # Estimate soil pressure
+                total_load = np.sum(np.abs(joint_forces.component('fz'))) / 1000  # kips
+                mat_area = 20 * 20  # ft² (simplified)
+                soil_pressure = total_load / mat_area  # ksf
+                
+                design = design_calc.design_foundation_mat(soil_pressure, mat_thickness, 
+                                                          20, 20, is_seismic=is_seismic)
+                design_results[case_name]['mat']['FOUNDATION'] = design
+        
+        return design_results
+
+class TurbinePedestalDesigner(PedestalDesignModel):
+    def __init__(self, root):
+        super().__init__()
+        self.root = root
+        self.root.title("Advanced Turbine Pedestals Designer - WS-SOFTWARE LLC")
+        self.root.geometry("1400x950")
+        
+        self.load_combos = {}
+        self.clipboard = None
+        
+        # Seismic parameters
         self.site_class = 'D'
         
         # License check
@@ -1805,6 +3348,7 @@ class TurbinePedestalDesigner:
             self.show_lock_screen(msg)
         else:
             self.setup_ui()
+            self.job_runner = AnalysisJobRunner(self.root, self.show_job_progress, on_idle=self.on_jobs_idle)
             self.status_bar.config(text=f"Status: {msg} | Mesh: {self.mesh_size}ft x {self.mesh_size}ft | Seismic Zone: {self.seismic_zone}")
     
     def show_lock_screen(self, msg):
@@ -1887,6 +3431,12 @@ class TurbinePedestalDesigner:
                               padx=15, pady=5)
         design_btn.grid(row=0, column=4, padx=5, pady=5)
         
+        self.cancel_btn = tk.Button(control_frame, text="CANCEL", 
+                                    command=self.cancel_analysis,
+                                    bg="#7f8c8d", fg="white", font=("Arial", 10, "bold"),
+                                    padx=15, pady=5, state=tk.DISABLED)
+        self.cancel_btn.grid(row=0, column=5, padx=5, pady=5)
+        
         # Quick actions
         quick_frame = ttk.Frame(self.left_frame)
         quick_frame.pack(fill="x", pady=5, padx=5)
@@ -1928,6 +3478,31 @@ class TurbinePedestalDesigner:
             setattr(self, var_name, var)
             ttk.Entry(prop_frame, textvariable=var, width=15).grid(row=row, column=col+1, padx=5, pady=5)
         
+        # Linear solver settings
+        solver_frame = ttk.LabelFrame(self.left_frame, text="Solver Settings", padding=10)
+        solver_frame.pack(fill="x", pady=5, padx=5)
+        
+        solver_params = [
+            ("Solver:", "auto", "solver_val", ["auto", "direct", "cg"]),
+            ("Preconditioner:", "auto", "preconditioner_val", ["auto", "jacobi", "ilu", "amg"]),
+            ("Tolerance:", "1e-8", "solver_tol_val", None),
+            ("Max Iterations:", "5000", "solver_maxiter_val", None),
+            ("Parallel Workers:", "1", "parallel_workers_val", None),
+            ("CG Ordering:", "natural", "dof_ordering_val", ["natural", "rcm"])
+        ]
+        
+        for i, (label, default, var_name, choices) in enumerate(solver_params):
+            row = i // 2
+            col = (i % 2) * 2
+            ttk.Label(solver_frame, text=label).grid(row=row, column=col, padx=5, pady=5, sticky="e")
+            var = tk.StringVar(value=default)
+            setattr(self, var_name, var)
+            if choices:
+                ttk.Combobox(solver_frame, textvariable=var, values=choices, state="readonly",
+                             width=12).grid(row=row, column=col+1, padx=5, pady=5)
+            else:
+                ttk.Entry(solver_frame, textvariable=var, width=15).grid(row=row, column=col+1, padx=5, pady=5)
+        
         # Seismic parameters
         seismic_frame = ttk.LabelFrame(self.left_frame, text="Seismic Parameters (Zone C)", padding=10)
         seismic_frame.pack(fill="x", pady=5, padx=5)
@@ -2426,111 +4001,46 @@ class TurbinePedestalDesigner:
         
         ttk.Button(dialog, text="Save", command=save_special_case).pack(pady=20)
     
-    def apply_special_load_cases(self):
-        """Apply special load cases to the structure"""
-        special_loads = {}
-        
-        for case_name, case_data in self.special_load_cases.items():
-            loads = []
-            
-            # Parse coordinates
-            try:
-                coords = case_data['coordinates']
-                if coords == "Applied at all structural mass locations":
-                    # Apply to all nodes (for seismic)
-                    for i in range(len(self.nodes)):
-                        loads.append((i, case_data['fx'], case_data['fy'], case_data['fz'], 0, 0, 0))
-                elif coords == "All structural elements":
-                    # Apply to all elements (for thermal)
-                    for i in range(len(self.nodes)):
-                        loads.append((i, case_data['fx'], case_data['fy'], case_data['fz'], 0, 0, 0))
-                elif coords == "Mat foundation (distributed)":
-                    # Apply to mat nodes
-                    mat_z = float(self.mat_z.get())
-                    for i, node in enumerate(self.nodes):
-                        if abs(node[2] - mat_z) < 1.0:
-                            loads.append((i, case_data['fx'], case_data['fy'], case_data['fz'], 0, 0, 0))
-                elif coords == "Roof and exposed surfaces":
-                    # Apply to top nodes
-                    top_z = max([node[2] for node in self.nodes])
-                    for i, node in enumerate(self.nodes):
-                        if abs(node[2] - top_z) < 1.0:
-                            loads.append((i, case_data['fx'], case_data['fy'], case_data['fz'], 0, 0, 0))
-                else:
-                    # Specific coordinates
-                    coord_parts = coords.split(',')
-                    if len(coord_parts) >= 3:
-                        x = float(coord_parts[0].strip())
-                        y = float(coord_parts[1].strip())
-                        z = float(coord_parts[2].strip())
-                        
-                        # Find nearest node
-                        min_dist = float('inf')
-                        nearest_node = 0
-                        for i, node in enumerate(self.nodes):
-                            dist = math.sqrt((node[0]-x)**2 + (node[1]-y)**2 + (node[2]-z)**2)
-                            if dist < min_dist:
-                                min_dist = dist
-                                nearest_node = i
-                        
-                        if min_dist < 5.0:  # Within 5 ft
-                            loads.append((nearest_node, case_data['fx'], case_data['fy'], case_data['fz'], 0, 0, 0))
-            except:
-                pass
-            
-            if loads:
-                special_loads[case_name] = loads
-        
-        return special_loads
-    
     # --- SEISMIC ANALYSIS ---
-    def perform_seismic_check(self):
+    def perform_seismic_check(self, on_done=None):
         """Perform seismic analysis and check compliance"""
         try:
-            if not self.nodes or not self.elements:
+            if len(self.nodes) == 0 or not self.elements:
                 messagebox.showwarning("Warning", "Generate mesh first")
                 return
             
             self.status_bar.config(text="Performing seismic analysis...")
-            self.root.update()
-            
-            # Calculate seismic forces
-            weight_distribution = {}
-            for i, node in enumerate(self.nodes):
-                # Simplified weight calculation
-                weight = 1000  # Default weight per node
-                weight_distribution[i] = weight
-            
-            seismic_results = self.engine.seismic_engine.calculate_seismic_loads_for_structure(
-                self.nodes, self.elements, weight_distribution
-            )
-            
-            # Add seismic loads to load cases
-            self.load_cases_applied['SEISMIC_X'] = []
-            self.load_cases_applied['SEISMIC_Y'] = []
             
-            for node_id, fx in seismic_results['seismic_x'].items():
-                self.load_cases_applied['SEISMIC_X'].append((node_id, fx, 0, 0, 0, 0, 0))
+            nodes, elements = self.nodes, self.elements
             
-            for node_id, fy in seismic_results['seismic_y'].items():
-                self.load_cases_applied['SEISMIC_Y'].append((node_id, 0, fy, 0, 0, 0, 0))
+            def seismic_analysis():
+                # Seismic forces as (n_nodes, 6) arrays, both cases solved with a single factorization
+                seismic_results, seismic_loads = self.engine.seismic_load_cases(nodes, elements)
+                return seismic_results, seismic_loads, self.engine.calculate_static_forces(nodes, elements, seismic_loads)
             
-            # Run analysis with seismic loads
-            if 'static' not in self.results:
-                self.results['static'] = {}
+            self.run_analysis_job(
+                "Seismic analysis", seismic_analysis,
+                lambda results: self._finish_seismic_check(*results, on_done)
+            )
             
-            # Run analysis for seismic cases
-            for case_name in ['SEISMIC_X', 'SEISMIC_Y']:
-                if case_name in self.load_cases_applied:
-                    self.results['static'][case_name] = self.engine.calculate_static_forces(
-                        self.nodes, self.elements, {case_name: self.load_cases_applied[case_name]}
-                    )[case_name]
+        except Exception as e:
+            messagebox.showerror("Error", f"Seismic analysis failed: {str(e)}")
+            traceback.print_exc()
+    
+    def _finish_seismic_check(self, seismic_results, seismic_loads, static_results, on_done=None):
+        """Add the seismic cases and results and check compliance"""
+        try:
+            self.load_cases_applied.update(seismic_loads)
+            self.results.setdefault('static', {}).update(static_results)
             
             # Check seismic compliance
             self.check_seismic_compliance(seismic_results)
             
             self.status_bar.config(text="Seismic analysis completed")
             
+            if on_done:
+                on_done()
+            
         except Exception as e:
             messagebox.showerror("Error", f"Seismic analysis failed: {str(e)}")
             traceback.print_exc()
@@ -2694,7 +4204,7 @@ class TurbinePedestalDesigner:
         return data
     
     # --- PILE AUTO-ARRANGEMENT ---
-    def auto_arrange_piles_inside_mat(self):
+    def auto_arrange_piles_inside_mat(self, remesh=True):
         """Automatically arrange piles symmetrically inside mat boundary"""
         try:
             # Get mat geometry
@@ -2715,46 +4225,8 @@ class TurbinePedestalDesigner:
             edge_factor = float(self.edge_distance_factor.get())
             spacing_factor = float(self.pile_spacing_factor.get())
             
-            # Calculate mat bounds and create polygon
-            mat_polygon = [(pt[0], pt[1]) for pt in mat_points]
-            
-            # Generate grid of potential pile locations
-            x_coords = [pt[0] for pt in mat_points]
-            y_coords = [pt[1] for pt in mat_points]
-            
-            min_x, max_x = min(x_coords), max(x_coords)
-            min_y, max_y = min(y_coords), max(y_coords)
-            
-            edge_dist = edge_factor * diameter
-            spacing = spacing_factor * diameter
-            
-            # Generate pile locations
-            pile_locations = []
-            x = min_x + edge_dist
-            while x <= max_x - edge_dist:
-                y = min_y + edge_dist
-                while y <= max_y - edge_dist:
-                    # Check if point is inside mat polygon
-                    if self._point_in_polygon(x, y, mat_points):
-                        z_top = mat_z
-                        z_bottom = z_top - pile_len
-                        pile_locations.append([x, y, z_top, z_bottom, diameter*12])
-                    y += spacing
-                x += spacing
-            
-            # If no piles found with grid, try edge locations
-            if not pile_locations:
-                # Place piles at mat corners (inside)
-                for pt in mat_points:
-                    x, y = pt[0], pt[1]
-                    # Move slightly inward from corner
-                    x_in = min_x + edge_dist if x == min_x else max_x - edge_dist
-                    y_in = min_y + edge_dist if y == min_y else max_y - edge_dist
-                    
-                    if self._point_in_polygon(x_in, y_in, mat_points):
-                        z_top = mat_z
-                        z_bottom = z_top - pile_len
-                        pile_locations.append([x_in, y_in, z_top, z_bottom, diameter*12])
+            pile_locations = self.pile_layout_inside_mat(mat_points, diameter, pile_len, mat_z,
+                                                         edge_factor, spacing_factor)
             
             # Add piles to table
             for i, pile in enumerate(pile_locations, 1):
@@ -2765,32 +4237,13 @@ class TurbinePedestalDesigner:
             self.status_bar.config(text=f"Auto-arranged {len(pile_locations)} piles inside mat")
             
             # Update mesh if exists
-            if self.nodes:
+            if remesh and len(self.nodes):
                 self.auto_mesh()
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to auto-arrange piles: {str(e)}")
             traceback.print_exc()
     
-    def _point_in_polygon(self, x, y, polygon):
-        """Check if point is inside polygon"""
-        n = len(polygon)
-        inside = False
-        
-        p1x, p1y = polygon[0][0], polygon[0][1]
-        for i in range(n + 1):
-            p2x, p2y = polygon[i % n][0], polygon[i % n][1]
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
-        
-        return inside
-    
     # --- LOAD CASE METHODS ---
     def add_load_case(self):
         case_name = self.load_case_name.get()
@@ -2861,6 +4314,12 @@ class TurbinePedestalDesigner:
         description = self.custom_combo_desc.get()
         
         if combo_id and formula:
+            try:
+                parse_combination_formula(formula, self.load_cases_applied)
+            except ValueError as e:
+                messagebox.showerror("Invalid Combination", str(e))
+                return
+            
             var = tk.BooleanVar(value=True)
             self.combo_enabled[combo_id] = var
             
@@ -2882,10 +4341,10 @@ class TurbinePedestalDesigner:
             self.custom_combo_formula.set("1.2*DL + 1.6*LL")
             self.custom_combo_desc.set("Custom load combination")
     
-    def analyze_all_combinations(self):
+    def analyze_all_combinations(self, on_done=None):
         """Perform analysis for all enabled load combinations"""
         try:
-            if not self.nodes or not self.elements:
+            if len(self.nodes) == 0 or not self.elements:
                 messagebox.showwarning("Warning", "Generate mesh first")
                 return
             
@@ -2899,33 +4358,43 @@ class TurbinePedestalDesigner:
             # Get all active load cases
             available_loads = list(self.load_cases_applied.keys())
             
-            # Ensure seismic loads are calculated
+            # Ensure seismic loads are calculated; the combinations follow when they are
             if 'SEISMIC_X' not in available_loads or 'SEISMIC_Y' not in available_loads:
-                self.perform_seismic_check()
+                self.perform_seismic_check(on_done=lambda: self.analyze_all_combinations(on_done))
+                return
             
             # Apply special load cases
             special_loads = self.apply_special_load_cases()
             for case_name, loads in special_loads.items():
                 self.load_cases_applied[case_name] = loads
             
-            # Analyze each enabled combination
-            analyzed_count = 0
-            
+            # Load factors of every enabled combination plus the ACI 318-25 table
+            combinations = {}
             for combo_id, var in self.combo_enabled.items():
-                if not var.get():
-                    continue
-                
-                self.status_bar.config(text=f"Analyzing {combo_id}...")
-                self.root.update()
-                
-                try:
-                    combo_result = self.analyze_single_combination(combo_id)
-                    if combo_result:
-                        self.results['combinations'][combo_id] = combo_result
-                        analyzed_count += 1
-                except Exception as e:
-                    print(f"Error analyzing {combo_id}: {str(e)}")
-                    traceback.print_exc()
+                if var.get():
+                    combinations[combo_id] = self.get_combination_factors(combo_id)
+            for combo_id in ACI_LOAD_COMBINATIONS:
+                combinations.setdefault(combo_id, self.get_combination_factors(combo_id))
+            
+            self.status_bar.config(text=f"Analyzing {len(combinations)} combinations by superposition...")
+            
+            # One solve per primitive load case, combinations by superposition
+            nodes, elements, load_cases = self.nodes, self.elements, dict(self.load_cases_applied)
+            self.run_analysis_job(
+                "Combination analysis",
+                lambda: self.engine.analyze_load_combinations(nodes, elements, load_cases, combinations),
+                lambda combo_results: self._finish_combination_analysis(combo_results, on_done)
+            )
+        
+        except Exception as e:
+            messagebox.showerror("Error", f"Combination analysis failed: {str(e)}")
+            traceback.print_exc()
+    
+    def _finish_combination_analysis(self, combo_results, on_done=None):
+        """Store and display load combination results"""
+        try:
+            self.results.setdefault('combinations', {}).update(combo_results)
+            analyzed_count = len(combo_results)
             
             # Display comprehensive results
             self.display_combination_results()
@@ -2935,68 +4404,13 @@ class TurbinePedestalDesigner:
                               f"Successfully analyzed {analyzed_count} load combinations.\n" +
                               "Results displayed in the analysis results panel.")
             
+            if on_done:
+                on_done()
+        
         except Exception as e:
             messagebox.showerror("Error", f"Combination analysis failed: {str(e)}")
             traceback.print_exc()
     
-    def analyze_single_combination(self, combo_id):
-        """Analyze a single load combination"""
-        # Parse combination formula
-        combo_formulas = {
-            "COMBO1": {"DL": 1.4},
-            "COMBO2": {"DL": 1.2, "LL": 1.6},
-            "COMBO3": {"DL": 1.2, "LL": 1.6, "Lr": 0.5},
-            "COMBO4": {"DL": 1.2, "LL": 1.0, "W": 1.0},
-            "COMBO5": {"DL": 1.2, "LL": 1.0, "SEISMIC_X": 1.0, "SEISMIC_Y": 1.0},
-            "COMBO6": {"DL": 0.9, "W": 1.0},
-            "COMBO7": {"DL": 0.9, "SEISMIC_X": 1.0, "SEISMIC_Y": 1.0},
-            "COMBO8": {"DL": 1.2, "LL": 1.0, "W": 1.6},
-            "COMBO9": {"DL": 1.2, "LL": 1.0, "SEISMIC_X": 1.0, "SEISMIC_Y": 1.0, "S": 1.0},
-            "COMBO10": {"DL": 1.2, "SEISMIC_X": 1.0, "SEISMIC_Y": 1.0, "LL": 0.5},
-            "SEISMIC1": {"DL": 1.2, "LL": 1.0, "SEISMIC_X": 1.0, "SEISMIC_Y": 0.3},
-            "SEISMIC2": {"DL": 1.2, "LL": 1.0, "SEISMIC_X": 0.3, "SEISMIC_Y": 1.0},
-            "SEISMIC3": {"DL": 0.9, "SEISMIC_X": 1.0, "SEISMIC_Y": 0.3},
-            "SEISMIC4": {"DL": 0.9, "SEISMIC_X": 0.3, "SEISMIC_Y": 1.0},
-            "SEISMIC5": {"DL": 1.2, "LL": 1.0, "SEISMIC_X": -1.0, "SEISMIC_Y": -0.3},
-            "SEISMIC6": {"DL": 1.2, "LL": 1.0, "SEISMIC_X": -0.3, "SEISMIC_Y": -1.0},
-        }
-        
-        # Get load factors for this combination
-        factors = combo_formulas.get(combo_id, {})
-        
-        # Combine loads according to factors
-        combined_loads = []
-        
-        for node_id in range(len(self.nodes)):
-            fx, fy, fz = 0.0, 0.0, 0.0
-            mx, my, mz = 0.0, 0.0, 0.0
-            
-            for load_case, factor in factors.items():
-                if load_case in self.load_cases_applied:
-                    case_loads = self.load_cases_applied[load_case]
-                    
-                    for load in case_loads:
-                        if load[0] == node_id:  # Node ID matches
-                            fx += factor * load[1]
-                            fy += factor * load[2]
-                            fz += factor * load[3]
-                            if len(load) >= 7:
-                                mx += factor * load[4]
-                                my += factor * load[5]
-                                mz += factor * load[6]
-            
-            if abs(fx) > 1e-6 or abs(fy) > 1e-6 or abs(fz) > 1e-6:
-                combined_loads.append((node_id, fx, fy, fz, mx, my, mz))
-        
-        # Perform static analysis with combined loads
-        if combined_loads:
-            result = self.engine.calculate_static_forces(
-                self.nodes, self.elements, {combo_id: combined_loads}
-            )
-            return result.get(combo_id, None)
-        
-        return None
-    
     def display_combination_results(self):
         """Display comprehensive combination analysis results"""
         self.results_text.delete("1.0", tk.END)
@@ -3018,12 +4432,12 @@ class TurbinePedestalDesigner:
             joint_forces = result['joint_forces']
             
             # Extract forces from joint_forces
-            for node_id, forces in joint_forces.items():
-                for force_type in ['fx', 'fy', 'fz', 'mx', 'my', 'mz']:
-                    value = abs(forces.get(force_type, 0))
-                    
-                    if force_type not in max_forces or value > max_forces[force_type]['value']:
-                        max_forces[force_type] = {'value': value, 'combo': combo_id}
+            if len(joint_forces) == 0:
+                continue
+            peaks = np.max(np.abs(joint_forces.forces), axis=0)
+            for force_type, value in zip(JointForces.COMPONENTS, peaks):
+                if force_type not in max_forces or value > max_forces[force_type]['value']:
+                    max_forces[force_type] = {'value': value, 'combo': combo_id}
         
         # Display governing combinations
         self.results_text.insert(tk.END, "GOVERNING LOAD COMBINATIONS:\n")
@@ -3057,13 +4471,9 @@ class TurbinePedestalDesigner:
             
             joint_forces = result['joint_forces']
             
-            # Max forces
-            max_fx = max([abs(v.get('fx', 0)) for v in joint_forces.values()] + [0]) / 1000
-            max_fy = max([abs(v.get('fy', 0)) for v in joint_forces.values()] + [0]) / 1000
-            max_fz = max([abs(v.get('fz', 0)) for v in joint_forces.values()] + [0]) / 1000
-            max_mx = max([abs(v.get('mx', 0)) for v in joint_forces.values()] + [0]) / 1000
-            max_my = max([abs(v.get('my', 0)) for v in joint_forces.values()] + [0]) / 1000
-            max_mz = max([abs(v.get('mz', 0)) for v in joint_forces.values()] + [0]) / 1000
+            # Max forces in kips and moments in kip-ft (analysis results are in lb and lb-in)
+            peaks = np.max(np.abs(joint_forces.forces), axis=0, initial=0) / [1000, 1000, 1000, 12000, 12000, 12000]
+            max_fx, max_fy, max_fz, max_mx, max_my, max_mz = peaks
             
             self.results_text.insert(tk.END, f"  Max FX: {max_fx:.2f} kips\n")
             self.results_text.insert(tk.END, f"  Max FY: {max_fy:.2f} kips\n")
@@ -3076,9 +4486,9 @@ class TurbinePedestalDesigner:
             if 'displacements' in result:
                 disp = result['displacements']
                 # Calculate max displacements
-                max_dx = max([abs(disp[i]) for i in range(0, len(disp), 6)] + [0]) * 12
-                max_dy = max([abs(disp[i+1]) for i in range(0, len(disp), 6)] + [0]) * 12
-                max_dz = max([abs(disp[i+2]) for i in range(0, len(disp), 6)] + [0]) * 12
+                max_dx = max([abs(disp[i]) for i in range(0, len(disp), 6)] + [0])
+                max_dy = max([abs(disp[i+1]) for i in range(0, len(disp), 6)] + [0])
+                max_dz = max([abs(disp[i+2]) for i in range(0, len(disp), 6)] + [0])
                 
                 self.results_text.insert(tk.END, f"  Max DX: {max_dx:.3f} in\n")
                 self.results_text.insert(tk.END, f"  Max DY: {max_dy:.3f} in\n")
@@ -3155,8 +4565,8 @@ class TurbinePedestalDesigner:
                     values=[f"{pt[0]:.1f}", f"{pt[1]:.1f}", f"{z_bottom:.1f}", 
                            f"{top_z:.1f}", f"{col_width:.1f}", f"{col_depth:.1f}", f"{col_width:.1f}", "Edit"])
             
-            # Auto-arrange piles inside mat
-            self.auto_arrange_piles_inside_mat()
+            # Auto-arrange piles inside mat; the beams follow, so meshing is left to the caller
+            self.auto_arrange_piles_inside_mat(remesh=False)
             
             # Default beams at mezzanine edges (aligned to 2ft grid)
             beam_points = [
@@ -3190,19 +4600,11 @@ class TurbinePedestalDesigner:
             messagebox.showerror("Error", f"Failed to generate geometry: {str(e)}")
             traceback.print_exc()
     
-    def auto_mesh(self):
+    def auto_mesh(self, on_done=None):
         """Generate mesh from current geometry with 2ft x 2ft square/rectangular elements"""
         try:
             self.mesh_size = float(self.mesh_size_var.get())
-            
-            # Update engine with soil properties from UI
-            self.engine.modulus_subgrade_z = float(self.soil_kz_val.get())
-            self.engine.modulus_subgrade_xy = float(self.soil_kxy_val.get())
-            self.engine.pile_soil_spring_factor = float(self.spring_factor_val.get())
-            
-            # Update seismic parameters
-            self.engine.seismic_engine.zone = self.seismic_zone
-            self.engine.seismic_engine.site_class = self.site_class.get()
+            self.apply_engine_settings()
             
             # Get data from tables
             self.mat_points = self.get_table_data("Mat Foundation")
@@ -3231,13 +4633,25 @@ class TurbinePedestalDesigner:
                     self.beam_lines[i] = self.beam_lines[i][:9]
             
             self.status_bar.config(text=f"Generating {self.mesh_size}ft x {self.mesh_size}ft square/rectangular mesh...")
-            self.root.update()
             
             # Generate mesh with square/rectangular elements
-            self.nodes, self.elements = self.engine.generate_complete_mesh(
-                self.mat_points, self.mezzanine_points, self.top_points,
-                self.column_lines, self.pile_lines, self.beam_lines, self.mesh_size
+            self.run_analysis_job(
+                "Meshing",
+                lambda: self.engine.generate_complete_mesh(
+                    self.mat_points, self.mezzanine_points, self.top_points,
+                    self.column_lines, self.pile_lines, self.beam_lines, self.mesh_size
+                ),
+                lambda mesh: self._finish_auto_mesh(mesh, on_done)
             )
+        
+        except Exception as e:
+            messagebox.showerror("Error", f"Auto-meshing failed: {str(e)}")
+            traceback.print_exc()
+    
+    def _finish_auto_mesh(self, mesh, on_done=None):
+        """Store a generated mesh and create its loads"""
+        try:
+            self.nodes, self.elements = mesh
             
             # Create automatic loads including special loads
             self.create_auto_loads()
@@ -3245,103 +4659,52 @@ class TurbinePedestalDesigner:
             self.status_bar.config(text=f"{self.mesh_size}ft mesh: {len(self.nodes)} nodes, {len(self.elements)} elements")
             self.update_plot()
             
+            if on_done:
+                on_done()
+        
         except Exception as e:
             messagebox.showerror("Error", f"Auto-meshing failed: {str(e)}")
             traceback.print_exc()
     
-    def create_auto_loads(self):
-        """Create automatic dead and live loads including special loads"""
-        self.load_cases_applied = {}
-        
-        # Add automatic loads
-        auto_loads = self.calculate_auto_loads()
-        self.load_cases_applied['AUTO_DL+LL'] = auto_loads
-        
-        # Add user-defined loads
-        for case_name, load_data in self.load_cases.items():
-            loads = []
-            fx, fy, fz = load_data['fx'], load_data['fy'], load_data['fz']
-            
-            # Apply to top nodes
-            if self.nodes:
-                top_z = max([node[2] for node in self.nodes])
-                top_nodes = [i for i, node in enumerate(self.nodes) if abs(node[2] - top_z) < 0.1]
-                
-                for node in top_nodes:
-                    loads.append((node, fx, fy, fz, 0, 0, 0))
-            
-            self.load_cases_applied[case_name] = loads
+    # --- ANALYSIS METHODS ---
+    def run_analysis_job(self, label, work, on_done):
+        """Run work() on the analysis worker thread and on_done(result) back on the Tk thread"""
+        runner = getattr(self, 'job_runner', None)
+        if runner is None:
+            on_done(work())
+            return
         
-        # Add special load cases
-        special_loads = self.apply_special_load_cases()
-        self.load_cases_applied.update(special_loads)
+        if runner.busy():
+            messagebox.showwarning("Analysis Running", f"'{runner.label}' is still running. Wait or cancel it first.")
+            return
         
-        print(f"Created {len(self.load_cases_applied)} load cases including special loads")
+        def engine_work(progress):
+            self.engine.progress_callback = progress
+            try:
+                return work()
+            finally:
+                self.engine.progress_callback = None
+        
+        self.cancel_btn.config(state=tk.NORMAL, bg="#c0392b")
+        self.status_bar.config(text=f"{label}...")
+        runner.start(label, engine_work, on_done,
+                     on_error=lambda e: messagebox.showerror("Error", f"{label} failed: {str(e)}"))
     
-    def calculate_auto_loads(self):
-        """Calculate automatic dead and live loads"""
-        loads = []
-        
-        if not self.nodes:
-            return loads
-        
-        # Material properties
-        concrete_density = 150  # lb/ft³
-        
-        # Calculate self-weight of slabs
-        for elem in self.elements:
-            elem_type = elem[0]
-            
-            if elem_type == 'SHELL':
-                # Calculate area and self-weight for quad elements
-                if len(elem) >= 11:  # Has thickness at position 10
-                    n1, n2, n3, n4 = elem[2], elem[3], elem[4], elem[5]
-                    thickness_ft = elem[10] if len(elem) > 10 else 8/12
-                    
-                    if all(n < len(self.nodes) for n in [n1, n2, n3, n4]):
-                        # Calculate quad area (sum of two triangles)
-                        x1, y1, z1 = self.nodes[n1]
-                        x2, y2, z2 = self.nodes[n2]
-                        x3, y3, z3 = self.nodes[n3]
-                        x4, y4, z4 = self.nodes[n4]
-                        
-                        # Area of triangle 1 (n1, n2, n3)
-                        area1 = 0.5 * abs((x2-x1)*(y3-y1) - (x3-x1)*(y2-y1))
-                        # Area of triangle 2 (n1, n3, n4)
-                        area2 = 0.5 * abs((x3-x1)*(y4-y1) - (x4-x1)*(y3-y1))
-                        area = area1 + area2
-                        
-                        # Self-weight (in lb)
-                        self_weight = area * thickness_ft * concrete_density
-                        
-                        # Distribute to 4 nodes
-                        load_per_node = -self_weight / 4  # Negative for downward
-                        
-                        loads.append((n1, 0, 0, load_per_node, 0, 0, 0))
-                        loads.append((n2, 0, 0, load_per_node, 0, 0, 0))
-                        loads.append((n3, 0, 0, load_per_node, 0, 0, 0))
-                        loads.append((n4, 0, 0, load_per_node, 0, 0, 0))
-        
-        # Add additional dead and live loads to top nodes
-        top_z = max([node[2] for node in self.nodes])
-        top_nodes = [i for i, node in enumerate(self.nodes) if abs(node[2] - top_z) < 0.1]
-        
-        if top_nodes:
-            # Estimate tributary area per node
-            avg_area = 100  # ft² (simplified)
-            
-            dead_load = 20 * avg_area * 1.2  # 20 psf DL
-            live_load = 50 * avg_area * 1.6  # 50 psf LL
-            
-            total_load = -(dead_load + live_load)  # Downward
-            
-            for node in top_nodes:
-                loads.append((node, 0, 0, total_load/len(top_nodes), 0, 0, 0))
-        
-        print(f"  Generated {len(loads)} load entries")
-        return loads
+    def show_job_progress(self, message, fraction=None):
+        """Show progress of the background analysis in the status bar"""
+        if fraction is not None:
+            message = f"{message} ({fraction:.0%})"
+        self.status_bar.config(text=message)
+    
+    def on_jobs_idle(self):
+        self.cancel_btn.config(state=tk.DISABLED, bg="#7f8c8d")
+    
+    def cancel_analysis(self):
+        """Cancel the running background analysis"""
+        if self.job_runner.busy():
+            self.job_runner.cancel()
+            self.status_bar.config(text=f"Cancelling {self.job_runner.label}...")
     
-    # --- ANALYSIS METHODS ---
     def perform_full_analysis_enhanced(self):
         """Perform complete static and dynamic analysis with structural design and seismic check"""
         self.status_bar.config(text="Starting full analysis with structural design and seismic check...")
@@ -3353,26 +4716,31 @@ class TurbinePedestalDesigner:
                 self.generate_default_geometry()
                 self.root.update()
             
-            # Auto mesh with square/rectangular elements (2ft x 2ft)
-            self.auto_mesh()
-            self.root.update()
-            
-            # Static analysis
-            self.run_static_analysis()
-            self.root.update()
-            
-            # Seismic analysis
-            self.perform_seismic_check()
-            self.root.update()
+            # Auto mesh with square/rectangular elements (2ft x 2ft), then static analysis;
+            # each step continues the chain when its background job has finished
+            self.auto_mesh(on_done=lambda: self.run_static_analysis(on_done=self._continue_full_analysis))
             
-            # Dynamic analysis with vibration check
-            self.run_dynamic_analysis_with_vibration_check()
-            self.root.update()
-            
-            # Perform structural design with ACI 318-25
-            design_results = self.perform_structural_design()
-            self.root.update()
+        except Exception as e:
+            messagebox.showerror("Error", f"Analysis failed: {str(e)}")
+            self.status_bar.config(text="Analysis failed")
+            traceback.print_exc()
+    
+    def _continue_full_analysis(self):
+        """Seismic, dynamic and design steps of the full analysis, each started when the previous job is done"""
+        try:
+            # Seismic analysis, dynamic analysis with vibration check, then ACI 318-25 design
+            self.perform_seismic_check(on_done=lambda: self.run_dynamic_analysis_with_vibration_check(
+                on_done=lambda: self.perform_structural_design(on_done=self._finish_full_analysis)
+            ))
             
+        except Exception as e:
+            messagebox.showerror("Error", f"Analysis failed: {str(e)}")
+            self.status_bar.config(text="Analysis failed")
+            traceback.print_exc()
+    
+    def _finish_full_analysis(self, design_results):
+        """Report and summary of the full analysis"""
+        try:
             # Export comprehensive PDF report
             if design_results:
                 self.export_comprehensive_pdf_report()
@@ -3387,117 +4755,145 @@ class TurbinePedestalDesigner:
             self.status_bar.config(text="Analysis failed")
             traceback.print_exc()
     
-    def run_static_analysis(self):
+    def run_static_analysis(self, on_done=None):
         """Run static analysis including special loads"""
         try:
-            if not self.nodes or not self.elements:
+            if len(self.nodes) == 0 or not self.elements:
                 messagebox.showwarning("Warning", "Generate mesh first")
                 return
             
             self.status_bar.config(text="Running static analysis with special loads...")
-            self.root.update()
             
-            self.results['static'] = self.engine.calculate_static_forces(
-                self.nodes, self.elements, self.load_cases_applied
+            nodes, elements, load_cases = self.nodes, self.elements, dict(self.load_cases_applied)
+            self.run_analysis_job(
+                "Static analysis",
+                lambda: self.engine.calculate_static_forces(nodes, elements, load_cases),
+                lambda results: self._finish_static_analysis(results, on_done)
             )
+        
+        except Exception as e:
+            messagebox.showerror("Error", f"Static analysis failed: {str(e)}")
+            traceback.print_exc()
+    
+    def _finish_static_analysis(self, results, on_done=None):
+        """Store and display static analysis results"""
+        try:
+            self.results['static'] = results
             
             self.display_static_results()
             self.status_bar.config(text="Static analysis completed")
             
+            if on_done:
+                on_done()
+            
         except Exception as e:
             messagebox.showerror("Error", f"Static analysis failed: {str(e)}")
             traceback.print_exc()
     
-    def run_dynamic_analysis(self):
+    def run_dynamic_analysis(self, on_done=None):
         """Run dynamic analysis"""
         try:
-            if not self.nodes or not self.elements:
+            if len(self.nodes) == 0 or not self.elements:
                 messagebox.showwarning("Warning", "Generate mesh first")
                 return
             
             self.status_bar.config(text="Running dynamic analysis...")
-            self.root.update()
-            
-            # Calculate masses
-            masses = []
-            density = float(self.den_val.get())
             
-            for i, node in enumerate(self.nodes):
-                mass = 1000  # Default
-                masses.append(mass / self.engine.gravity)
-            
-            # Run analysis (simplified)
-            n_nodes = len(self.nodes)
-            n_dof = n_nodes * 6
-            
-            # Simplified stiffness matrix
-            K = np.eye(n_dof) * 1e6
-            M = np.eye(n_dof) * 100
-            
-            # Boundary conditions
-            fixed_nodes = set()
-            for elem in self.elements:
-                if elem[0] == 'PILE':
-                    fixed_nodes.add(elem[3])  # Bottom node
+            nodes, elements = self.nodes, self.elements
+            self.run_analysis_job(
+                "Dynamic analysis",
+                lambda: self._simplified_modes(nodes, elements),
+                lambda dynamic: self._finish_dynamic_analysis(dynamic, on_done)
+            )
             
-            for node_id in fixed_nodes:
-                for dof in range(6):
-                    idx = node_id * 6 + dof
-                    K[idx, idx] = 1e12
-                    M[idx, idx] = 1
+        except Exception as e:
+            messagebox.showerror("Error", f"Dynamic analysis failed: {str(e)}")
+            traceback.print_exc()
+    
+    def _simplified_modes(self, nodes, elements):
+        """Simplified eigenvalue problem of the dynamic analysis, run on the analysis worker thread"""
+        n_nodes = len(nodes)
+        n_dof = n_nodes * 6
+        
+        # Simplified stiffness matrix
+        K = np.eye(n_dof) * 1e6
+        M = np.eye(n_dof) * 100
+        
+        # Boundary conditions
+        fixed_nodes = set()
+        for elem in elements:
+            if elem[0] == 'PILE':
+                fixed_nodes.add(elem[3])  # Bottom node
+        
+        for node_id in fixed_nodes:
+            for dof in range(6):
+                idx = node_id * 6 + dof
+                K[idx, idx] = 1e12
+                M[idx, idx] = 1
+        
+        # Solve eigenvalue problem
+        try:
+            from scipy.linalg import eigh # pyright: ignore[reportMissingImports]
+            free_dofs = [i for i in range(n_dof) 
+                       if i not in [node_id*6 + dof for node_id in fixed_nodes for dof in range(6)]]
             
-            # Solve eigenvalue problem
-            try:
-                from scipy.linalg import eigh # pyright: ignore[reportMissingImports]
-                free_dofs = [i for i in range(n_dof) 
-                           if i not in [node_id*6 + dof for node_id in fixed_nodes for dof in range(6)]]
+            if len(free_dofs) > 0:
+                K_red = K[np.ix_(free_dofs, free_dofs)]
+                M_red = M[np.ix_(free_dofs, free_dofs)]
                 
-                if len(free_dofs) > 0:
-                    K_red = K[np.ix_(free_dofs, free_dofs)]
-                    M_red = M[np.ix_(free_dofs, free_dofs)]
-                    
-                    eigvals, eigvecs = eigh(K_red, M_red, subset_by_index=[0, min(10, len(free_dofs)-1)])
-                    frequencies = np.sqrt(np.abs(eigvals)) / (2 * np.pi)
-                    
-                    self.results['dynamic'] = {
-                        'frequencies': frequencies,
-                        'mode_shapes': eigvecs
-                    }
-                else:
-                    self.results['dynamic'] = {
-                        'frequencies': np.array([]),
-                        'mode_shapes': np.array([])
-                    }
-                
-                self.display_dynamic_results()
-                self.status_bar.config(text="Dynamic analysis completed")
+                eigvals, eigvecs = eigh(K_red, M_red, subset_by_index=[0, min(10, len(free_dofs)-1)])
+                frequencies = np.sqrt(np.abs(eigvals)) / (2 * np.pi)
                 
-            except Exception as e:
-                print(f"Eigenvalue failed: {e}")
-                self.results['dynamic'] = {
-                    'frequencies': np.array([10.0, 15.0, 20.0]),  # Default frequencies
-                    'mode_shapes': np.array([])
+                return {
+                    'frequencies': frequencies,
+                    'mode_shapes': eigvecs
                 }
-                self.display_dynamic_results()
+            
+            return {
+                'frequencies': np.array([]),
+                'mode_shapes': np.array([])
+            }
+        
+        except Exception as e:
+            print(f"Eigenvalue failed: {e}")
+            return {
+                'frequencies': np.array([10.0, 15.0, 20.0]),  # Default frequencies
+                'mode_shapes': np.array([]),
+                'simplified': True
+            }
+    
+    def _finish_dynamic_analysis(self, dynamic, on_done=None):
+        """Store and display the dynamic analysis results"""
+        try:
+            self.results['dynamic'] = dynamic
+            self.display_dynamic_results()
+            if dynamic.get('simplified'):
                 self.status_bar.config(text="Dynamic analysis completed (simplified)")
+            else:
+                self.status_bar.config(text="Dynamic analysis completed")
             
+            if on_done:
+                on_done()
+        
         except Exception as e:
             messagebox.showerror("Error", f"Dynamic analysis failed: {str(e)}")
             traceback.print_exc()
     
-    def run_dynamic_analysis_with_vibration_check(self):
+    def run_dynamic_analysis_with_vibration_check(self, on_done=None):
         """Run dynamic analysis with vibration criteria check"""
+        self.run_dynamic_analysis(on_done=lambda: self.check_vibration(on_done))
+    
+    def check_vibration(self, on_done=None):
+        """Check the natural frequencies against the vibration criteria"""
         try:
-            self.run_dynamic_analysis()  # Original method
-            
             if 'dynamic' in self.results:
                 frequencies = self.results['dynamic']['frequencies']
                 
                 # Check for vibration criteria
                 vibration_issues = []
+                first_frequency = frequencies[0] if len(frequencies) > 0 else 0
                 if len(frequencies) > 0:
                     # First mode should be > 8 Hz to avoid perceptible vibration
-                    first_frequency = frequencies[0] if len(frequencies) > 0 else 0
                     if first_frequency < 8.0:
                         vibration_issues.append(f"First natural frequency ({first_frequency:.1f} Hz) < 8.0 Hz")
                     
@@ -3524,6 +4920,9 @@ class TurbinePedestalDesigner:
                 else:
                     self.results_text.insert(tk.END, "✓ Vibration criteria satisfied\n")
             
+            if on_done:
+                on_done()
+            
         except Exception as e:
             messagebox.showerror("Error", f"Vibration analysis failed: {str(e)}")
     
@@ -3563,9 +4962,8 @@ class TurbinePedestalDesigner:
                 self.results_text.insert(tk.END, "-"*80 + "\n")
                 
                 # Find top 10 joints by resultant force
-                sorted_joints = sorted(joint_forces.items(), 
-                                      key=lambda x: x[1]['resultant_force'], 
-                                      reverse=True)[:10]
+                top_joints = np.argsort(-joint_forces.resultant_force, kind='stable')[:10]
+                sorted_joints = [(int(i), joint_forces[int(i)]) for i in top_joints]
                 
                 for joint_id, forces in sorted_joints:
                     if joint_id < len(self.nodes):
@@ -3601,180 +4999,45 @@ class TurbinePedestalDesigner:
             self.results_text.insert(tk.END, "No dynamic modes found.\n")
     
     # --- STRUCTURAL DESIGN METHODS WITH ACI 318-25 ---
-    def perform_structural_design(self):
+    def perform_structural_design(self, on_done=None):
         """Perform ACI 318-25 design for all structural elements with clause references"""
         try:
             self.status_bar.config(text="Performing ACI 318-25 structural design...")
-            self.root.update()
             
             if 'static' not in self.results:
                 messagebox.showwarning("Warning", "Run static analysis first")
                 return None
             
-            design_calc = ACIDesignCalculator()
-            design_results = {}
-            
-            # Get material properties
+            # Read input values on the Tk thread before the design job starts
+            static_results = self.results['static']
             fc = float(self.fc_val.get())
-            fy = STEEL_FY
+            pile_length = float(self.pile_length.get())
+            mat_thickness = float(self.mat_thickness.get()) * 12  # convert to inches
             
-            # Determine if seismic design is required
-            is_seismic = self.seismic_zone in ['C', 'D', 'E', 'F']
-            
-            # Process each load case
-            for case_name, results in self.results['static'].items():
-                design_results[case_name] = {}
-                
-                # Get joint forces
-                joint_forces = results['joint_forces']
-                
-                # Design columns
-                design_results[case_name]['columns'] = {}
-                col_counter = 1
-                for elem in self.elements:
-                    if elem[0] == 'COLUMN':
-                        elem_name = f"COL{col_counter}"
-                        n1, n2 = elem[2], elem[3]
-                        
-                        # Get forces at column ends
-                        if n1 in joint_forces and n2 in joint_forces:
-                            # Use maximum forces from either end
-                            Pu = max(abs(joint_forces[n1]['fz']), abs(joint_forces[n2]['fz']))
-                            Mu_x = max(abs(joint_forces[n1]['my']), abs(joint_forces[n2]['my']))
-                            Mu_y = max(abs(joint_forces[n1]['mz']), abs(joint_forces[n2]['mz']))
-                            
-                            # Get column dimensions
-                            if len(elem) >= 10:
-                                width = elem[8]
-                                depth = elem[9]
-                            else:
-                                width = depth = 30  # default
-                            
-                            # Check if this is a seismic load case
-                            elem_is_seismic = is_seismic and ('SEISMIC' in case_name or 'seismic' in case_name.lower())
-                            
-                            # Design column
-                            design = design_calc.design_column(Pu/1000, Mu_x/12000, Mu_y/12000, 
-                                                             width, depth, is_seismic=elem_is_seismic)
-                            design_results[case_name]['columns'][elem_name] = design
-                            col_counter += 1
-                
-                # Design beams
-                design_results[case_name]['beams'] = {}
-                beam_counter = 1
-                for elem in self.elements:
-                    if elem[0] == 'BEAM':
-                        elem_name = f"B{beam_counter}"
-                        n1, n2 = elem[2], elem[3]
-                        
-                        if n1 in joint_forces and n2 in joint_forces:
-                            # Use maximum moment and shear
-                            Mu = max(abs(joint_forces[n1]['my']), abs(joint_forces[n2]['my']),
-                                    abs(joint_forces[n1]['mz']), abs(joint_forces[n2]['mz']))
-                            Vu = max(math.sqrt(joint_forces[n1]['fy']**2 + joint_forces[n1]['fz']**2),
-                                    math.sqrt(joint_forces[n2]['fy']**2 + joint_forces[n2]['fz']**2))
-                            
-                            # Get beam dimensions
-                            if len(elem) >= 10:
-                                width = elem[8]
-                                depth = elem[9]
-                            else:
-                                width = depth = 30
-                            
-                            # Design for flexure
-                            d = depth - 2.5  # assuming 2.5" cover
-                            flexure_design = design_calc.design_flexural_member(Mu/12000, width, d, depth)
-                            
-                            # Design for shear
-                            shear_design = design_calc.design_shear_reinforcement(Vu/1000, width, d, fc, fy, 
-                                                                               flexure_design.get('As_required', 0))
-                            
-                            design_results[case_name]['beams'][elem_name] = {
-                                'flexure': flexure_design,
-                                'shear': shear_design
-                            }
-                            beam_counter += 1
-                
-                # Design piles
-                design_results[case_name]['piles'] = {}
-                pile_counter = 1
-                for elem in self.elements:
-                    if elem[0] == 'PILE':
-                        elem_name = f"PI{pile_counter}"
-                        n1, n2 = elem[2], elem[3]
-                        
-                        if n1 in joint_forces:
-                            axial_load = abs(joint_forces[n1]['fz'])
-                            moment = max(abs(joint_forces[n1]['my']), abs(joint_forces[n1]['mz']))
-                            
-                            # Get pile diameter
-                            if len(elem) >= 9:
-                                diameter = elem[8]
-                            else:
-                                diameter = 24
-                            
-                            # Assume pile length
-                            pile_length = float(self.pile_length.get())
-                            
-                            # Check if seismic design
-                            pile_is_seismic = is_seismic and ('SEISMIC' in case_name or 'seismic' in case_name.lower())
-                            
-                            # Design pile
-                            design = design_calc.design_pile(axial_load/1000, moment/12000, 
-                                                            diameter, pile_length, is_seismic=pile_is_seismic)
-                            design_results[case_name]['piles'][elem_name] = design
-                            pile_counter += 1
-                
-                # Design slabs (simplified)
-                design_results[case_name]['slabs'] = {}
-                for level_name in ['mat', 'mezzanine', 'top']:
-                    # Find slab elements for this level
-                    slab_moment = 0
-                    slab_thickness = 8  # default
-                    
-                    for elem in self.elements:
-                        if elem[0] == 'SHELL' and elem[1] == level_name:
-                            # Estimate moment from surrounding elements
-                            if len(elem) >= 11:
-                                slab_thickness = elem[10] * 12  # convert to inches
-                            break
-                    
-                    # Check if roof
-                    is_roof = (level_name == 'top')
-                    
-                    # Check if seismic
-                    slab_is_seismic = is_seismic and ('SEISMIC' in case_name or 'seismic' in case_name.lower())
-                    
-                    # Simplified slab moment calculation
-                    slab_moment = 0.1 * 20**2 / 10  # 0.1 ksf load, 20ft span
-                    
-                    design = design_calc.design_slab(slab_moment, slab_thickness, fc, fy, 
-                                                    is_roof=is_roof, is_seismic=slab_is_seismic)
-                    design_results[case_name]['slabs'][level_name.upper()] = design
-                
-                # Design mat foundation
-                design_results[case_name]['mat'] = {}
-                if self.mat_points:
-                    # Estimate soil pressure
-                    total_load = sum(abs(f['fz']) for f in joint_forces.values()) / 1000  # kips
-                    mat_area = 20 * 20  # ft² (simplified)
-                    soil_pressure = total_load / mat_area  # ksf
-                    
-                    mat_thickness = float(self.mat_thickness.get()) * 12  # convert to inches
-                    design = design_calc.design_foundation_mat(soil_pressure, mat_thickness, 
-                                                              20, 20, is_seismic=is_seismic)
-                    design_results[case_name]['mat']['FOUNDATION'] = design
+            self.run_analysis_job(
+                "Structural design",
+                lambda: self.design_static_cases(static_results, fc, pile_length, mat_thickness),
+                lambda design_results: self._finish_structural_design(design_results, on_done)
+            )
             
+        except Exception as e:
+            messagebox.showerror("Design Error", f"Structural design failed: {str(e)}")
+            traceback.print_exc()
+        return None
+    
+    def _finish_structural_design(self, design_results, on_done=None):
+        """Store design results and export the calculations"""
+        try:
             self.design_results = design_results
             self.export_design_calculations()
             self.status_bar.config(text="Structural design completed with ACI 318-25")
             
-            return design_results
+            if on_done:
+                on_done(design_results)
             
         except Exception as e:
             messagebox.showerror("Design Error", f"Structural design failed: {str(e)}")
             traceback.print_exc()
-            return None
     
     def show_results(self):
         """Show analysis results"""
@@ -4267,7 +5530,7 @@ class TurbinePedestalDesigner:
     def export_dxf_with_names(self):
         """Export to DXF with proper node naming"""
         try:
-            if not self.nodes or not self.elements:
+            if len(self.nodes) == 0 or not self.elements:
                 messagebox.showwarning("Warning", "No geometry to export")
                 return
             
@@ -4328,41 +5591,34 @@ class TurbinePedestalDesigner:
             
             # Assign node names based on location and element type
             node_names = {}
-            
-            # Initialize counters
-            pile_nodes = []
-            mat_nodes = []
-            column_nodes = []
-            mezzanine_nodes = []
-            top_nodes = []
-            beam_nodes = []
-            
-            # Classify nodes by elevation and element type
+            mesh = PedestalMesh.of(self.nodes, self.elements)
+            coords = np.asarray(self.nodes, dtype=float).reshape(-1, 3)
+            
+            # Nodes touched by piles and by beams
+            frames = mesh.frames
+            pile = np.zeros(len(coords), dtype=bool)
+            beam = np.zeros(len(coords), dtype=bool)
+            for mask, elem_type in ((pile, 'PILE'), (beam, 'BEAM')):
+                of_type = frames[mesh.frame_mask(elem_type)]
+                mask[of_type['n1']] = True
+                mask[of_type['n2']] = True
+            
+            # Classify the other nodes by elevation; beam nodes are named whatever their level
             mat_z = float(self.mat_z.get())
             mezzanine_z = float(self.mezzanine_z.get())
             top_z = float(self.top_z.get())
+            z = coords[:, 2]
             
-            for i, (x, y, z) in enumerate(self.nodes):
-                # Check if node belongs to piles
-                for elem in self.elements:
-                    if elem[0] == 'PILE' and (elem[2] == i or elem[3] == i):
-                        pile_nodes.append(i)
-                        break
-                else:  # Not a pile node
-                    # Check mat level (lowest Z)
-                    if abs(z - mat_z) < 1.0:
-                        mat_nodes.append(i)
-                    # Check mezzanine level
-                    elif abs(z - mezzanine_z) < 1.0:
-                        mezzanine_nodes.append(i)
-                    # Check top level
-                    elif abs(z - top_z) < 1.0:
-                        top_nodes.append(i)
-                    # Check if node belongs to beams
-                    for elem in self.elements:
-                        if elem[0] == 'BEAM' and (elem[2] == i or elem[3] == i):
-                            beam_nodes.append(i)
-                            break
+            mat = ~pile & (np.abs(z - mat_z) < 1.0)
+            mezzanine = ~pile & ~mat & (np.abs(z - mezzanine_z) < 1.0)
+            top = ~pile & ~mat & ~mezzanine & (np.abs(z - top_z) < 1.0)
+            
+            pile_nodes = np.flatnonzero(pile).tolist()
+            mat_nodes = np.flatnonzero(mat).tolist()
+            column_nodes = []
+            mezzanine_nodes = np.flatnonzero(mezzanine).tolist()
+            top_nodes = np.flatnonzero(top).tolist()
+            beam_nodes = np.flatnonzero(~pile & beam).tolist()
             
             # Assign names
             for i, node_idx in enumerate(pile_nodes):
@@ -4394,27 +5650,18 @@ class TurbinePedestalDesigner:
                     # FIXED: Use dxf.insert property instead of set_location
                     text.dxf.insert = (x_m + 0.1, y_m + 0.1, z_m)
         
-            # Add elements
-            for elem in self.elements:
-                elem_type = elem[0]
-                
-                if elem_type in ['COLUMN', 'BEAM', 'PILE', 'LINK']:
-                    n1, n2 = elem[2], elem[3]
-                    if all(n < len(self.nodes) for n in [n1, n2]):
-                        x1, y1, z1 = self.nodes[n1]
-                        x2, y2, z2 = self.nodes[n2]
-                        
-                        x1_m, y1_m, z1_m = x1*0.3048, y1*0.3048, z1*0.3048
-                        x2_m, y2_m, z2_m = x2*0.3048, y2*0.3048, z2*0.3048
-                        
-                        layer = {
-                            'COLUMN': 'COLUMNS',
-                            'BEAM': 'BEAMS',
-                            'PILE': 'PILES',
-                            'LINK': 'SHELLS'
-                        }.get(elem_type, 'SHELLS')
-                        
-                        msp.add_line((x1_m, y1_m, z1_m), (x2_m, y2_m, z2_m), dxfattribs={'layer': layer})
+            # Add frame elements, converted to meters in one step
+            layer_of_type = {
+                'COLUMN': 'COLUMNS',
+                'BEAM': 'BEAMS',
+                'PILE': 'PILES',
+                'LINK': 'SHELLS'
+            }
+            frames = frames[(frames['n1'] < len(coords)) & (frames['n2'] < len(coords))]
+            ends_m = coords[np.column_stack([frames['n1'], frames['n2']])] * 0.3048
+            for type_code, (start, end) in zip(frames['type'].tolist(), ends_m.tolist()):
+                layer = layer_of_type[FRAME_ELEMENT_TYPES[type_code]]
+                msp.add_line(tuple(start), tuple(end), dxfattribs={'layer': layer})
             
             doc.saveas(filepath)
             self.status_bar.config(text=f"DXF exported with node names: {os.path.basename(filepath)}")
@@ -4453,7 +5700,7 @@ class TurbinePedestalDesigner:
                     max_disp = np.max(np.abs(results['displacements']))
                     max_displacement = max(max_displacement, max_disp)
             
-            self.results_text.insert(tk.END, f"- Maximum Displacement: {max_displacement*12:.3f} in\n\n")
+            self.results_text.insert(tk.END, f"- Maximum Displacement: {max_displacement:.3f} in\n\n")
         
         if 'dynamic' in self.results:
             self.results_text.insert(tk.END, "DYNAMIC ANALYSIS:\n")
@@ -4496,7 +5743,7 @@ class TurbinePedestalDesigner:
         """Update plot based on view selection"""
         self.figure.clear()
         
-        if not self.nodes:
+        if len(self.nodes) == 0:
             ax = self.figure.add_subplot(111)
             ax.text(0.5, 0.5, "No geometry to display", 
                    ha='center', va='center', transform=ax.transAxes)
@@ -4520,62 +5767,31 @@ class TurbinePedestalDesigner:
                 # Plot all nodes
                 ax.scatter(nodes[:,0], nodes[:,1], nodes[:,2], c='b', s=10, alpha=0.6)
                 
-                # Plot elements based on view
-                for elem in self.elements:
-                    elem_type = elem[0]
-                    
-                    # Filter by view
-                    if view == "Column View" and elem_type != 'COLUMN':
-                        continue
-                    if view == "Beam View" and elem_type != 'BEAM':
-                        continue
-                    if view == "Slab Mesh" and elem_type != 'SHELL':
-                        continue
-                    
-                    # Colors
+                # Plot elements based on view, one line collection per element type
+                mesh = PedestalMesh.of(self.nodes, self.elements)
+                view_types = {"Column View": ['COLUMN'], "Beam View": ['BEAM'], "Slab Mesh": ['SHELL']}
+                element_styles = {
+                    'SHELL': ('lightblue', 0.3, 0.5),
+                    'COLUMN': ('red', 0.8, 2),
+                    'BEAM': ('green', 0.8, 2),
+                    'PILE': ('brown', 0.8, 2),
+                    'LINK': ('orange', 0.5, 1),
+                }
+                
+                for elem_type in view_types.get(view, ['SHELL', 'COLUMN', 'BEAM', 'PILE', 'LINK']):
                     if elem_type == 'SHELL':
-                        color = 'lightblue'
-                        alpha = 0.3
-                        linewidth = 0.5
-                    elif elem_type == 'COLUMN':
-                        color = 'red'
-                        alpha = 0.8
-                        linewidth = 2
-                    elif elem_type == 'BEAM':
-                        color = 'green'
-                        alpha = 0.8
-                        linewidth = 2
-                    elif elem_type == 'PILE':
-                        color = 'brown'
-                        alpha = 0.8
-                        linewidth = 2
-                    elif elem_type == 'LINK':
-                        color = 'orange'
-                        alpha = 0.5
-                        linewidth = 1
+                        # Closed outline of each quad
+                        connectivity = mesh.shells['nodes'][:, [0, 1, 2, 3, 0]]
                     else:
-                        color = 'gray'
-                        alpha = 0.5
-                        linewidth = 1
-                    
-                    # Plot element
-                    if elem_type == 'SHELL' and len(elem) >= 6:  # Quad
-                        n1, n2, n3, n4 = elem[2], elem[3], elem[4], elem[5]
-                        if all(n < len(self.nodes) for n in [n1, n2, n3, n4]):
-                            x = [self.nodes[n1][0], self.nodes[n2][0], self.nodes[n3][0], self.nodes[n4][0], self.nodes[n1][0]]
-                            y = [self.nodes[n1][1], self.nodes[n2][1], self.nodes[n3][1], self.nodes[n4][1], self.nodes[n1][1]]
-                            z = [self.nodes[n1][2], self.nodes[n2][2], self.nodes[n3][2], self.nodes[n4][2], self.nodes[n1][2]]
-                            
-                            ax.plot(x, y, z, color=color, linewidth=linewidth, alpha=alpha)
+                        frames = mesh.frames[mesh.frame_mask(elem_type)]
+                        connectivity = np.column_stack([frames['n1'], frames['n2']])
+                    connectivity = connectivity[np.all(connectivity < len(nodes), axis=1)]
+                    if len(connectivity) == 0:
+                        continue
                     
-                    elif elem_type in ['COLUMN', 'BEAM', 'PILE', 'LINK']:
-                        n1, n2 = elem[2], elem[3]
-                        if all(n < len(self.nodes) for n in [n1, n2]):
-                            x = [self.nodes[n1][0], self.nodes[n2][0]]
-                            y = [self.nodes[n1][1], self.nodes[n2][1]]
-                            z = [self.nodes[n1][2], self.nodes[n2][2]]
-                            
-                            ax.plot(x, y, z, color=color, linewidth=linewidth, alpha=alpha)
+                    color, alpha, linewidth = element_styles[elem_type]
+                    ax.add_collection3d(Line3DCollection(nodes[connectivity], colors=color,
+                                                         linewidths=linewidth, alpha=alpha))
                 
                 ax.set_xlabel('X (ft)')
                 ax.set_ylabel('Y (ft)')
@@ -4625,8 +5841,627 @@ class TurbinePedestalDesigner:
         except Exception as e:
             messagebox.showerror("Save Error", f"Failed to save plot: {str(e)}")
 
+# --- HEADLESS BATCH ANALYSIS ---
+# Model file tables: JSON key -> (input table, number of columns read as in auto_mesh)
+BATCH_MODEL_TABLES = {
+    'mat': ("Mat Foundation", 4),
+    'mezzanine': ("Mezzanine Level", 4),
+    'top': ("Top Floor", 4),
+    'columns': ("Columns", 7),
+    'piles': ("Piles", 5),
+    'beams': ("Beams", 9),
+}
+
+# Model file settings: JSON key -> (designer input, GUI default)
+BATCH_MODEL_SETTINGS = {
+    'mesh_size': ('mesh_size_var', "2.0"),
+    'E': ('e_val', "3.60E+6"),
+    'density': ('den_val', "0.0868"),
+    'nu': ('nu_val', "0.2"),
+    'fc': ('fc_val', "4000"),
+    'soil_kz': ('soil_kz_val', "100.0"),
+    'soil_kxy': ('soil_kxy_val', "10.0"),
+    'spring_factor': ('spring_factor_val', "1.0"),
+    'solver': ('solver_val', "auto"),
+    'preconditioner': ('preconditioner_val', "auto"),
+    'solver_tolerance': ('solver_tol_val', "1e-8"),
+    'solver_max_iterations': ('solver_maxiter_val', "5000"),
+    'parallel_workers': ('parallel_workers_val', "1"),
+    'dof_ordering': ('dof_ordering_val', "natural"),
+    'site_class': ('site_class', "D"),
+    'mat_z': ('mat_z', "-4.6"),
+    'mat_thickness': ('mat_thickness', "3.0"),
+    'pile_diameter': ('pile_diameter', "24"),
+    'pile_length': ('pile_length', "20"),
+    'edge_distance_factor': ('edge_distance_factor', "1.8"),
+    'pile_spacing_factor': ('pile_spacing_factor', "2.2"),
+}
+
+# Demand/capacity ratios reported by ACIDesignCalculator
+DESIGN_UTILIZATION_KEYS = ['capacity_ratio', 'moment_capacity_ratio', 'bearing_ratio',
+                           'punching_shear_ratio', 'beam_shear_ratio']
+
+def load_batch_model(path):
+    """Read a JSON batch model; each geometry table is a list of rows or the path of a CSV file"""
+    with open(path) as f:
+        model = json.load(f)
+    
+    base_dir = os.path.dirname(os.path.abspath(path))
+    for key, (table_name, n_columns) in BATCH_MODEL_TABLES.items():
+        rows = model.get(key, [])
+        if isinstance(rows, str):
+            # CSV tables carry the column headings of the input table
+            rows = pd.read_csv(os.path.join(base_dir, rows)).fillna(0.0).values.tolist()
+        
+        table = []
+        for row in rows:
+            if len(row) < n_columns:
+                raise ValueError(f"{table_name} rows need {n_columns} values, got {row}")
+            table.append([float(value) for value in row[:n_columns]])
+        model[key] = table
+    
+    unknown = set(model.get('settings', {})) - set(BATCH_MODEL_SETTINGS)
+    if unknown:
+        raise ValueError(f"Unknown model settings: {', '.join(sorted(unknown))}")
+    
+    return model
+
+def _json_default(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+def design_utilization(design_results):
+    """Largest utilization ratio and number of failed checks in nested design results"""
+    max_ratio, failed_checks = 0.0, 0
+    pending = [design_results]
+    while pending:
+        for key, value in pending.pop().items():
+            if isinstance(value, dict):
+                pending.append(value)
+            elif key in DESIGN_UTILIZATION_KEYS and isinstance(value, (int, float, np.number)):
+                max_ratio = max(max_ratio, float(value))
+            elif key == 'design_status' and not str(value).startswith('OK'):
+                failed_checks += 1
+    
+    return max_ratio, failed_checks
+
+class BatchValue:
+    def __init__(self, value):
+        self.value = str(value)
+    
+    def get(self):
+        return self.value
+    
+    def set(self, value):
+        self.value = str(value)
+
+class BatchPedestalDesigner(PedestalDesignModel):
+    def __init__(self, model):
+        # Same model state as the GUI designer, plain values in place of the Tk inputs
+        super().__init__()
+        self.load_cases = copy.deepcopy(model.get('load_cases', {}))
+        self.model_name = model.get('name', "Turbine Pedestal")
+        
+        settings = model.get('settings', {})
+        for key, (var_name, default) in BATCH_MODEL_SETTINGS.items():
+            setattr(self, var_name, BatchValue(settings.get(key, default)))
+        self.mesh_size = float(self.mesh_size_var.get())
+        
+        # Geometry data
+        self.mat_points = model['mat']
+        self.mezzanine_points = model['mezzanine']
+        self.top_points = model['top']
+        self.column_lines = model['columns']
+        self.pile_lines = model['piles']
+        self.beam_lines = model['beams']
+        
+        # Special load cases and combinations
+        self.special_load_cases = copy.deepcopy(model.get('special_load_cases', SPECIAL_LOAD_CASES))
+        self.custom_combinations = {combo_id: {'formula': formula}
+                                    for combo_id, formula in model.get('custom_combinations', {}).items()}
+        self.combination_ids = model.get('combinations', list(LOAD_COMBINATION_FACTORS))
+        
+        # Seismic parameters
+        self.seismic_zone = model.get('seismic_zone', 'C')
+    
+    def apply_engine_settings(self):
+        """Push material, soil, solver and seismic settings of the model to the engine"""
+        super().apply_engine_settings()
+        self.engine.E = float(self.e_val.get())
+        self.engine.density = float(self.den_val.get())
+        self.engine.nu = float(self.nu_val.get())
+    
+    def run(self):
+        """Mesh, static, seismic, combination, modal and design steps of the full analysis"""
+        self.generate_mesh()
+        return self.analyze()
+    
+    def generate_mesh(self):
+        """Push the engine settings and mesh the model geometry"""
+        self.apply_engine_settings()
+        self.nodes, self.elements = self.engine.generate_complete_mesh(
+            self.mat_points, self.mezzanine_points, self.top_points,
+            self.column_lines, self.pile_lines, self.beam_lines, self.mesh_size
+        )
+    
+    def analyze(self):
+        """Analyze and design the current mesh for the current load cases"""
+        self.results = {}
+        self.create_auto_loads()
+        
+        # Seismic cases are solved with the other primitive cases on one factorization
+        seismic_results, seismic_loads = self.engine.seismic_load_cases(self.nodes, self.elements)
+        self.load_cases_applied.update(seismic_loads)
+        self.results['seismic'] = seismic_results
+        self.results['static'] = self.engine.calculate_static_forces(
+            self.nodes, self.elements, self.load_cases_applied
+        )
+        
+        # Selected combinations plus the custom and ACI 318-25 table combinations
+        combinations = {}
+        for combo_id in list(self.combination_ids) + list(self.custom_combinations) + list(ACI_LOAD_COMBINATIONS):
+            combinations.setdefault(combo_id, self.get_combination_factors(combo_id))
+        self.results['combinations'] = self.engine.analyze_load_combinations(
+            self.nodes, self.elements, self.load_cases_applied, combinations
+        )
+        try:
+            self.results['dynamic'] = {
+                'frequencies': self.engine.calculate_natural_frequencies(self.nodes, self.elements)
+            }
+        except Exception as e:
+            # The static design stands on its own; without frequencies the vibration check fails
+            print(f"Natural frequency analysis failed: {str(e)}")
+            self.results['dynamic'] = {'frequencies': np.array([]), 'error': str(e)}
+        
+        self.design_results = self.design_static_cases(
+            self.results['static'], float(self.fc_val.get()), float(self.pile_length.get()),
+            float(self.mat_thickness.get()) * 12  # convert to inches
+        )
+        return self.design_results
+    
+    def apply_design_parameters(self, parameters):
+        """Set swept pile, column and mat sizes; piles are re-arranged inside the mat when their size or spacing changes"""
+        unknown = set(parameters) - set(SWEEP_PARAMETERS)
+        if unknown:
+            raise ValueError(f"Unknown sweep parameters: {', '.join(sorted(unknown))}")
+        
+        if 'column_size' in parameters:
+            size = float(parameters['column_size'])
+            self.column_lines = [row[:4] + [size, size, size] for row in self.column_lines]
+        
+        if 'mat_thickness' in parameters:
+            self.mat_thickness.set(parameters['mat_thickness'])
+            self.mat_points = [row[:3] + [float(parameters['mat_thickness'])] for row in self.mat_points]
+        
+        if 'pile_diameter' in parameters or 'pile_spacing_factor' in parameters:
+            for name in ['pile_diameter', 'pile_spacing_factor']:
+                if name in parameters:
+                    getattr(self, name).set(parameters[name])
+            self.pile_lines = self.pile_layout_inside_mat(
+                self.mat_points, float(self.pile_diameter.get()) / 12, float(self.pile_length.get()),
+                float(self.mat_z.get()), float(self.edge_distance_factor.get()),
+                float(self.pile_spacing_factor.get())
+            )
+    
+    def design_summary(self):
+        """Governing utilization, displacement, first frequency and concrete volume of the analyzed design"""
+        max_utilization, failed_checks = design_utilization(self.design_results)
+        
+        analyses = list(self.results.get('static', {}).values()) + list(self.results.get('combinations', {}).values())
+        max_displacement = max((float(np.abs(np.asarray(results['displacements']).reshape(-1, 6)[:, :3]).max())
+                                for results in analyses if len(results['displacements'])), default=0.0)
+        
+        frequencies = self.results.get('dynamic', {}).get('frequencies', np.array([]))
+        first_frequency = float(frequencies[0]) if len(frequencies) else 0.0
+        
+        return {
+            'piles': len(self.pile_lines),
+            'nodes': len(self.nodes),
+            'max_utilization': max_utilization,
+            'failed_checks': failed_checks,
+            'max_displacement_in': max_displacement,
+            'first_frequency_hz': first_frequency,
+            'concrete_volume_cy': self.engine.concrete_volume(self.nodes, self.elements) / 27,
+        }
+    
+    def write_results(self, output_dir):
+        """Write summary, displacement, force and design files; return their paths"""
+        os.makedirs(output_dir, exist_ok=True)
+        coords = np.array(self.nodes, dtype=float).reshape(-1, 3)
+        node_ids = np.arange(len(coords))
+        
+        analyses = [('static', name, results) for name, results in self.results.get('static', {}).items()]
+        analyses += [('combination', name, results) for name, results in self.results.get('combinations', {}).items()]
+        
+        displacement_tables, frame_tables, joint_tables, case_summary = [], [], [], []
+        for kind, case_name, results in analyses:
+            disp = np.asarray(results['displacements']).reshape(-1, 6)
+            table = pd.DataFrame(np.hstack([coords, disp]),
+                                 columns=['x', 'y', 'z', 'ux', 'uy', 'uz', 'rx', 'ry', 'rz'])
+            table.insert(0, 'node', node_ids)
+            table.insert(0, 'case', case_name)
+            displacement_tables.append(table)
+            
+            frame_forces = results['internal_forces']
+            table = pd.DataFrame(frame_forces['end_forces'].reshape(-1, 12), columns=FRAME_END_FORCE_KEYS)
+            for field in ['depth', 'width', 'length', 'node2', 'node1', 'type', 'element']:
+                table.insert(0, field, frame_forces[field])
+            table.insert(0, 'case', case_name)
+            frame_tables.append(table)
+            
+            joint_forces = results['joint_forces']
+            table = pd.DataFrame(joint_forces.forces, columns=JointForces.COMPONENTS)
+            table.insert(0, 'node', node_ids)
+            table.insert(0, 'case', case_name)
+            joint_tables.append(table)
+            
+            drift_ratios = [drift['drift_ratio'] for drift in results.get('story_drifts', {}).values()]
+            case_summary.append({
+                'case': case_name,
+                'type': kind,
+                'max_displacement_in': float(np.abs(disp[:, :3]).max()) if len(disp) else 0.0,
+                'max_joint_shear': float(joint_forces.max_shear.max()) if len(joint_forces) else 0.0,
+                'max_joint_moment': float(joint_forces.max_moment.max()) if len(joint_forces) else 0.0,
+                'max_drift_ratio': float(max(drift_ratios)) if drift_ratios else 0.0,
+                'load_factors': results.get('load_factors', {}),
+            })
+        
+        paths = {
+            'summary': os.path.join(output_dir, "summary.json"),
+            'displacements': os.path.join(output_dir, "displacements.csv"),
+            'frame_forces': os.path.join(output_dir, "frame_forces.csv"),
+            'joint_forces': os.path.join(output_dir, "joint_forces.csv"),
+            'design': os.path.join(output_dir, "design.json"),
+        }
+        
+        if analyses:
+            pd.concat(displacement_tables).to_csv(paths['displacements'], index=False)
+            pd.concat(frame_tables).to_csv(paths['frame_forces'], index=False)
+            pd.concat(joint_tables).to_csv(paths['joint_forces'], index=False)
+        
+        element_counts = PedestalMesh.of(self.nodes, self.elements).element_counts()
+        
+        summary = {
+            'model': self.model_name,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'mesh_size_ft': self.mesh_size,
+            'nodes': len(self.nodes),
+            'elements': element_counts,
+            'seismic_zone': self.seismic_zone,
+            'site_class': self.site_class.get(),
+            'seismic_parameters': self.results.get('seismic', {}).get('seismic_parameters', {}),
+            'natural_frequencies_hz': self.results.get('dynamic', {}).get('frequencies', []),
+            'load_cases': case_summary,
+        }
+        with open(paths['summary'], "w") as f:
+            json.dump(summary, f, indent=2, default=_json_default)
+        with open(paths['design'], "w") as f:
+            json.dump(self.design_results, f, indent=2, default=_json_default)
+        
+        return paths
+
+# --- PARAMETRIC DESIGN SWEEP ---
+SWEEP_PARAMETERS = ['pile_diameter', 'pile_spacing_factor', 'column_size', 'mat_thickness']
+
+# Vibration criterion of the dynamic check: first mode above 8 Hz
+SWEEP_MIN_FREQUENCY = 8.0
+
+def sweep_parameter_values(spec):
+    """Values of one swept parameter from a list, a single value or a {start, stop, step} range"""
+    if isinstance(spec, dict):
+        values = np.arange(spec['start'], spec['stop'] + spec['step'] / 2, spec['step'])
+        return [round(float(value), 6) for value in values]
+    if isinstance(spec, (list, tuple)):
+        return [float(value) for value in spec]
+    return [float(spec)]
+
+def sweep_variants(parameter_ranges):
+    """Parameter dicts of every combination of the swept values"""
+    unknown = set(parameter_ranges) - set(SWEEP_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters: {', '.join(sorted(unknown))}")
+    
+    names = [name for name in SWEEP_PARAMETERS if name in parameter_ranges]
+    values = [sweep_parameter_values(parameter_ranges[name]) for name in names]
+    return [dict(zip(names, combo)) for combo in product(*values)]
+
+# Engine of a sweep worker process, kept between variants so its element stiffness cache is reused
+_sweep_engine = None
+
+def _run_sweep_variant(task):
+    """Mesh one variant once and analyze it for every load set on the same factorization"""
+    global _sweep_engine
+    model, load_sets, parameters = task
+    try:
+        designer = BatchPedestalDesigner(model)
+        if _sweep_engine is not None:
+            designer.engine = _sweep_engine
+        _sweep_engine = designer.engine
+        
+        designer.apply_design_parameters(parameters)
+        designer.generate_mesh()
+        
+        row = {}
+        for load_cases in load_sets.values():
+            designer.load_cases = copy.deepcopy(load_cases)
+            designer.analyze()
+            summary = designer.design_summary()
+            # Governing values over the load sets; the frequency does not depend on the loads
+            for key, value in summary.items():
+                if key == 'failed_checks':
+                    row[key] = row.get(key, 0) + value
+                else:
+                    row[key] = max(row.get(key, value), value)
+        
+        row['vibration_ok'] = row['first_frequency_hz'] > SWEEP_MIN_FREQUENCY
+        row['passed'] = row['failed_checks'] == 0 and row['max_utilization'] <= 1.0 and row['vibration_ok']
+        return row
+    
+    except Exception as e:
+        print(f"Sweep variant {parameters} failed: {str(e)}")
+        return {'passed': False, 'error': str(e)}
+
+def _run_sweep_variant_in_worker(task):
+    with _quiet_worker():
+        return _run_sweep_variant(task)
+
+def run_parametric_sweep(model, parameter_ranges, load_sets=None, workers=1):
+    """Analyze and design every variant in worker processes; rows ranked cheapest passing design first"""
+    variants = sweep_variants(parameter_ranges)
+    if not load_sets:
+        load_sets = {'model': model.get('load_cases', {})}
+    
+    workers = min(workers or os.cpu_count() or 1, len(variants))
+    print(f"Parametric sweep: {len(variants)} variants x {len(load_sets)} load sets on {max(workers, 1)} worker(s)")
+    
+    if workers > 1:
+        # One process per variant at a time; no nested solver pools inside the workers
+        model = copy.deepcopy(model)
+        model.setdefault('settings', {})['parallel_workers'] = 1
+        tasks = [(model, load_sets, parameters) for parameters in variants]
+        with _process_pool(workers) as pool:
+            futures = [pool.submit(_run_sweep_variant_in_worker, task) for task in tasks]
+        # Variants whose worker failed are rerun here, where their own errors become error rows
+        summaries = [future.result() if future.exception() is None else _run_sweep_variant(task)
+                     for future, task in zip(futures, tasks)]
+    else:
+        summaries = [_run_sweep_variant((model, load_sets, parameters)) for parameters in variants]
+    
+    rows = [{'variant': i + 1, **parameters, **summary}
+            for i, (parameters, summary) in enumerate(zip(variants, summaries))]
+    rows.sort(key=lambda row: (not row['passed'], row.get('concrete_volume_cy', math.inf),
+                               row.get('max_utilization', math.inf)))
+    for rank, row in enumerate(rows, 1):
+        row['rank'] = rank
+    
+    return rows
+
+# --- BENCHMARK SUITE ---
+# Synthetic pedestal models: name -> (target DOF, mesh size in ft)
+BENCHMARK_SCALES = {
+    '1k': (1000, 4.0),
+    '10k': (10000, 1.0),
+    '100k': (100000, 0.5),
+}
+
+def benchmark_model(target_dof, mesh_size):
+    """Square pedestal with mat, mezzanine and top slabs sized to about target_dof at mesh_size"""
+    # Three slab levels of (n + 1)² nodes with 6 DOF each
+    n = max(2, int(round(math.sqrt(target_dof / 18.0))) - 1)
+    size = n * mesh_size
+    mat_z, mezzanine_z, top_z, mat_thick = -4.6, 15.0, 30.0, 3.0
+    corners = [[0, 0], [size, 0], [size, size], [0, size]]
+    
+    return {
+        'name': f"Benchmark {target_dof} DOF",
+        'settings': {'mesh_size': mesh_size},
+        'mat': [[x, y, mat_z, mat_thick] for x, y in corners],
+        'mezzanine': [[x, y, mezzanine_z, 1.0] for x, y in corners],
+        'top': [[x, y, top_z, 1.0] for x, y in corners],
+        'columns': [[x, y, mat_z + mat_thick / 2, top_z, 30, 30, 30] for x, y in corners],
+        'piles': [],
+        'beams': [corners[i] + [mezzanine_z] + corners[(i + 1) % 4] + [mezzanine_z, 30, 30, 30]
+                  for i in range(4)],
+        'load_cases': {
+            'DL': {'type': 'Uniform', 'fx': 0, 'fy': 0, 'fz': -150000},
+            'LL': {'type': 'Uniform', 'fx': 0, 'fy': 0, 'fz': -100000},
+            'WINDX': {'type': 'Wind', 'fx': 50000, 'fy': 0, 'fz': 0}
+        },
+    }
+
+def _benchmark_stage(stages, name, work, trace_memory):
+    """Run one stage and record its wall time and tracemalloc peak (SuperLU factors are not traced)"""
+    if trace_memory:
+        tracemalloc.reset_peak()
+        start_memory = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    result = work()
+    stages[name] = {'seconds': time.perf_counter() - start}
+    if trace_memory:
+        stages[name]['peak_mb'] = (tracemalloc.get_traced_memory()[1] - start_memory) / 2**20
+    return result
+
+def run_benchmark(scales=None, trace_memory=True):
+    """Time the analysis pipeline stages on synthetic models; returns a JSON-ready report"""
+    scales = scales or list(BENCHMARK_SCALES)
+    unknown = set(scales) - set(BENCHMARK_SCALES)
+    if unknown:
+        raise ValueError(f"Unknown benchmark scales: {', '.join(sorted(unknown))}")
+    
+    report = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'pyamg': PYAMG_AVAILABLE,
+        'memory_traced': trace_memory,
+        'models': [],
+    }
+    
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        for scale in scales:
+            target_dof, mesh_size = BENCHMARK_SCALES[scale]
+            print(f"Benchmark {scale}: about {target_dof} DOF at {mesh_size}ft mesh")
+            designer = BatchPedestalDesigner(benchmark_model(target_dof, mesh_size))
+            designer.pile_lines = designer.pile_layout_inside_mat(
+                designer.mat_points, float(designer.pile_diameter.get()) / 12, float(designer.pile_length.get()),
+                float(designer.mat_z.get()), float(designer.edge_distance_factor.get()),
+                float(designer.pile_spacing_factor.get())
+            )
+            engine = designer.engine
+            stages = {}
+            
+            _benchmark_stage(stages, 'mesh', designer.generate_mesh, trace_memory)
+            nodes, elements = designer.nodes, designer.elements
+            designer.create_auto_loads()
+            case_names = list(designer.load_cases_applied)
+            F = np.column_stack([engine.load_case_array(designer.load_cases_applied[name], len(nodes)).ravel()
+                                 for name in case_names])
+            
+            K, free_dofs, stabilization = _benchmark_stage(
+                stages, 'assembly',
+                lambda: engine._condition_stiffness(engine._assemble_stiffness_matrix(nodes, elements), nodes, elements),
+                trace_memory
+            )
+            
+            def solve():
+                system = engine.factorize_stiffness(K, free_dofs, stabilization)
+                U = system.solve(F)
+                return system, U, system.reactions(U)
+            
+            system, U, R = _benchmark_stage(stages, 'solve', solve, trace_memory)
+            internal_forces = _benchmark_stage(
+                stages, 'internal_forces',
+                lambda: [engine._calculate_internal_forces(nodes, elements, U[:, col]) for col in range(len(case_names))],
+                trace_memory
+            )
+            joint_forces = _benchmark_stage(
+                stages, 'joint_forces',
+                lambda: [engine._calculate_joint_forces(nodes, elements, internal_forces[col], R[:, col])
+                         for col in range(len(case_names))],
+                trace_memory
+            )
+            
+            static_results = {name: {'displacements': U[:, col], 'reactions': R[:, col],
+                                     'internal_forces': internal_forces[col], 'joint_forces': joint_forces[col]}
+                              for col, name in enumerate(case_names)}
+            _benchmark_stage(
+                stages, 'design',
+                lambda: designer.design_static_cases(static_results, float(designer.fc_val.get()),
+                                                     float(designer.pile_length.get()),
+                                                     float(designer.mat_thickness.get()) * 12),
+                trace_memory
+            )
+            
+            report['models'].append({
+                'scale': scale,
+                'target_dof': target_dof,
+                'mesh_size_ft': mesh_size,
+                'plan_size_ft': designer.mat_points[1][0],
+                'nodes': len(nodes),
+                'dof': len(nodes) * 6,
+                'free_dof': len(free_dofs),
+                'elements': len(elements),
+                'load_cases': len(case_names),
+                'solver': system.method,
+                'stages': stages,
+                'total_seconds': sum(stage['seconds'] for stage in stages.values()),
+            })
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    
+    return report
+
+def batch_argument_parser():
+    """Command line options; without a batch, sweep or benchmark mode the GUI starts"""
+    parser = argparse.ArgumentParser(description="Turbine pedestal batch analysis and ACI 318-25 design")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--batch", metavar="MODEL", help="JSON model file")
+    mode.add_argument("--sweep", metavar="SWEEP", help="JSON sweep file: model, parameters, load_sets, workers")
+    mode.add_argument("--benchmark", action="store_true", help="time the pipeline stages on synthetic models")
+    parser.add_argument("--output", metavar="PATH",
+                        help="result directory (default: <input>_results) or benchmark report file")
+    parser.add_argument("--scales", default=",".join(BENCHMARK_SCALES),
+                        help=f"benchmark model scales (default: {','.join(BENCHMARK_SCALES)})")
+    parser.add_argument("--no-memory", action="store_true", help="benchmark without tracemalloc peak memory")
+    return parser
+
+def run_batch(args):
+    """Command line entry: analyze and design a model file, or sweep its parameters, without the GUI"""
+    is_valid, msg = verify_license()
+    if not is_valid:
+        print(f"ACCESS DENIED: {msg}")
+        return 2
+    print(msg)
+    
+    if args.benchmark:
+        report_path = args.output or "benchmark_report.json"
+        try:
+            report = run_benchmark(args.scales.split(","), trace_memory=not args.no_memory)
+        except Exception as e:
+            print(f"Benchmark failed: {str(e)}")
+            traceback.print_exc()
+            return 1
+        
+        with open(report_path, "w") as f:
+            json.dump(report, f, indent=2, default=_json_default)
+        for model in report['models']:
+            print(f"{model['scale']:>5}: {model['dof']} DOF, " + ", ".join(
+                f"{name} {stage['seconds']:.2f}s" for name, stage in model['stages'].items()))
+        print(f"Wrote {report_path}")
+        return 0
+    
+    input_path = args.batch or args.sweep
+    output_dir = args.output or os.path.splitext(input_path)[0] + "_results"
+    try:
+        if args.batch:
+            designer = BatchPedestalDesigner(load_batch_model(args.batch))
+            designer.run()
+            paths = designer.write_results(output_dir)
+        else:
+            with open(args.sweep) as f:
+                sweep = json.load(f)
+            model = load_batch_model(os.path.join(os.path.dirname(os.path.abspath(args.sweep)), sweep['model']))
+            rows = run_parametric_sweep(model, sweep.get('parameters', {}), sweep.get('load_sets'),
+                                        int(sweep.get('workers', 0)))
+            
+            os.makedirs(output_dir, exist_ok=True)
+            paths = {'sweep': os.path.join(output_dir, "sweep_results.csv")}
+            table = pd.DataFrame(rows)
+            leading = ['rank', 'variant'] + [name for name in SWEEP_PARAMETERS if name in table.columns]
+            table[leading + [col for col in table.columns if col not in leading]].to_csv(paths['sweep'], index=False)
+            
+            passing = [row for row in rows if row['passed']]
+            if passing:
+                best = passing[0]
+                print("Cheapest passing design: " + ", ".join(f"{name}={best[name]}" for name in SWEEP_PARAMETERS if name in best)
+                      + f" ({best['concrete_volume_cy']:.1f} cy)")
+            else:
+                print("No variant passed all design checks")
+    except Exception as e:
+        print(f"Batch analysis failed: {str(e)}")
+        traceback.print_exc()
+        return 1
+    
+    for path in paths.values():
+        if os.path.exists(path):
+            print(f"Wrote {path}")
+    return 0
+
 # --- MAIN EXECUTION ---
 if __name__ == "__main__":
+    args = batch_argument_parser().parse_args()
+    if args.batch or args.sweep or args.benchmark:
+        sys.exit(run_batch(args))
+    
     root = tk.Tk()
     app = TurbinePedestalDesigner(root)
     root.mainloop()
\ No newline at end of file
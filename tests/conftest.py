@@ -0,0 +1,35 @@
+import contextlib
+import importlib.util
+import io
+import os
+
+import pytest
+
+MODULE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           "Turbine Pedestal Designer rev.7.py")
+
+
+@pytest.fixture(scope="session")
+def designer_module():
+    spec = importlib.util.spec_from_file_location("turbine_pedestal_designer", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="session")
+def pedestal_mesh(designer_module):
+    """Nodes and elements of a 20 ft pedestal: three slabs, four columns, four beams and four piles"""
+    size, mat_z, thick = 20.0, -4.6, 3.0
+    corners = [[0, 0], [size, 0], [size, size], [0, size]]
+    mat = [[x, y, mat_z, thick] for x, y in corners]
+    mezzanine = [[x, y, 15.0, 1.0] for x, y in corners]
+    top = [[x, y, 30.0, 1.0] for x, y in corners]
+    columns = [[x, y, mat_z + thick / 2, 30.0, 30, 30, 30] for x, y in corners]
+    piles = [[x, y, mat_z, mat_z - 20, 24.0] for x in (4, 16) for y in (4, 16)]
+    beams = [[0, 0, 15.0, size, 0, 15.0, 24, 30, 30], [0, size, 15.0, size, size, 15.0, 24, 30, 30]]
+
+    engine = designer_module.StructuralAnalysisEngine()
+    with contextlib.redirect_stdout(io.StringIO()):
+        nodes, elements = engine.generate_complete_mesh(mat, mezzanine, top, columns, piles, beams, mesh_size=4.0)
+    return nodes, elements
@@ -0,0 +1,60 @@
+import pytest
+
+CASES = {'DL': 1, 'LL': 1, 'Lr': 1, 'S': 1, 'WINDX': 1, 'WINDY': 1, 'SEISMIC_X': 1, 'SEISMIC_Y': 1}
+
+
+def test_factors_and_signs(designer_module):
+    factors = designer_module.parse_combination_formula('1.2*DL + 1.6*LL - 0.5*S', CASES)
+    assert factors == {'DL': 1.2, 'LL': 1.6, 'S': -0.5}
+
+
+def test_implicit_and_leading_decimal_factors(designer_module):
+    factors = designer_module.parse_combination_formula('DL + .5*LL - Lr', CASES)
+    assert factors == {'DL': 1.0, 'LL': 0.5, 'Lr': -1.0}
+
+
+def test_envelope_uses_first_defined_alternative(designer_module):
+    factors = designer_module.parse_combination_formula('1.2*DL + 0.5*(R or S or Lr)', CASES)
+    assert factors == {'DL': 1.2, 'S': 0.5}
+
+
+def test_directional_alias_stays_symbolic(designer_module):
+    factors = designer_module.parse_combination_formula('0.9*DL + 1.0*W', CASES)
+    assert factors == {'DL': 0.9, 'W': 1.0}
+
+
+def test_load_case_named_like_alias_takes_precedence(designer_module):
+    combinations = {'U6': designer_module.parse_combination_formula('0.9*DL + 1.0*W', dict(CASES, W=1))}
+    assert designer_module.expand_directional_combinations(combinations, dict(CASES, W=1)) == {
+        'U6': {'DL': 0.9, 'W': 1.0}
+    }
+
+
+def test_directional_alias_expands_per_direction_and_sign(designer_module):
+    expanded = designer_module.expand_directional_combinations({'U6': {'DL': 0.9, 'W': 1.0}}, CASES)
+    assert expanded == {
+        'U6_+WINDX': {'DL': 0.9, 'WINDX': 1.0},
+        'U6_-WINDX': {'DL': 0.9, 'WINDX': -1.0},
+        'U6_+WINDY': {'DL': 0.9, 'WINDY': 1.0},
+        'U6_-WINDY': {'DL': 0.9, 'WINDY': -1.0},
+    }
+    # Never both orthogonal directions in one combination
+    assert all(not {'WINDX', 'WINDY'} <= set(factors) for factors in expanded.values())
+
+
+def test_alias_expands_only_to_defined_directions(designer_module):
+    cases = {'DL': 1, 'WINDX': 1}
+    expanded = designer_module.expand_directional_combinations({'S4': {'DL': 1.0, 'W': 0.6}}, cases)
+    assert expanded == {'S4_+WINDX': {'DL': 1.0, 'WINDX': 0.6}, 'S4_-WINDX': {'DL': 1.0, 'WINDX': -0.6}}
+
+
+def test_undefined_case_is_dropped_with_warning(designer_module, capsys):
+    factors = designer_module.parse_combination_formula('1.2*DL + 1.6*TURBINE_THRUST', CASES)
+    assert factors == {'DL': 1.2}
+    assert 'TURBINE_THRUST' in capsys.readouterr().out
+
+
+@pytest.mark.parametrize('formula', ['1.2*DL + f1*LL', '1.2*DL + 2x', '1.2*DL + 1..6*LL', '1.2*DL + 1.6*'])
+def test_unparseable_term_is_rejected(designer_module, formula):
+    with pytest.raises(ValueError):
+        designer_module.parse_combination_formula(formula, CASES)
@@ -0,0 +1,33 @@
+import contextlib
+import io
+
+import pytest
+
+
+def pedestal(pile_diameter):
+    """Mat, mezzanine and top slabs on four corner columns over a 3x3 pile group"""
+    size, mat_z, thick = 20.0, -4.6, 3.0
+    corners = [[0, 0], [size, 0], [size, size], [0, size]]
+    mat = [[x, y, mat_z, thick] for x, y in corners]
+    mezzanine = [[x, y, 15.0, 1.0] for x, y in corners]
+    top = [[x, y, 30.0, 1.0] for x, y in corners]
+    columns = [[x, y, mat_z + thick / 2, 30.0, 30, 30, 30] for x, y in corners]
+    piles = [[x, y, mat_z, mat_z - 20, pile_diameter] for x in (4, 10, 16) for y in (4, 10, 16)]
+    return mat, mezzanine, top, columns, piles, []
+
+
+def concrete_volume(module, pile_diameter):
+    engine = module.StructuralAnalysisEngine()
+    with contextlib.redirect_stdout(io.StringIO()):
+        nodes, elements = engine.generate_complete_mesh(*pedestal(pile_diameter), mesh_size=4.0)
+        return engine.concrete_volume(nodes, elements), engine.lumped_masses(nodes, elements).sum()
+
+
+def test_volume_grows_with_pile_diameter(designer_module):
+    small_volume, small_mass = concrete_volume(designer_module, 18.0)
+    large_volume, large_mass = concrete_volume(designer_module, 36.0)
+
+    # Nine 20 ft piles: Δ = 9 · π/4 · (3² - 1.5²) · 20 ft³
+    expected = 9 * 20 * 3.141592653589793 / 4 * (3.0 ** 2 - 1.5 ** 2)
+    assert large_volume - small_volume == pytest.approx(expected, rel=1e-9)
+    assert large_mass > small_mass
@@ -0,0 +1,72 @@
+import contextlib
+import io
+
+import numpy as np
+import pytest
+
+
+def top_node_loads(nodes):
+    top_z = max(node[2] for node in nodes)
+    tops = [i for i, node in enumerate(nodes) if abs(node[2] - top_z) < 0.1]
+    return {
+        'DL': [(i, 0, 0, -150000, 0, 0, 0) for i in tops],
+        'LL': [(i, 0, 0, -100000, 0, 0, 0) for i in tops],
+        'WINDX': [(i, 50000, 0, 0, 0, 0, 0) for i in tops],
+        'WINDY': [(i, 0, 30000, 0, 0, 0, 5000) for i in tops],
+    }
+
+
+def combined_loads(load_cases, factors):
+    """Load list of a combination summed node by node, for a direct solve"""
+    totals = {}
+    for case_name, factor in factors.items():
+        for node, *components in load_cases[case_name]:
+            total = totals.setdefault(node, np.zeros(6))
+            total += factor * np.asarray(components, dtype=float)
+    return [(node, *total) for node, total in totals.items()]
+
+
+@pytest.fixture(scope="module")
+def superposed_and_direct(designer_module, pedestal_mesh):
+    nodes, elements = pedestal_mesh
+    engine = designer_module.StructuralAnalysisEngine()
+    load_cases = top_node_loads(nodes)
+    combinations = {
+        'U2': {'DL': 1.2, 'LL': 1.6},
+        'U6': {'DL': 0.9, 'W': 1.0},
+        'U7': {'DL': 1.2, 'WINDX': -0.5, 'WINDY': 0.3},
+    }
+    with contextlib.redirect_stdout(io.StringIO()):
+        superposed = engine.analyze_load_combinations(nodes, elements, load_cases, combinations)
+        expanded = designer_module.expand_directional_combinations(combinations, load_cases)
+        direct = engine.calculate_static_forces(
+            nodes, elements, {combo_id: combined_loads(load_cases, factors) for combo_id, factors in expanded.items()}
+        )
+    return superposed, direct
+
+
+def test_every_expanded_combination_is_analyzed(superposed_and_direct):
+    superposed, direct = superposed_and_direct
+    assert set(superposed) == set(direct) == {'U2', 'U6_+WINDX', 'U6_-WINDX', 'U6_+WINDY', 'U6_-WINDY', 'U7'}
+
+
+@pytest.mark.parametrize('combo_id', ['U2', 'U6_-WINDX', 'U6_+WINDY', 'U7'])
+def test_superposition_matches_direct_solve(superposed_and_direct, combo_id):
+    superposed, direct = superposed_and_direct[0][combo_id], superposed_and_direct[1][combo_id]
+    
+    for key in ('displacements', 'reactions'):
+        scale = np.abs(direct[key]).max()
+        assert np.allclose(superposed[key], direct[key], rtol=1e-8, atol=1e-8 * scale)
+    
+    end_forces = direct['internal_forces']['end_forces']
+    assert np.allclose(superposed['internal_forces']['end_forces'], end_forces,
+                       rtol=1e-8, atol=1e-8 * np.abs(end_forces).max())
+
+
+def test_combination_of_undefined_cases_is_skipped(designer_module, pedestal_mesh):
+    nodes, elements = pedestal_mesh
+    engine = designer_module.StructuralAnalysisEngine()
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = engine.analyze_load_combinations(nodes, elements, top_node_loads(nodes),
+                                                   {'U2': {'DL': 1.2, 'LL': 1.6}, 'X': {'SNOW': 1.0}})
+    assert list(results) == ['U2']
@@ -0,0 +1,139 @@
+import contextlib
+import io
+
+import numpy as np
+import pytest
+
+
+def merge(designer_module, nodes, elements):
+    engine = designer_module.StructuralAnalysisEngine()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        mesh = engine._merge_coincident_nodes(designer_module.PedestalMesh.from_elements(nodes, elements))
+    return mesh, output.getvalue()
+
+
+def column(n1, n2):
+    return ('COLUMN', 'C1', n1, n2, 900.0, 67500.0, 67500.0, 67500.0, 30, 30)
+
+
+def link(n1, n2):
+    return ('LINK', 'link', n1, n2, 1e6, 144000.0, 144000.0, 144000.0, 0, 0)
+
+
+def shell(n1, n2, n3, n4):
+    return ['SHELL', 'mat', n1, n2, n3, n4, 0, 0, 0, 0, 3.0]
+
+
+def test_nodes_straddling_a_grid_cell_boundary_merge(designer_module):
+    nodes = [[1.00499, 0, 0], [1.00501, 0, 0], [1.00499, 0, 10]]
+    mesh, _ = merge(designer_module, nodes, [column(1, 2)])
+    
+    assert len(mesh.nodes) == 2
+    assert mesh.nodes[0].tolist() == [1.00499, 0, 0]
+    assert mesh[0][2:4] == (0, 1)
+
+
+def test_chain_of_close_nodes_does_not_merge_transitively(designer_module):
+    nodes = [[0, 0, 0], [0.008, 0, 0], [0.016, 0, 0], [0, 0, 10]]
+    mesh, _ = merge(designer_module, nodes, [column(2, 3)])
+    
+    # The middle node joins the first; the last is beyond the tolerance of the first and stays
+    assert mesh.nodes[:, 0].tolist() == [0, 0.016, 0]
+    assert mesh[0][2:4] == (1, 2)
+
+
+def test_node_joins_nearest_representative(designer_module):
+    nodes = [[0, 0, 0], [0.012, 0, 0], [0.007, 0, 0]]
+    mesh, _ = merge(designer_module, nodes, [])
+    assert mesh.nodes[:, 0].tolist() == [0, 0.012]
+
+
+def test_zero_length_links_are_removed(designer_module):
+    nodes = [[0, 0, 0], [0, 0, 0.001], [0, 0, 10]]
+    mesh, output = merge(designer_module, nodes, [link(0, 1), column(1, 2)])
+    
+    assert [elem[0] for elem in mesh] == ['COLUMN']
+    assert mesh[0][2:4] == (0, 1)
+    assert 'Merged 1 coincident nodes, removed 1 zero-length links' in output
+    assert 'Warning' not in output
+
+
+def test_collapsed_frame_is_dropped_with_warning(designer_module):
+    nodes = [[0, 0, 0], [0, 0, 0.005], [0, 0, 10]]
+    mesh, output = merge(designer_module, nodes, [column(0, 1), column(1, 2)])
+    
+    assert len(mesh) == 1
+    assert mesh[0][2:4] == (0, 1)
+    assert 'removed 1 zero-length COLUMN' in output
+
+
+def test_shells_are_renumbered_and_collapsed_ones_dropped(designer_module):
+    nodes = [[0, 0, 0], [4, 0, 0], [4, 4, 0], [0, 4, 0], [4.001, 0, 0], [4.001, 4, 0], [8, 0, 0], [8, 4, 0]]
+    elements = [shell(0, 1, 2, 3), shell(1, 4, 5, 2), shell(4, 6, 7, 5)]
+    mesh, output = merge(designer_module, nodes, elements)
+    
+    assert len(mesh.nodes) == 6
+    assert [elem[2:6] for elem in mesh] == [(0, 1, 2, 3), (1, 4, 5, 2)]
+    assert 'removed 1 collapsed SHELL' in output
+    # Elements that survive keep their order among the others
+    assert mesh.shells['index'].tolist() == [0, 1]
+
+
+def test_triangle_degenerate_shell_is_kept_and_reported(designer_module):
+    nodes = [[0, 0, 0], [4, 0, 0], [4, 4, 0], [4.002, 4, 0]]
+    mesh, output = merge(designer_module, nodes, [shell(0, 1, 2, 3)])
+    
+    assert len(mesh) == 1
+    assert mesh[0][2:6] == (0, 1, 2, 2)
+    assert '1 SHELL element(s) degenerate to triangles' in output
+
+
+def nearest_brute_force(coords, ids, point, radius, level_tolerance=None):
+    delta = np.asarray(coords) - point
+    if level_tolerance is None:
+        distances = np.linalg.norm(delta, axis=1)
+    else:
+        distances = np.linalg.norm(delta[:, :2], axis=1)
+        distances[np.abs(delta[:, 2]) >= level_tolerance] = np.inf
+    distances[distances >= radius] = np.inf
+    best = int(np.argmin(distances))
+    if not np.isfinite(distances[best]):
+        return -1, float('inf')
+    return int(ids[best]), float(distances[best])
+
+
+@pytest.mark.parametrize('plan', [False, True])
+def test_nearest_node_matches_brute_force(designer_module, plan):
+    rng = np.random.default_rng(7)
+    # Snapped to a 0.5 ft grid so that ties are common
+    coords = np.round(rng.uniform(0, 20, (400, 3)) * 2) / 2
+    coords[:, 2] = rng.choice([-4.6, 15.0, 30.0], len(coords))
+    ids = rng.permutation(1000)[:len(coords)]
+    engine = designer_module.StructuralAnalysisEngine()
+    index = engine._node_index(coords, ids, plan=plan)
+    level_tolerance = 0.5 if plan else None
+    
+    for point in np.column_stack([np.round(rng.uniform(-2, 22, (300, 2)) * 4) / 4,
+                                  rng.choice([-4.6, 15.0, 30.0, 7.0], 300)]):
+        for radius in (0.5, 1.5, 3.0):
+            assert engine._nearest_node(index, point, radius, level_tolerance) == \
+                nearest_brute_force(coords, ids, point, radius, level_tolerance)
+
+
+def test_nearest_node_radius_is_exclusive_and_ties_go_to_first(designer_module):
+    engine = designer_module.StructuralAnalysisEngine()
+    index = engine._node_index([[1, 0, 0], [-1, 0, 0], [0, 2, 0]], node_ids=[10, 11, 12])
+    
+    assert engine._nearest_node(index, [0, 0, 0], 1.0) == (-1, float('inf'))
+    assert engine._nearest_node(index, [0, 0, 0], 1.5) == (10, 1.0)
+
+
+def test_nearest_node_in_plan_ignores_other_levels(designer_module):
+    engine = designer_module.StructuralAnalysisEngine()
+    index = engine._node_index([[0, 0, 30.0], [0.5, 0, 15.0]], plan=True)
+    
+    assert engine._nearest_node(index, [0, 0, 15.0], 2.0, level_tolerance=0.5) == (1, 0.5)
+    assert engine._nearest_node(index, [0, 0, 30.2], 2.0, level_tolerance=0.5) == (0, 0.0)
+    assert engine._nearest_node(index, [0, 0, 22.0], 2.0, level_tolerance=0.5) == (-1, float('inf'))
+    assert engine._nearest_node(engine._node_index(np.empty((0, 3))), [0, 0, 0], 2.0) == (-1, float('inf'))
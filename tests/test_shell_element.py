@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+
+def assemble(kernel, coords, quads, thickness):
+    K = np.zeros((len(coords) * 6, len(coords) * 6))
+    ke = kernel(coords[quads], np.full(len(quads), thickness))
+    for quad, k in zip(quads, ke):
+        dofs = (np.asarray(quad)[:, None] * 6 + np.arange(6)).ravel()
+        K[np.ix_(dofs, dofs)] += k
+    return K
+
+
+def solve(K, F, fixed):
+    """Displacements with the fixed DOFs held at zero (and DOFs without stiffness dropped)"""
+    free = np.setdiff1d(np.flatnonzero(np.diag(K) > 0), fixed)
+    u = np.zeros(len(K))
+    u[free] = np.linalg.solve(K[np.ix_(free, free)], F[free])
+    return u
+
+
+def test_single_quad_has_only_rigid_body_and_drilling_zero_energy_modes(designer_module):
+    engine = designer_module.StructuralAnalysisEngine()
+    coords = np.array([[0, 0, 0], [4, 0.5, 0.2], [4.5, 3.5, 0.4], [-0.3, 4, 0.1]])
+    k = engine._shell_stiffness_batch(coords[None], [1.0])[0]
+    
+    eigenvalues = np.linalg.eigvalsh(k)
+    assert np.allclose(k, k.T, rtol=1e-10, atol=1e-10 * np.abs(k).max())
+    # Six rigid-body modes plus the four drilling rotations, which carry no stiffness
+    assert np.count_nonzero(eigenvalues < 1e-8 * eigenvalues.max()) == 10
+    assert eigenvalues.min() > -1e-8 * eigenvalues.max()
+
+
+def test_distorted_patch_reproduces_linear_membrane_field(designer_module):
+    engine = designer_module.StructuralAnalysisEngine()
+    # Four quads around one interior node, off-centre so that every element is distorted
+    coords = np.array([[0, 0, 0], [2, 0, 0], [4, 0, 0], [0, 2, 0], [2.4, 1.7, 0], [4, 2, 0],
+                       [0, 4, 0], [2, 4, 0], [4, 4, 0]], dtype=float)
+    quads = np.array([[0, 1, 4, 3], [1, 2, 5, 4], [3, 4, 7, 6], [4, 5, 8, 7]])
+    K = assemble(engine._shell_stiffness_batch, coords, quads, 1.0)
+    
+    # u = a + b x + c y, v = d + e x + f y imposed on the boundary nodes
+    x, y = coords[:, 0], coords[:, 1]
+    field = np.zeros((len(coords), 6))
+    field[:, 0] = 1e-3 + 2e-4 * x - 1e-4 * y
+    field[:, 1] = -5e-4 + 3e-4 * x + 1.5e-4 * y
+    field = field.ravel()
+    
+    boundary = np.setdiff1d(np.arange(len(coords)), [4])
+    prescribed = np.concatenate([(boundary[:, None] * 6 + np.arange(6)).ravel(), 4 * 6 + np.arange(2, 6)])
+    free = np.setdiff1d(np.arange(len(K)), prescribed)
+    u = field.copy()
+    u[free] = np.linalg.solve(K[np.ix_(free, free)], -K[np.ix_(free, prescribed)] @ field[prescribed])
+    
+    assert np.allclose(u[free], field[free], rtol=1e-9, atol=1e-12)
+    # Nodal forces of the interior node vanish: the element passes the patch test
+    residual = K @ u
+    assert np.allclose(residual[4 * 6:4 * 6 + 2], 0, atol=1e-9 * np.abs(residual).max())
+
+
+@pytest.fixture(scope="module")
+def cantilever(designer_module):
+    """20 ft long, 12 x 12 in cantilever: tip deflection under 1000 lb of the shell strip and the frame"""
+    engine = designer_module.StructuralAnalysisEngine()
+    length, load = 20, 1000.0
+    
+    n = 20
+    coords = np.array([[i * length / n, y, 0] for i in range(n + 1) for y in (0, 1)], dtype=float)
+    quads = np.array([[2 * i, 2 * i + 2, 2 * i + 3, 2 * i + 1] for i in range(n)])
+    K = assemble(engine._shell_stiffness_batch, coords, quads, 1.0)
+    F = np.zeros(len(K))
+    F[[6 * 2 * n + 2, 6 * (2 * n + 1) + 2]] = -load / 2
+    shell_tip = solve(K, F, np.arange(12))[6 * 2 * n + 2]
+    
+    I = 12 * 12**3 / 12
+    ke = engine._beam_stiffness_batch([144.0], [I], [I], [I], [length], [False])[0]
+    frame_tip = np.linalg.solve(ke[6:, 6:], np.array([0, 0, -load, 0, 0, 0]))[2]
+    
+    theory = -load * (length * 12)**3 / (3 * engine.E * I)
+    return shell_tip, frame_tip, theory
+
+
+def test_frame_cantilever_matches_beam_theory(cantilever):
+    _, frame_tip, theory = cantilever
+    assert frame_tip == pytest.approx(theory, rel=1e-9)
+
+
+def test_shell_cantilever_matches_beam_theory_and_frame(cantilever):
+    shell_tip, frame_tip, theory = cantilever
+    assert shell_tip == pytest.approx(theory, rel=0.02)
+    assert shell_tip == pytest.approx(frame_tip, rel=0.02)
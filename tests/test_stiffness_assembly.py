@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+
+def dense_stiffness(engine, nodes, elements):
+    """Element-by-element dense assembly with the single-element kernels"""
+    K = np.zeros((len(nodes) * 6, len(nodes) * 6))
+    frames = engine._frame_element_arrays(nodes, elements)
+    for i in range(len(frames['index'])):
+        ke = engine._beam_stiffness_matrix(frames['A'][i], frames['Ix'][i], frames['Iy'][i], frames['Iz'][i],
+                                           frames['L'][i], frames['type'][i])
+        dofs = np.concatenate([frames['n1'][i] * 6 + np.arange(6), frames['n2'][i] * 6 + np.arange(6)])
+        K[np.ix_(dofs, dofs)] += ke
+    
+    shells = engine._shell_element_arrays(nodes, elements)
+    for quad, coords, thickness in zip(shells['nodes'], shells['coords'], shells['thickness']):
+        ke = engine._shell_stiffness_matrix_quad(*coords, thickness)
+        dofs = (quad[:, None] * 6 + np.arange(6)).ravel()
+        K[np.ix_(dofs, dofs)] += ke
+    return K
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_sparse_assembly_matches_dense_reference(designer_module, pedestal_mesh, seed):
+    nodes, elements = pedestal_mesh
+    # Jittered coordinates, so no two quads share a cached element matrix by congruence
+    rng = np.random.default_rng(seed)
+    nodes = (np.asarray(nodes, dtype=float) + rng.uniform(-0.2, 0.2, (len(nodes), 3))).tolist()
+    engine = designer_module.StructuralAnalysisEngine()
+    
+    K = engine._assemble_stiffness_matrix(nodes, elements).toarray()
+    reference = dense_stiffness(designer_module.StructuralAnalysisEngine(), nodes, elements)
+    
+    assert np.allclose(K, reference, rtol=1e-10, atol=1e-9 * np.abs(reference).max())
+    assert np.allclose(K, K.T, rtol=1e-10, atol=1e-9 * np.abs(reference).max())
+
+
+def test_element_cache_reuses_matrices_of_congruent_quads(designer_module, pedestal_mesh):
+    nodes, elements = pedestal_mesh
+    engine = designer_module.StructuralAnalysisEngine()
+    
+    K = engine._assemble_stiffness_matrix(nodes, elements).toarray()
+    reference = dense_stiffness(designer_module.StructuralAnalysisEngine(), nodes, elements)
+    
+    assert np.allclose(K, reference, rtol=1e-10, atol=1e-9 * np.abs(reference).max())
+    assert len(engine.element_stiffness_cache) < len(elements)